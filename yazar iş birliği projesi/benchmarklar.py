@@ -0,0 +1,1306 @@
+"""Performans ölçümleri ve doğruluk karşılaştırmaları
+
+Kullanım:
+    python benchmarklar.py              # tüm ölçümler
+    python benchmarklar.py ingestion    # yalnızca seçilenler
+"""
+import copy
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from graf_olusturma import (
+    EXCEL_PATH, CollaborationGraph, read_dataset, build_graph_from_dataframe, build_graph_from_rows,
+    explode_coauthors, parse_authors, dedupe_papers,
+)
+from graf_onbellek import save_snapshot, load_snapshot, source_key, load_or_compute_layout
+from graf_analiz import (
+    function1_shortest_path, function2_queue_by_weight, function3_bst_creation,
+    function4_bst_delete, function5_shortest_paths_from_a,
+    function6_collaborator_count, function7_most_collaborative,
+    function8_longest_path, find_author_id, search_authors, author_orcid, list_authors, top_authors,
+)
+from graf_uzun_yol import EXACT, HEURISTIC
+from graf_uzamsal import GridIndex
+from graf_detay import DetailLevels
+from graf_yerlesim import initial_layout, refine_layout
+from graf_eslestirme import fold_name, resolve_name_variants
+from graf_agac import BST, BSTNode
+from graf_arama import AuthorSearchIndex
+from graf_kuyruk import QUEUE_KEYS, iter_collaborators, top_collaborators
+from graf_kimlik import same_person
+from graf_makaleler import paper_key
+from graf_merkezilik import CENTRALITY_METRICS, CentralityIndex, approximate_betweenness
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    """Fonksiyonu çalıştır; (sonuç, en iyi süre saniye) döndür"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def allocated_bytes(func, *args):
+    """Fonksiyonun çalışırken ayırdığı ve tuttuğu bellek (bayt); (sonuç, bayt)"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func(*args)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+def name_based_graph(df):
+    """ORCID sütunu olmadan (ad tabanlı kimliklerle) daha büyük bir graf oluştur"""
+    return build_graph_from_dataframe(df.drop(columns=['orcid'], errors='ignore'))
+
+def graph_snapshot(cg):
+    """İki grafın birebir aynı olup olmadığını karşılaştırmak için özet"""
+    G = cg.G
+    return (
+        list(G.nodes(data=True)),
+        sorted((u, v, d['weight'], tuple(cg.papers_between(u, v))) for u, v, d in G.edges(data=True)),
+        (cg.papers.titles, cg.papers.dois, cg.papers.paper_authors, cg.papers.author_papers),
+        cg.author_paper_counts,
+        cg.author_orcid_map,
+        cg.author_name_to_id,
+        cg.identity.orcid_to_node,
+    )
+
+
+def frozen_row_graph(df):
+    """İlk satır döngüsünün dondurulmuş kopyası (sütun bazlı yolun kahini)
+
+    Graf kodu değişse de bu fonksiyon değiştirilmez. Satırlar sırayla işlenir:
+    her yazar benzer adlı (normalize adı veya boşluksuz hali aynı) ilk kayıtlı
+    yazarın ID'sine (ilk görülen anahtar sözlükleri),
+    yoksa temizlenmiş adına eşlenir; makale sayıları ve her yazar çiftinin
+    kenar ağırlığı birer artırılır. Yalnızca ad tabanlı kimlikler içindir;
+    df dedupe_papers'tan geçmiş ORCID'siz satırlardır.
+    """
+    G = nx.Graph()
+    author_paper_counts, author_name_to_id, paper_authors = {}, {}, []
+    by_normalized, by_compact = {}, {}
+
+    for _, row in df.iterrows():
+        coauthors = parse_authors(row['coauthors'])
+        if not coauthors:
+            continue
+        author_ids = []
+        for author in coauthors:
+            clean_author = ' '.join(author.replace('.', '').replace(',', '').replace(';', '').replace(':', '').split())
+            normalized = clean_author.strip().lower()
+            author_id = by_normalized.get(normalized)
+            if author_id is None:
+                author_id = by_compact.get(normalized.replace(' ', ''), clean_author)
+            if author_id not in author_name_to_id:
+                author_name_to_id[author_id] = author
+                G.add_node(author_id, name=author)
+                key = author.strip().lower()
+                by_normalized.setdefault(key, author_id)
+                by_compact.setdefault(key.replace(' ', ''), author_id)
+            author_ids.append(author_id)
+            author_paper_counts[author] = author_paper_counts.get(author, 0) + 1
+        paper_authors.append(author_ids)
+
+        for i in range(len(author_ids)):
+            for j in range(i + 1, len(author_ids)):
+                if not G.has_edge(author_ids[i], author_ids[j]):
+                    G.add_edge(author_ids[i], author_ids[j], weight=1)
+                else:
+                    G[author_ids[i]][author_ids[j]]["weight"] += 1
+
+    return ingestion_result(G, author_paper_counts, author_name_to_id, paper_authors)
+
+
+def ingestion_result(G, author_paper_counts, author_name_to_id, paper_authors):
+    """Düğüm ve komşuluk sıraları dahil yükleme sonucunun özeti"""
+    return (
+        list(G.nodes(data=True)),
+        [[(v, d['weight']) for v, d in G.adj[u].items()] for u in G],
+        author_paper_counts,
+        author_name_to_id,
+        paper_authors,
+    )
+
+
+def graph_ingestion_result(cg):
+    live = [ids for p, ids in enumerate(cg.papers.paper_authors) if p not in cg.papers.removed]
+    return ingestion_result(cg.G, cg.author_paper_counts, cg.author_name_to_id, live)
+
+
+def bench_ingestion(df):
+    """Sütun bazlı yüklemeyi satır yolu ve dondurulmuş satır döngüsüyle karşılaştır"""
+    # ORCID'siz kopya ad tabanlı kimlik çözümlemesini de sınar
+    variants = [("ORCID ile", df), ("ORCID olmadan", df.drop(columns=['orcid'], errors='ignore'))]
+    for label, frame in variants:
+        rows_cg, rows_time = timed(build_graph_from_rows, frame, repeat=3)
+        cols_cg, cols_time = timed(build_graph_from_dataframe, frame, repeat=3)
+        same = (graph_snapshot(rows_cg) == graph_snapshot(cols_cg)
+                and graph_ingestion_result(rows_cg) == graph_ingestion_result(cols_cg))
+        print(f"[{label}] satır: {rows_time*1000:.1f} ms, sütun: {cols_time*1000:.1f} ms, "
+              f"düğüm: {cols_cg.G.number_of_nodes()}, kenar: {cols_cg.G.number_of_edges()}, aynı: {same}")
+        if not same:
+            raise AssertionError(f"Sütun bazlı yükleme farklı graf üretti ({label})")
+
+    # Dondurulmuş döngü ORCID'leri bilmez; ad tabanlı graf onunla karşılaştırılır
+    frozen, frozen_time = timed(frozen_row_graph, dedupe_papers(frame))
+    same = frozen == graph_ingestion_result(cols_cg)
+    print(f"[dondurulmuş satır döngüsü] {frozen_time*1000:.1f} ms, aynı: {same}")
+    if not same:
+        raise AssertionError("Sütun bazlı yükleme dondurulmuş satır döngüsünden farklı")
+
+    # Tekrarlanan yazar (öz döngü), tek yazarlı makale ve artımlı ekleme
+    edge_cases = pd.DataFrame({
+        'paper_title': [f"Edge case {i}" for i in range(5)],
+        'doi': [f"10.0000/edge.{i}" for i in range(5)],
+        'coauthors': ["['A. Yilmaz', 'B. Kaya', 'A. Yilmaz']", "['C. Demir']", "A Yilmaz; B Kaya & C Demir",
+                      "['b. kaya', 'AYilmaz', 'D. Sahin']", None],
+    })
+    expected = frozen_row_graph(edge_cases)
+    cg = build_graph_from_dataframe(edge_cases)
+    incremental = build_graph_from_dataframe(edge_cases.iloc[:2])
+    incremental.add_papers(edge_cases.iloc[2:])
+    if not expected == graph_ingestion_result(cg) == graph_ingestion_result(incremental):
+        raise AssertionError("Sütun bazlı yükleme uç durumlarda dondurulmuş satır döngüsünden farklı")
+
+
+def bench_snapshot(df):
+    """Excel okuma + graf oluşturma ile anlık görüntüden yüklemeyi karşılaştır"""
+    def from_excel():
+        return build_graph_from_dataframe(read_dataset(EXCEL_PATH))
+
+    cg, excel_time = timed(from_excel, repeat=3)
+    snapshot_dir = tempfile.mkdtemp(prefix="graf-snapshot-")
+    try:
+        _, save_time = timed(save_snapshot, cg, snapshot_dir, source_key(EXCEL_PATH))
+        loaded, load_time = timed(load_snapshot, snapshot_dir, repeat=3)
+        size = sum(os.path.getsize(os.path.join(snapshot_dir, f)) for f in os.listdir(snapshot_dir))
+    finally:
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+    same = graph_snapshot(cg) == graph_snapshot(loaded)
+    print(f"Excel + oluşturma: {excel_time*1000:.1f} ms, kaydetme: {save_time*1000:.1f} ms, "
+          f"yükleme: {load_time*1000:.1f} ms, boyut: {size/1024:.1f} KB, aynı: {same}")
+    if not same:
+        raise AssertionError("Anlık görüntüden yüklenen graf farklı")
+
+    # Ad varyantı birleştirme raporu da anlık görüntüden geri yüklenmeli
+    resolved = build_graph_from_dataframe(df.drop(columns=['orcid'], errors='ignore'), resolve_names=True)
+    snapshot_dir = tempfile.mkdtemp(prefix="graf-snapshot-")
+    try:
+        save_snapshot(resolved, snapshot_dir, source_key(EXCEL_PATH))
+        loaded = load_snapshot(snapshot_dir)
+    finally:
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+    print(f"Ad birleştirme raporu: {len(loaded.name_merges)} grup geri yüklendi")
+    if loaded.name_merges != resolved.name_merges or not loaded.resolve_names:
+        raise AssertionError("Anlık görüntüden yüklenen ad birleştirme raporu farklı")
+
+
+def synthetic_removal_rows(n_authors, removed_authors=50, seed=0):
+    """İlk makalesi silinecek büyük yapay makale tablosu
+
+    İlk makalenin yazarları yalnızca o makalede bulunur; silme her birinin
+    düğümünü ve ad anahtarlarını kaldırır. Yükleme büyük/küçük harf ve
+    noktalama farkı olan yazılışları aynı ID'ye eşlediği için bir anahtarı
+    paylaşan ayrı ID'ler oluşmaz; silinen yazarların varyantları da
+    kullanılmaz (makalesi kalan düğüm ilk görülen adını korur, bkz.
+    CollaborationGraph.remove_paper).
+    """
+    rng = random.Random(seed)
+    removed = [f"Silinen{i}. Yazar" for i in range(removed_authors)]
+    pool = [f"Yazar{i}. Soyad{i % 997}" for i in range(n_authors)]
+    rows = [{'doi': "10.0000/removed.0", 'paper_title': "Removed paper", 'coauthors': "; ".join(removed)}]
+    for p in range(n_authors // 2):
+        rows.append({'doi': f"10.0000/synthetic.{p}", 'paper_title': f"Synthetic paper {p}",
+                     'coauthors': "; ".join(rng.sample(pool, 4))})
+    # Her yazar en az bir makalede bulunur
+    for p in range(0, n_authors, 4):
+        rows.append({'doi': f"10.0000/cover.{p}", 'paper_title': f"Cover paper {p}",
+                     'coauthors': "; ".join(pool[p:p + 4])})
+    return pd.DataFrame(rows)
+
+
+def removal_result(cg):
+    """Silme sonrası karşılaştırma: yükleme özeti ve ad indeksi"""
+    return graph_ingestion_result(cg), cg.name_index.by_normalized, cg.name_index.by_compact
+
+
+def bench_incremental(df):
+    """Son makaleleri mevcut grafa eklemeyi tüm grafı yeniden oluşturmakla karşılaştır"""
+    frame = df.drop(columns=['orcid'], errors='ignore')
+    for count in (1, 20, 100):
+        head, tail = frame.iloc[:-count], frame.iloc[-count:]
+        cg = build_graph_from_dataframe(head)
+        _, add_time = timed(cg.add_papers, tail)
+        rebuilt, rebuild_time = timed(build_graph_from_dataframe, frame)
+        same = graph_snapshot(cg) == graph_snapshot(rebuilt)
+        _, remove_time = timed(cg.remove_paper, tail['doi'].iloc[-1])
+        print(f"{count} makale: ekleme {add_time*1000:.1f} ms, yeniden oluşturma {rebuild_time*1000:.1f} ms, "
+              f"silme {remove_time*1000:.2f} ms, aynı: {same}")
+        if not same:
+            raise AssertionError("Artımlı ekleme farklı graf üretti")
+
+    # Silme DOI'yi tekilleştirmedeki gibi eşler (önekli veya büyük harfli yazılış)
+    with_doi = frame[frame['doi'].notna()]
+    for variant in ("https://doi.org/{}", "{}"):
+        cg = build_graph_from_dataframe(with_doi)
+        doi = cg.papers.dois[-1]
+        key = paper_key(cg.papers.titles[-1], doi)
+        removed = cg.remove_paper(variant.format(str(doi).strip()).upper())
+        rebuilt = build_graph_from_dataframe(
+            with_doi[[paper_key(t, d) != key for t, d in zip(with_doi['paper_title'], with_doi['doi'])]])
+        if not removed or removal_result(cg) != removal_result(rebuilt):
+            raise AssertionError(f"Önekli/büyük harfli DOI ile silme yeniden oluşturmadan farklı ({variant})")
+
+    # Büyük grafta yazarları (ve ad anahtarlarını) boşaltan makale silme
+    rows = synthetic_removal_rows(200000)
+    cg = build_graph_from_dataframe(rows)
+    _, remove_time = timed(cg.remove_paper, rows['doi'].iloc[0])
+    rebuilt, rebuild_time = timed(build_graph_from_dataframe, rows.iloc[1:])
+    same = removal_result(cg) == removal_result(rebuilt)
+    print(f"{cg.G.number_of_nodes()} düğüm: 50 yazarlı makaleyi silme {remove_time*1000:.1f} ms, "
+          f"yeniden oluşturma {rebuild_time*1000:.0f} ms, aynı: {same}")
+    if not same:
+        raise AssertionError("Büyük grafta artımlı silme farklı graf üretti")
+    if remove_time > rebuild_time:
+        raise AssertionError("Büyük grafta artımlı silme yeniden oluşturmadan yavaş")
+
+
+def enable_main_indexes(cg):
+    """main()'in etkinleştirdiği türetilmiş yapılar"""
+    cg.enable_distance_oracle()
+    cg.enable_search_index()
+    cg.enable_collaborator_ranking()
+    cg.enable_centrality()
+
+
+def derived_results(cg, queries, pairs):
+    """Türetilmiş yapıları kullanan sorguların sonuçları (karşılaştırma için)"""
+    G = cg.G
+    return (
+        [search_authors(cg, q) for q in queries],
+        [find_author_id(cg, q) for q in queries],
+        [cg.search_index.search(q, limit=20) for q in queries],
+        [top_collaborators(cg, n, key=key) for n in G for key in QUEUE_KEYS],
+        [function1_shortest_path(cg, a, b) for a, b in pairs if a in G and b in G],
+        [top_authors(cg, metric, 10) for metric in CENTRALITY_METRICS],
+        len(cg.search_index),
+    )
+
+
+def bench_derived_update(df):
+    """main()'in indeksleri etkinken makale ekleme/silme ve ilk sorgu süreleri
+
+    Artımlı güncellenen yapıların sorgu sonuçları aynı grafta sıfırdan
+    oluşturulanlarla karşılaştırılır.
+    """
+    rng = random.Random(5)
+    for count in (1, 20, 100):
+        head, tail = df.iloc[:-count], df.iloc[-count:]
+        cg = build_graph_from_dataframe(head)
+        enable_main_indexes(cg)
+        _, add_time = timed(cg.add_papers, tail)
+        # Eski davranış: her değişiklikte tüm etkin yapılar yeniden oluşturulurdu
+        _, rebuild_time = timed(enable_main_indexes, copy.copy(cg))
+        nodes = list(cg.G.nodes())
+        pairs = [tuple(rng.sample(nodes, 2)) for _ in range(20)]
+        _, first_query = timed(function1_shortest_path, cg, *pairs[0])
+        _, remove_time = timed(cg.remove_paper, tail['doi'].iloc[-1])
+        names = [cg.G.nodes[n]['name'] for n in cg.G.nodes()]
+        queries = keystrokes(names, 5, seed=count) + names[-20:]
+        reference = copy.copy(cg)
+        enable_main_indexes(reference)
+        same = derived_results(cg, queries, pairs) == derived_results(reference, queries, pairs)
+        print(f"{count} makale: ekleme {add_time*1000:.1f} ms (yapıları yeniden oluşturma {rebuild_time*1000:.1f} ms), "
+              f"sonraki ilk en kısa yol {first_query*1000:.1f} ms, silme {remove_time*1000:.2f} ms, aynı: {same}")
+        if not same:
+            raise AssertionError("Artımlı güncellenen türetilmiş yapılar farklı sonuç verdi")
+
+    # Ard arda silme ve yeniden ekleme: silinen yazarlar geri eklenince graf sırasında sona geçer
+    cg = build_graph_from_dataframe(df)
+    enable_main_indexes(cg)
+    removed = df[df['doi'].isin(rng.sample(sorted(df['doi'].dropna().unique()), 30))]
+    for step in ("silme", "yeniden ekleme"):
+        if step == "silme":
+            for doi in removed['doi']:
+                cg.remove_paper(doi)
+        else:
+            cg.add_papers(removed)
+        names = [cg.G.nodes[n]['name'] for n in cg.G.nodes()]
+        queries = keystrokes(names, 5, seed=1) + names[::25]
+        pairs = [tuple(rng.sample(list(cg.G.nodes()), 2)) for _ in range(20)]
+        reference = copy.copy(cg)
+        enable_main_indexes(reference)
+        if derived_results(cg, queries, pairs) != derived_results(reference, queries, pairs):
+            raise AssertionError(f"30 makalede {step} sonrası türetilmiş yapılar farklı")
+
+    # Büyük yazar kümesinde arama indeksinin güncellenmesi
+    big = synthetic_author_table(cg, 100000)
+    big.enable_search_index()
+    big.enable_collaborator_ranking()
+    _, add_time = timed(big.add_papers, df.iloc[:20])
+    fresh, rebuild_time = timed(AuthorSearchIndex, big)
+    queries = keystrokes([big.G.nodes[n]['name'] for n in big.G.nodes()], 20, seed=2)
+    _, search_time = timed(lambda: [big.search_index.search(q, limit=20) for q in queries])
+    if [big.search_index.matches(q) for q in queries] != [fresh.matches(q) for q in queries]:
+        raise AssertionError("Büyük yazar kümesinde güncellenen arama indeksi farklı sonuç verdi")
+    print(f"100000 yazar: 20 makale ekleme {add_time*1000:.1f} ms (arama indeksini yeniden oluşturma "
+          f"{rebuild_time*1000:.0f} ms), ilk 20 sonuç {search_time/len(queries)*1000:.3f} ms / tuş")
+
+    # Büyük grafta yazarları boşaltan makale silme; indeksler yerinde güncellenir
+    rows = synthetic_removal_rows(200000, seed=1)
+    big = build_graph_from_dataframe(rows)
+    big.enable_search_index()
+    big.enable_collaborator_ranking()
+    big.enable_csr()
+    _, remove_time = timed(big.remove_paper, rows['doi'].iloc[0])
+    reference, rebuild_time = timed(build_graph_from_dataframe, rows.iloc[1:])
+    reference.enable_search_index()
+    reference.enable_collaborator_ranking()
+    names = [big.G.nodes[n]['name'] for n in big.G.nodes()]
+    queries = keystrokes(names, 20, seed=3) + ["silinen", "SILINEN1. YAZAR"]
+    nodes = rng.sample(list(big.G.nodes()), 200)
+    same = (removal_result(big) == removal_result(reference)
+            and [big.search_index.matches(q) for q in queries] == [reference.search_index.matches(q) for q in queries]
+            and [top_collaborators(big, n, key=key) for n in nodes for key in QUEUE_KEYS]
+            == [top_collaborators(reference, n, key=key) for n in nodes for key in QUEUE_KEYS])
+    print(f"{big.G.number_of_nodes()} düğüm: 50 yazarlı makaleyi silme {remove_time*1000:.1f} ms "
+          f"(yeniden oluşturma {rebuild_time*1000:.0f} ms), aynı: {same}")
+    if not same:
+        raise AssertionError("Büyük grafta silme sonrası türetilmiş yapılar farklı")
+    if remove_time > rebuild_time:
+        raise AssertionError("Büyük grafta artımlı silme yeniden oluşturmadan yavaş")
+
+
+def recursive_dfs_path(G, author_id):
+    """Eski function8: özyinelemeli, ortak visited kümeli DFS (karşılaştırma için)"""
+    def dfs_longest_path(node, visited, path):
+        visited.add(node)
+        path.append(node)
+        max_path = path[:]
+        for neighbor in G.neighbors(node):
+            if neighbor not in visited:
+                new_path = dfs_longest_path(neighbor, visited, path[:])
+                if len(new_path) > len(max_path):
+                    max_path = new_path
+        return max_path
+    return dfs_longest_path(author_id, set(), [])
+
+def bench_longest_path(df):
+    """Bütçeli en uzun yol aramasını eski özyinelemeli DFS ile karşılaştır"""
+    for label, cg in (("ORCID ile", build_graph_from_dataframe(df)), ("ORCID olmadan", name_based_graph(df))):
+        G = cg.G
+        sources = random.Random(7).sample(list(G.nodes()), 10)
+        try:
+            old = [len(recursive_dfs_path(G, s)) - 1 for s in sources]
+            old_text = f"ortalama uzunluk {sum(old) / len(old):.1f}"
+        except RecursionError:
+            old_text = "RecursionError"
+        print(f"[{label}] eski DFS: {old_text}")
+        for mode in (EXACT, HEURISTIC):
+            results, elapsed = timed(lambda: [function8_longest_path(cg, s, mode=mode, time_limit=0.5) for s in sources])
+            for s, (path, _) in zip(sources, results):
+                if path[0] != s or len(set(path)) != len(path) or not all(G.has_edge(a, b) for a, b in zip(path, path[1:])):
+                    raise AssertionError("Geçersiz yol")
+            lengths = [len(path) - 1 for path, _ in results]
+            proven = sum(optimal for _, optimal in results)
+            print(f"[{label}] {mode}: ortalama uzunluk {sum(lengths) / len(lengths):.1f}, "
+                  f"kanıtlanmış optimal {proven}/{len(results)}, {elapsed / len(results) * 1000:.0f} ms / sorgu")
+
+
+def path_cost(G, path):
+    return None if path is None else sum(G[a][b]['weight'] for a, b in zip(path, path[1:]))
+
+def bench_distance_oracle(df):
+    """Mesafe kahini ile networkx/CSR en kısa yol sorgu sürelerini karşılaştır"""
+    cg = name_based_graph(df)
+    G = cg.G
+    rng = random.Random(3)
+    nodes = list(G.nodes())
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(1000)]
+
+    def run(graph, pairs):
+        return [function1_shortest_path(graph, a, b) for a, b in pairs]
+
+    backends = {}
+    plain = copy.copy(cg)
+    backends["networkx"] = plain
+    with_csr = copy.copy(cg)
+    _, csr_build = timed(with_csr.enable_csr)
+    backends["CSR"] = with_csr
+    with_oracle = copy.copy(cg)
+    oracle, oracle_build = timed(with_oracle.enable_distance_oracle)
+    backends["kahin"] = with_oracle
+    print(f"CSR oluşturma: {csr_build*1000:.0f} ms, kahin oluşturma: {oracle_build*1000:.0f} ms "
+          f"({len(oracle.component_sizes)} bileşen, {sum(len(l) for l in oracle.landmarks.values())} işaret düğümü)")
+
+    # Ulaşılabilir ve farklı bileşendeki çiftler ayrı ölçülür
+    groups = {
+        "ulaşılabilir": [(a, b) for a, b in pairs if oracle.connected(a, b)],
+        "farklı bileşen": [(a, b) for a, b in pairs if not oracle.connected(a, b)],
+    }
+    for group, group_pairs in groups.items():
+        reference = None
+        for name, graph in backends.items():
+            paths, elapsed = timed(run, graph, group_pairs)
+            costs = [path_cost(G, p) for p in paths]
+            print(f"[{group}, {len(group_pairs)} çift] {name}: {elapsed / len(group_pairs) * 1000:.3f} ms / sorgu")
+            if reference is None:
+                reference = costs
+            elif costs != reference:
+                raise AssertionError(f"{name} farklı uzunlukta yollar döndürdü")
+
+
+def bench_csr(df):
+    """networkx ve CSR motorunun kenar başına bellek ve sorgu sürelerini karşılaştır"""
+    cg = name_based_graph(df)
+    nodes = list(cg.G.nodes())
+    edges = cg.G.number_of_edges()
+
+    # Makale deposu iki motorda da paylaşılır; ölçülen komşuluk yapısının maliyetidir
+    _, nx_bytes = allocated_bytes(copy.deepcopy, cg.G)
+    csr, csr_bytes = allocated_bytes(cg.enable_csr)
+    print(f"Düğüm: {len(nodes)}, kenar: {edges}")
+    print(f"Bellek / kenar: networkx {nx_bytes/edges:.0f} B, CSR {csr_bytes/edges:.0f} B "
+          f"(CSR dizileri {csr.nbytes()/edges:.0f} B)")
+
+    rng = random.Random(42)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(200)]
+    sources = [rng.choice(nodes) for _ in range(50)]
+    queries = [
+        ("function1_shortest_path", lambda g: [function1_shortest_path(g, a, b) for a, b in pairs], len(pairs)),
+        ("function5_shortest_paths_from_a", lambda g: [function5_shortest_paths_from_a(g, a).paths() for a in sources], len(sources)),
+        ("function6_collaborator_count", lambda g: [function6_collaborator_count(g, a) for a in sources], len(sources)),
+        ("function7_most_collaborative", lambda g: function7_most_collaborative(g), 1),
+    ]
+    plain = copy.copy(cg)
+    plain.csr = None
+    for name, run, n in queries:
+        nx_result, nx_time = timed(run, plain, repeat=3)
+        csr_result, csr_time = timed(run, cg, repeat=3)
+        print(f"{name}: networkx {nx_time/n*1000:.3f} ms, CSR {csr_time/n*1000:.3f} ms / sorgu, "
+              f"aynı sonuç: {nx_result == csr_result}")
+        if nx_result != csr_result:
+            raise AssertionError(f"CSR motoru farklı sonuç üretti ({name})")
+
+
+def linear_nearest(pos, x, y, radius):
+    """Eski on_click: tüm düğümleri gezerek en yakın düğümü bul"""
+    min_dist = float('inf')
+    closest_node = None
+    for node, (nx_, ny_) in pos.items():
+        dist = (nx_ - x) ** 2 + (ny_ - y) ** 2
+        if dist < min_dist:
+            min_dist = dist
+            closest_node = node
+    return closest_node if min_dist <= radius ** 2 else None
+
+
+def bench_node_lookup(df):
+    """Tıklama için ızgara indeksini tüm düğümleri gezen döngüyle karşılaştır"""
+    cg = name_based_graph(df)
+    rng = random.Random(5)
+    pos = {node: (rng.uniform(-1, 1), rng.uniform(-1, 1)) for node in cg.G.nodes()}
+    # Daha büyük graflar için yapay konumlar eklenir
+    for i in range(50000 - len(pos)):
+        pos[f"yapay-{i}"] = (rng.uniform(-1, 1), rng.uniform(-1, 1))
+    keys = list(pos)
+    index, build = timed(GridIndex, keys, [pos[k] for k in keys])
+    print(f"Düğüm: {len(keys)}, indeks oluşturma: {build*1000:.1f} ms")
+
+    radius = 0.01
+    clicks = [(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(200)]
+    grid, grid_time = timed(lambda: [index.nearest(x, y, radius) for x, y in clicks], repeat=3)
+    linear, linear_time = timed(lambda: [linear_nearest(pos, x, y, radius) for x, y in clicks])
+    print(f"Tıklama başına: döngü {linear_time/len(clicks)*1000:.2f} ms, "
+          f"ızgara {grid_time/len(clicks)*1000:.3f} ms, aynı sonuç: {grid == linear}")
+    if grid != linear:
+        raise AssertionError("Izgara indeksi farklı düğüm buldu")
+
+
+def zoom_sequence(center, steps=12, factor=1.25):
+    """Merkeze doğru yakınlaşıp geri uzaklaşan (xlim, ylim) dizisi"""
+    cx, cy = center
+    halves = [factor ** -i for i in range(steps + 1)]
+    halves += halves[-2::-1]
+    return [((cx - h, cx + h), (cy - h, cy + h)) for h in halves]
+
+
+def bench_rendering(df):
+    """Zoom dizisinde tam çizim ile ayrıntı düzeyli çizimin kare sürelerini karşılaştır"""
+    # Çizim pencere açmadan Agg tuvali üzerinde ölçülür
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+
+    cg = name_based_graph(df)
+    G = cg.G
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    # spring_layout büyük graflarda scipy gerektirir; ölçüm için rastgele yerleşim yeterli
+    coords = np.random.default_rng(7).uniform(-1, 1, (len(nodes), 2))
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64)
+    weights = [G[u][v]['weight'] for u, v in G.edges()]
+    sizes = np.array([200 + cg.paper_count(n) * 50 + G.degree(n) * 20 for n in nodes], dtype=float)
+    average = np.mean([cg.paper_count(n) for n in nodes])
+    label_nodes = [i for i, n in enumerate(nodes) if cg.paper_count(n) > average * 0.5]
+    detail = DetailLevels(coords, edges, weights, sizes, label_nodes)
+    print(f"Düğüm: {len(nodes)}, kenar: {len(edges)}, etiket adayı: {len(label_nodes)}")
+
+    def frame_times(lod):
+        fig = Figure(figsize=(16, 12))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        ax.axis('off')
+        segments = coords[edges]
+        lines = LineCollection(segments, colors="#666666", alpha=0.6, linewidths=1.0)
+        ax.add_collection(lines, autolim=False)
+        points = ax.scatter(coords[:, 0], coords[:, 1], s=sizes, c="#66CDAA", edgecolors="#000000")
+        labels = {i: ax.text(coords[i, 0], coords[i, 1], nodes[i], fontsize=9, ha='center', va='center',
+                             bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8, edgecolor='none'))
+                  for i in label_nodes}
+        times, drawn = [], []
+        for xlim, ylim in zoom_sequence((0.3, 0.2)):
+            start = time.perf_counter()
+            ax.set_xlim(xlim)
+            ax.set_ylim(ylim)
+            if lod:
+                visible = detail.visible_edges(xlim, ylim)
+                lines.set_segments(segments[visible])
+                shown_nodes = detail.visible_nodes(xlim, ylim)
+                points.set_offsets(coords[shown_nodes])
+                points.set_sizes(sizes[shown_nodes])
+                shown = set(detail.visible_labels(xlim, ylim).tolist())
+                for i, text in labels.items():
+                    text.set_visible(i in shown)
+                drawn.append(len(visible))
+            canvas.draw()
+            times.append(time.perf_counter() - start)
+        return times, drawn
+
+    for name, lod in (("tam çizim", False), ("ayrıntı düzeyi", True)):
+        times, drawn = frame_times(lod)
+        ms = np.array(times) * 1000
+        print(f"{name}: {len(ms)} kare, ortalama {ms.mean():.0f} ms, en kötü {ms.max():.0f} ms"
+              + (f", çizilen kenar en fazla {max(drawn)}" if drawn else ""))
+        if drawn and max(drawn) > detail.max_edges:
+            raise AssertionError("Ayrıntı düzeyi kenar sınırını aştı")
+
+
+def synthetic_collaboration_graph(n, seed=0, community_size=20, papers_per_author=1.0):
+    """Topluluklu yapay ortak yazarlık grafı
+
+    Her makalenin 2-4 yazarı çoğunlukla aynı topluluktan, %10 olasılıkla
+    rastgele seçilir; kenar ağırlığı ortak makale sayısıdır.
+    """
+    rng = np.random.default_rng(seed)
+    papers = int(n * papers_per_author)
+    sizes = rng.integers(2, 5, papers)
+    community = np.repeat(rng.integers(0, max(n // community_size, 1), papers), sizes)
+    authors = np.minimum(community * community_size + rng.integers(0, community_size, len(community)), n - 1)
+    far = rng.random(len(authors)) < 0.1
+    authors[far] = rng.integers(0, n, int(far.sum()))
+    ends = np.cumsum(sizes)
+    weights = {}
+    for start, end in zip((ends - sizes).tolist(), ends.tolist()):
+        ids = authors[start:end].tolist()
+        for i in range(len(ids)):
+            for j in range(i + 1, len(ids)):
+                if ids[i] != ids[j]:
+                    key = (min(ids[i], ids[j]), max(ids[i], ids[j]))
+                    weights[key] = weights.get(key, 0) + 1
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_weighted_edges_from((u, v, w) for (u, v), w in weights.items())
+    return G
+
+
+def layout_stress(G, pos, sources=30, seed=0):
+    """Örneklenen kaynaklardan (ölçek düzeltilmiş) normalize gerilim (stress)
+
+    Graf mesafesi d ve çizim mesafesi D için sum((s*D - d)^2 / d^2) / çift
+    sayısı; s en uygun ölçektir. Düşük değer, çizimin graf mesafelerini daha
+    iyi koruduğunu gösterir.
+    """
+    rng = random.Random(seed)
+    nodes = list(G.nodes())
+    coords = np.array([pos[node] for node in nodes], dtype=float)
+    index = {node: i for i, node in enumerate(nodes)}
+    drawn, graph = [], []
+    for source in rng.sample(nodes, min(sources, len(nodes))):
+        lengths = nx.single_source_shortest_path_length(G, source)
+        targets = np.array([index[t] for t, d in lengths.items() if d > 0], dtype=np.int64)
+        if len(targets) == 0:
+            continue
+        drawn.append(np.sqrt(((coords[targets] - coords[index[source]]) ** 2).sum(axis=1)))
+        graph.append(np.array([d for d in lengths.values() if d > 0], dtype=float))
+    if not drawn:
+        return 0.0
+    D, d = np.concatenate(drawn), np.concatenate(graph)
+    w = d ** -2
+    scale = (w * D * d).sum() / max((w * D * D).sum(), 1e-12)
+    return float((w * (scale * D - d) ** 2).sum() / len(d))
+
+
+def bench_layout(df):
+    """Yerleşim motorlarının süre ve gerilim değerleri; önbellekten yükleme süresi"""
+    for n in (1000, 10000, 100000):
+        G = synthetic_collaboration_graph(n, seed=n)
+        print(f"{n} düğüm, {G.number_of_edges()} kenar, {nx.number_connected_components(G)} bileşen")
+        for engine in ("multilevel", "spring"):
+            try:
+                pos, elapsed = timed(initial_layout, G, engine=engine)
+            except ImportError as e:
+                # spring_layout 500 düğümden büyük graflarda scipy gerektirir
+                print(f"  {engine}: atlandı ({e})")
+                continue
+            print(f"  {engine}: {elapsed:.2f} s, gerilim {layout_stress(G, pos):.4f}")
+
+    # Artımlı güncelleme: merkez yazara bağlanan yeni yazar; gevşetilen alt
+    # graf 500 düğümü aşar (spring_layout burada scipy isterdi)
+    H = nx.barabasi_albert_graph(5000, 2, seed=1)
+    pos = initial_layout(H)
+    hub = max(H, key=H.degree)
+    H.add_edge(hub, 'yeni')
+    relaxed = set(H[hub]) | {hub}
+    pinned = {n for node in relaxed for n in H[node]} - relaxed
+    refined, elapsed = timed(refine_layout, H, pos, {hub, 'yeni'})
+    if len(relaxed | pinned) <= 500:
+        raise AssertionError("Artımlı yerleşim alt grafı beklenenden küçük")
+    if set(refined) != set(H) or not all(np.isfinite(p).all() for p in refined.values()):
+        raise AssertionError("Artımlı yerleşim eksik veya geçersiz konum üretti")
+    if any(not np.array_equal(refined[n], pos[n]) for n in pinned):
+        raise AssertionError("Artımlı yerleşim sabit düğümleri taşıdı")
+    print(f"Artımlı yerleşim: {len(relaxed)} gevşetilen + {len(pinned)} sabit düğüm, {elapsed*1000:.0f} ms")
+
+    # Önbellekteki yerleşim ikinci açılışta hesaplanmadan okunur
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        _, first = timed(load_or_compute_layout, G, tmp_dir)
+        _, cached = timed(load_or_compute_layout, G, tmp_dir)
+        print(f"{n} düğüm: ilk açılış {first:.2f} s, önbellekten {cached*1000:.0f} ms")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def synthetic_author_table(cg, n, seed=0):
+    """Gerçek ad parçalarından n yazarlı, kenarsız yapay yazar tablosu"""
+    rng = random.Random(seed)
+    tokens = sorted({token for name in cg.author_name_to_id.values() for token in name.split()})
+    big = CollaborationGraph()
+    for i in range(n):
+        name = " ".join(rng.choice(tokens) for _ in range(rng.randint(2, 3)))
+        big.register_author(f"{name} #{i}", name)
+        big.author_paper_counts[name] = big.author_paper_counts.get(name, 0) + rng.randint(1, 5)
+    return big
+
+
+def keystrokes(names, count, seed=0):
+    """Rastgele seçilen adların harf harf yazılışı (ör. 'a', 'ah', 'ahm', ...)"""
+    rng = random.Random(seed)
+    return [name[:i].lower() for name in rng.sample(names, count) for i in range(1, len(name) + 1)]
+
+
+def bench_author_search(df):
+    """Yazar arama indeksi ile doğrusal taramanın tuş başına süresi ve sonuç eşitliği"""
+    cg = name_based_graph(df)
+    plain = copy.copy(cg)
+    index, build = timed(cg.enable_search_index)
+    names = [cg.G.nodes[n]['name'] for n in cg.G.nodes()]
+    print(f"{len(index)} yazar, indeks oluşturma {build*1000:.0f} ms, {len(index.postings)} n-gram")
+
+    queries = keystrokes(names, 50)
+    linear, linear_time = timed(lambda: [search_authors(plain, q) for q in queries])
+    indexed, indexed_time = timed(lambda: [search_authors(cg, q) for q in queries])
+    print(f"search_authors ({len(queries)} tuş): doğrusal {linear_time/len(queries)*1000:.3f} ms, "
+          f"indeks {indexed_time/len(queries)*1000:.3f} ms / tuş")
+    if linear != indexed:
+        raise AssertionError("İndeksli arama farklı sonuç üretti")
+
+    # Tam eşleşmeler (ID, ad) ve kısmi eşleşmeler; kısmi eşleşme sırası indekste farklıdır
+    lookups = names[:300] + [str(n) for n in list(cg.G.nodes())[:300]] + queries[::10]
+    linear, linear_time = timed(lambda: [find_author_id(plain, q) for q in lookups])
+    indexed, indexed_time = timed(lambda: [find_author_id(cg, q) for q in lookups])
+    print(f"find_author_id ({len(lookups)} sorgu): doğrusal {linear_time/len(lookups)*1000:.3f} ms, "
+          f"indeks {indexed_time/len(lookups)*1000:.3f} ms / sorgu")
+    for (a_id, a_matches), (b_id, b_matches) in zip(linear, indexed):
+        if a_id != b_id or sorted(a_matches) != sorted(b_matches):
+            raise AssertionError("İndeksli find_author_id farklı sonuç üretti")
+
+    # Artımlı eklemelerden sonra: değişen yazarlar ek tablodadır
+    frame = df.drop(columns=['orcid'], errors='ignore')
+    updated = build_graph_from_dataframe(frame.iloc[:-300])
+    updated.enable_search_index()
+    updated.add_papers(frame.iloc[-300:])
+    plain = copy.copy(updated)
+    plain.search_index = None
+    linear, linear_time = timed(lambda: [search_authors(plain, q) for q in queries])
+    indexed, indexed_time = timed(lambda: [search_authors(updated, q) for q in queries])
+    print(f"300 makale eklendikten sonra ({len(updated.search_index.extra)} ek kayıt) search_authors: "
+          f"doğrusal {linear_time/len(queries)*1000:.3f} ms, indeks {indexed_time/len(queries)*1000:.3f} ms / tuş")
+    if linear != indexed:
+        raise AssertionError("Güncellenen indeksle arama farklı sonuç üretti")
+
+    # Büyük yazar kümesi: tuş başına ilk 20 sonuç
+    for n in (100000,):
+        big = synthetic_author_table(cg, n)
+        index, build = timed(big.enable_search_index)
+        queries = keystrokes(index.names, 50, seed=1)
+        _, elapsed = timed(lambda: [index.search(q, limit=20) for q in queries])
+        _, full = timed(lambda: [search_authors(big, q) for q in queries])
+        print(f"{n} yazar: indeks oluşturma {build:.2f} s, ilk 20 sonuç {elapsed/len(queries)*1000:.3f} ms / tuş, "
+              f"tüm sonuçlar {full/len(queries)*1000:.3f} ms / tuş")
+
+
+def synthetic_name_table(n_authors, seed=0, papers_per_author=2):
+    """Ad varyantlı yapay (paper, author) tablosu ve varyant -> gerçek yazar eşlemesi
+
+    Her yazar makalelerinde tam adıyla, baş harfleriyle, orta adı
+    atlanarak veya Türkçe harflerle yazılabilir. Soyad sayısı yazar
+    sayısıyla birlikte büyür (gerçek verideki gibi).
+    """
+    rng = random.Random(seed)
+    syllables = ["ka", "ra", "me", "li", "su", "to", "na", "ye", "gu", "ci", "se", "do", "ba", "zi", "ha", "po"]
+
+    def word(parts):
+        return "".join(rng.choice(syllables) for _ in range(parts)).capitalize()
+
+    surnames = [word(4) for _ in range(max(n_authors // 4, 1))]
+    given = [word(2) for _ in range(200)]
+    authors = [(rng.choice(given), rng.choice(given) if rng.random() < 0.3 else None, rng.choice(surnames))
+               for _ in range(n_authors)]
+    turkish = str.maketrans("sgcu", "şğçü")
+
+    def spelling(first, middle, last):
+        r = rng.random()
+        if r < 0.6:
+            return " ".join(p for p in (first, middle, last) if p)
+        if r < 0.8:
+            return " ".join(p[0] for p in (first, middle) if p) + " " + last
+        if r < 0.9:
+            return f"{first} {last}"
+        return " ".join(p for p in (first, middle, last) if p).translate(turkish)
+
+    # Yazarlar küçük gruplar halinde birlikte yazar; ortak yazarlar tekrar eder
+    rows, truth = [], {}
+    for paper in range(n_authors * papers_per_author // 3):
+        team = rng.randrange(max(n_authors // 5, 1)) * 5
+        for author in rng.sample(range(team, min(team + 5, n_authors)), min(3, n_authors - team)):
+            name = spelling(*authors[author])
+            rows.append((paper, name))
+            truth.setdefault(name, set()).add(author)
+    return pd.DataFrame(rows, columns=['paper', 'author']), truth
+
+
+def bench_name_resolution(df):
+    """Ad varyantı eşleştirmesinin ölçeklenmesi, doğruluğu ve gerçek veriye etkisi"""
+    plain = name_based_graph(df)
+    resolved, elapsed = timed(build_graph_from_dataframe, df.drop(columns=['orcid'], errors='ignore'),
+                              resolve_names=True)
+    merged = sum(len(v) for _, v, _ in resolved.name_merges)
+    print(f"Ad tabanlı graf: {plain.G.number_of_nodes()} -> {resolved.G.number_of_nodes()} yazar "
+          f"({merged} varyant birleştirildi), oluşturma {elapsed*1000:.0f} ms")
+
+    # Eşitlik nedeniyle birleşmeyen "Triatisotnati" kendi kümesinin üyesi
+    # olmalı: "Triatnsotnati" ona katıldıktan sonra "Tritnsotnati" yalnızca
+    # "Triatnsotnati" ile benzer olduğu için kümeye zincirlenmemeli
+    tie = ['Triatisotnati B Smith', 'Triartisotnati Smith', 'Triatisotnati Smith',
+           'Triatnsotnati Smith', 'Tritnsotnati Smith']
+    mapping, _ = resolve_name_variants(pd.DataFrame({'paper': range(len(tie)), 'author': tie}))
+    if mapping != {'Triatnsotnati Smith': 'Triatisotnati Smith'}:
+        raise AssertionError(f"Eşitlikte birleşmeyen ad küme kontrolünü atlattı: {mapping}")
+
+    previous = None
+    for n in (1000, 10000, 100000):
+        table, truth = synthetic_name_table(n, seed=n)
+        (mapping, report), elapsed = timed(resolve_name_variants, table)
+        # Doğruluk: birleştirilen varyant çiftleri gerçekten aynı yazara mı ait
+        correct = wrong = 0
+        for canonical, variants, _ in report:
+            for variant in variants:
+                if truth[variant] & truth[canonical]:
+                    correct += 1
+                else:
+                    wrong += 1
+        names = len(truth)
+        per_name = elapsed / names * 1e6
+        growth = f", ad başına süre x{per_name / previous:.2f}" if previous else ""
+        previous = per_name
+        print(f"{n} yazar, {names} yazılış: {elapsed:.2f} s ({per_name:.1f} µs / ad{growth}), "
+              f"{correct} doğru / {wrong} yanlış birleştirme")
+
+
+class UnbalancedBST:
+    """Eski özyinelemeli, dengesiz BST (karşılaştırma için); eşitler sağa eklenir"""
+
+    def __init__(self):
+        self.root = None
+
+    def insert(self, author_id, author_name, paper_count):
+        node = [author_id, author_name, paper_count, None, None]
+        if self.root is None:
+            self.root = node
+        else:
+            self._insert(self.root, node)
+
+    def _insert(self, parent, node):
+        side = 3 if node[2] < parent[2] else 4
+        if parent[side] is None:
+            parent[side] = node
+        else:
+            self._insert(parent[side], node)
+
+    def inorder_traversal(self):
+        result = []
+
+        def visit(node):
+            if node is not None:
+                visit(node[3])
+                result.append(tuple(node[:3]))
+                visit(node[4])
+        visit(self.root)
+        return result
+
+
+def bench_author_tree(df):
+    """Dengeli yazar ağacını eski BST ile sıralı kuyruklarda karşılaştır; sıra sorgularını doğrula"""
+    cg = name_based_graph(df)
+    G = cg.G
+    author_id = max(G.nodes(), key=G.degree)
+    queue = function2_queue_by_weight(cg, author_id)
+    bst = function3_bst_creation(queue)
+    print(f"Gerçek kuyruk: {len(queue)} yazar, ağaç yüksekliği {bst.root.height}")
+
+    rng = random.Random(11)
+    for n in (1000, 10000, 100000):
+        # function2 gibi makale sayısına göre azalan sıralı kuyruk
+        items = sorted(((f"A{i}", f"Yazar {i}", rng.randint(1, 50)) for i in range(n)),
+                       key=lambda x: x[2], reverse=True)
+        old = UnbalancedBST()
+        try:
+            _, old_time = timed(lambda: [old.insert(*item) for item in items])
+            old_text = f"{old_time * 1000:.0f} ms"
+        except RecursionError:
+            old_text = "RecursionError"
+        tree, new_time = timed(function3_bst_creation, items)
+        print(f"{n} yazar (sıralı): eski BST {old_text}, AVL {new_time * 1000:.0f} ms, "
+              f"yükseklik {tree.root.height}")
+
+        expected = sorted(items, key=lambda x: (x[2], x[0]))
+        if tree.inorder_traversal() != expected:
+            raise AssertionError("Ağaç gezinmesi sıralı değil")
+        if n == 1000 and sorted(old.inorder_traversal(), key=lambda x: (x[2], x[0])) != expected:
+            raise AssertionError("Eski BST ile farklı içerik")
+
+        # Sıra sorguları kaba kuvvetle karşılaştırılır
+        probes = rng.sample(range(n), 200)
+        descending = expected[::-1]
+        for k in probes:
+            if tree.kth_most_productive(k + 1) != descending[k] or tree.rank(descending[k][0]) != k + 1:
+                raise AssertionError("Sıra sorgusu yanlış")
+        low, high = 10, 20
+        if tree.range_by_paper_count(low, high) != [x for x in expected if low <= x[2] <= high]:
+            raise AssertionError("Aralık sorgusu yanlış")
+
+        victims = [items[i][0] for i in probes]
+        _, delete_time = timed(lambda: [function4_bst_delete(tree, v) for v in victims])
+        removed = set(victims)
+        if tree.inorder_traversal() != [x for x in expected if x[0] not in removed]:
+            raise AssertionError("Silme sonrası ağaç yanlış")
+        print(f"  {len(victims)} silme {delete_time / len(victims) * 1e6:.1f} µs / silme, "
+              f"k'ıncı / sıra / aralık sorguları doğrulandı")
+
+
+class DictNode:
+    """Eski BSTNode düzeni (__dict__ ile, karşılaştırma için)"""
+
+    def __init__(self, author_id, author_name, paper_count):
+        self.author_id = author_id
+        self.author_name = author_name
+        self.paper_count = paper_count
+        self.left = None
+        self.right = None
+
+
+def insert_one_by_one(items):
+    tree = BST()
+    for item in items:
+        tree.insert(*item)
+    return tree
+
+
+def bench_tree_build(df):
+    """function3'ün toplu kurulumunu tek tek eklemeyle süre ve bellek açısından karşılaştır"""
+    rng = random.Random(12)
+    for n in (1000, 10000, 100000):
+        queue = sorted(((f"A{i}", f"Yazar {i}", rng.randint(1, 50)) for i in range(n)),
+                       key=lambda x: x[2], reverse=True)
+        one_by_one, insert_time = timed(insert_one_by_one, queue)
+        bulk, bulk_time = timed(function3_bst_creation, queue)
+        if bulk.inorder_traversal() != one_by_one.inorder_traversal():
+            raise AssertionError("Toplu kurulum farklı ağaç üretti")
+        if bulk.rank(queue[0][0]) != one_by_one.rank(queue[0][0]):
+            raise AssertionError("Toplu kurulumda sıra sorgusu farklı")
+        del one_by_one, bulk
+        _, insert_bytes = allocated_bytes(insert_one_by_one, queue)
+        bulk, bulk_bytes = allocated_bytes(function3_bst_creation, queue)
+        print(f"{n} yazar: tek tek ekleme {insert_time * 1000:.0f} ms / {insert_bytes / n:.0f} B/yazar, "
+              f"toplu {bulk_time * 1000:.0f} ms / {bulk_bytes / n:.0f} B/yazar, yükseklik {bulk.root.height}")
+
+    # Düğüm düzeni: __slots__ (8 alan) ile eski __dict__ düğümü (5 alan)
+    _, slot_bytes = allocated_bytes(lambda: [BSTNode(*item) for item in queue])
+    _, dict_bytes = allocated_bytes(lambda: [DictNode(*item) for item in queue])
+    print(f"Düğüm başına bellek: __slots__ {slot_bytes / n:.0f} B, __dict__ {dict_bytes / n:.0f} B")
+
+
+def full_sort_queue(cg, author_id):
+    """Eski function2: tüm komşuları makale sayısına göre sırala (karşılaştırma için)"""
+    G = cg.G
+    queue = [(c, G.nodes[c]['name'], cg.author_paper_counts.get(G.nodes[c]['name'], 0)) for c in G.neighbors(author_id)]
+    return sorted(queue, key=lambda x: x[2], reverse=True)
+
+
+def synthetic_hub(cg, degree, seed=0):
+    """degree işbirlikçisi olan tek merkez yazarlı yapay graf; (graf, merkez ID'si)"""
+    big = synthetic_author_table(cg, degree + 1, seed=seed)
+    rng = random.Random(seed)
+    nodes = list(big.G.nodes())
+    big.G.add_weighted_edges_from((nodes[0], other, rng.randint(1, 5)) for other in nodes[1:])
+    return big, nodes[0]
+
+
+def bench_collaborator_queue(df, k=20):
+    """Kısmi sıralamayla en iyi k ve önceden sıralı kuyrukları tam sıralamayla karşılaştır"""
+    cg = name_based_graph(df)
+    plain = copy.copy(cg)
+    ranking, build = timed(cg.enable_collaborator_ranking)
+    print(f"{cg.G.number_of_nodes()} yazar: önceden sıralama {build * 1000:.0f} ms")
+
+    # Doğruluk: eski sıralama, kısmi sıralama, tembel gezinme ve önceden sıralama aynı sırayı verir
+    for author_id in random.Random(13).sample(list(cg.G.nodes()), 300):
+        expected = full_sort_queue(cg, author_id)
+        if list(function2_queue_by_weight(plain, author_id)) != expected:
+            raise AssertionError("Kuyruk eski sıralamadan farklı")
+        for key in QUEUE_KEYS:
+            full = top_collaborators(plain, author_id, key=key)
+            if (top_collaborators(plain, author_id, k, key) != full[:k]
+                    or list(iter_collaborators(plain, author_id, key)) != full
+                    or top_collaborators(cg, author_id, k, key) != full[:k]
+                    or list(iter_collaborators(cg, author_id, key)) != full):
+                raise AssertionError(f"'{key}' kuyruğu tutarsız")
+
+    for degree in (1000, 10000, 100000):
+        big, hub = synthetic_hub(cg, degree)
+        _, sort_time = timed(full_sort_queue, big, hub, repeat=5)
+        _, partial_time = timed(top_collaborators, big, hub, k, repeat=5)
+        _, build = timed(big.enable_collaborator_ranking)
+        _, ranked_time = timed(top_collaborators, big, hub, k, repeat=3)
+        lazy = iter_collaborators(big, hub)
+        if [next(lazy) for _ in range(k)] != full_sort_queue(big, hub)[:k]:
+            raise AssertionError("Tembel gezinme farklı sıra verdi")
+        print(f"{degree} işbirlikçi: tam sıralama {sort_time * 1000:.1f} ms, kısmi sıralamayla ilk {k} "
+              f"{partial_time * 1000:.1f} ms, önceden sıralı ilk {k} {ranked_time * 1e6:.0f} µs "
+              f"(sıralama {build * 1000:.0f} ms)")
+
+
+def synthetic_consortium_rows(n_papers, authors_per_paper, tracked_per_paper, seed=0):
+    """Her makalenin izlenen yazar sayısı kadar tekrarlandığı yapay satır tablosu"""
+    rng = random.Random(seed)
+    pool = [f"Yazar{i} Soyad{i % 97}" for i in range(authors_per_paper * 20)]
+    rows = []
+    for p in range(n_papers):
+        authors = rng.sample(pool, authors_per_paper)
+        coauthors = "; ".join(authors)
+        for position in rng.sample(range(authors_per_paper), tracked_per_paper):
+            rows.append({'doi': f"10.0000/consortium.{p}", 'paper_title': f"Consortium paper {p}",
+                         'coauthors': coauthors, 'author_name': authors[position],
+                         'author_position': position + 1})
+    return pd.DataFrame(rows)
+
+
+def without_dedup(df):
+    """Her satırı ayrı makale yapan kopya (eski, tekilleştirmesiz yükleme)"""
+    suffix = pd.Series(range(len(df)), index=df.index).astype(str)
+    return df.assign(doi=df['doi'].astype(str) + '#' + suffix, paper_title=df['paper_title'].astype(str) + '#' + suffix)
+
+
+def bench_paper_dedup(df):
+    """DOI düzeyinde tekilleştirmenin yükleme süresine ve kenar ağırlıklarına etkisi"""
+    frame = df.drop(columns=['orcid'], errors='ignore')
+    consortium = synthetic_consortium_rows(200, 60, 20)
+    for label, rows in (("Gerçek veri", frame), ("Konsorsiyum (200 makale x 20 satır, 60 yazar)", consortium)):
+        old, old_time = timed(build_graph_from_dataframe, without_dedup(rows), repeat=3)
+        new, new_time = timed(build_graph_from_dataframe, rows, repeat=3)
+        reference = build_graph_from_dataframe(rows.drop_duplicates('doi'))
+        if graph_snapshot(new) != graph_snapshot(reference):
+            raise AssertionError("Tekilleştirilmiş graf DOI başına tek satırla oluşturulan graftan farklı")
+        old_weight = sum(w for _, _, w in old.G.edges(data='weight'))
+        new_weight = sum(w for _, _, w in new.G.edges(data='weight'))
+        print(f"[{label}] {len(rows)} satır -> {new.papers.number_of_papers} makale: "
+              f"tekilleştirmesiz {old_time * 1000:.0f} ms, tekilleştirmeli {new_time * 1000:.0f} ms, "
+              f"toplam kenar ağırlığı {old_weight} -> {new_weight}")
+
+    # Artımlı eklemede grafta zaten bulunan makaleler atlanır
+    cg = build_graph_from_dataframe(consortium.iloc[:len(consortium) // 2])
+    cg.add_papers(consortium.iloc[len(consortium) // 4:])
+    if graph_snapshot(cg) != graph_snapshot(build_graph_from_dataframe(consortium)):
+        raise AssertionError("Artımlı eklemede tekrarlanan makaleler yeniden sayıldı")
+
+
+def bench_coauthor_parser(df, copies=50):
+    """Liste literali ayrıştırıcısı ile ayırıcı sezgisinin tüm sütun üzerindeki hızı"""
+    column = pd.concat([df['coauthors']] * copies, ignore_index=True)
+    cells = column.tolist()
+    for label, structured in (("ayırıcı sezgisi", False), ("liste literali", True)):
+        rows, rows_time = timed(lambda: [parse_authors(c, structured=structured) for c in cells], repeat=3)
+        table, table_time = timed(explode_coauthors, column, structured=structured, repeat=3)
+        names = [name for parsed in rows for name in parsed]
+        if names != table['author'].tolist():
+            raise AssertionError(f"parse_authors ve explode_coauthors farklı ({label})")
+        # Liste sözdiziminden kalan köşeli parantez ve tırnaklar ("['A Parandaman")
+        broken = sum(name[:1] in ("[", "'") or name[-1:] in ("]", "'") for name in set(names))
+        print(f"{label}: parse_authors {len(cells) / rows_time / 1000:.0f} bin hücre/s, "
+              f"explode_coauthors {len(cells) / table_time / 1000:.0f} bin hücre/s, "
+              f"{len(set(names))} farklı ad, {broken} bozuk ad")
+
+
+def synthetic_orcid_rows(n_authors, n_papers, authors_per_paper, seed=0):
+    """Her yazarın ORCID'i olan, her makalede bir yazarın izlendiği yapay satırlar"""
+    rng = random.Random(seed)
+    pool = [f"Yazar{i} Soyad{i}" for i in range(n_authors)]
+    rows = []
+    for p in range(n_papers):
+        members = rng.sample(range(n_authors), authors_per_paper)
+        position = rng.randrange(authors_per_paper)
+        rows.append({'doi': f"10.0000/orcid.{p}", 'paper_title': f"ORCID paper {p}",
+                     'coauthors': "; ".join(pool[i] for i in members),
+                     'orcid': f"0000-0000-{members[position]:09d}",
+                     'author_name': pool[members[position]], 'author_position': position + 1})
+    return pd.DataFrame(rows)
+
+
+def scan_author_orcid(cg, node_id):
+    """Eski author_orcid gibi ORCID eşlemesini doğrusal tarayan referans"""
+    found = [orcid for orcid, node in cg.identity.orcid_to_node.items() if node == node_id]
+    return found[0] if found else None
+
+
+def shared_name_rows():
+    """Aynı adı taşıyan iki ORCID'li yazar ve adın izlenmeyen geçişleri"""
+    rows = [("J Smith; E Black", None, None),
+            ("J Smith; A Brown", "0000-0000-0000-0001", 1),
+            ("C Green; J Smith", None, None),
+            ("J Smith; D White", "0000-0000-0000-0002", 1),
+            ("J Smith; A Brown", None, None)]
+    return pd.DataFrame([{'doi': f"10.0000/shared.{i}", 'paper_title': f"Shared name paper {i}", 'coauthors': coauthors,
+                          'orcid': orcid, 'author_name': "J Smith" if orcid else None,
+                          'author_position': position}
+                         for i, (coauthors, orcid, position) in enumerate(rows)])
+
+
+def bench_author_identity(df):
+    """ORCID'lerin izlenen yazarlara bağlanması ve ORCID'li yazar listesinin süresi"""
+    cg = build_graph_from_dataframe(df)
+    identity = cg.identity
+    if any(identity.orcid_of(node) != orcid for orcid, node in identity.orcid_to_node.items()):
+        raise AssertionError("ORCID <-> düğüm eşlemeleri tutarsız")
+    # Makalede ORCID düğümünün yerindeki ad, satırın author_name'iyle uyuşmalı
+    papers = cg.papers
+    linked = mismatched = total = 0
+    for title, doi, group in dedupe_papers(df)[['paper_title', 'doi', 'tracked_authors']].itertuples(index=False):
+        paper_id = papers.by_key[paper_key(title, doi)]
+        slots = dict(zip(papers.paper_authors[paper_id], papers.paper_author_names[paper_id]))
+        for orcid, name, _ in group:
+            total += 1
+            slot = slots.get(identity.node_of(orcid))
+            if slot is not None:
+                linked += 1
+                mismatched += not same_person(fold_name(name), fold_name(slot))
+    print(f"[Gerçek veri] düğüm: {cg.G.number_of_nodes()}, ORCID'li düğüm: {len(identity)}, "
+          f"bağlanan izlenen satır: {linked}/{total}, "
+          f"adı uyuşmayan: {mismatched}")
+    if mismatched:
+        raise AssertionError("ORCID adı uyuşmayan bir yazara bağlandı")
+
+    # Ada göre ORCID (find_author_id'nin ORCID yedeği) eşlemedeki ilk ORCID'dir; silmeden sonra da
+    edited = build_graph_from_dataframe(df)
+    names = list(edited.author_orcid_map.values())
+    for step in range(2):
+        for name in names:
+            if edited.orcid_of_name(name) != next(
+                    (orcid for orcid, author in edited.author_orcid_map.items() if author == name), None):
+                raise AssertionError("orcid_of_name eşleme taramasından farklı sonuç verdi")
+        for doi in df['doi'].dropna().unique()[:50]:
+            edited.remove_paper(doi)
+
+    # Artımlı ekleme ORCID'lerle de yeniden oluşturmayla aynı kimlikleri vermeli
+    for count in (20, 100, len(df) // 2):
+        incremental = build_graph_from_dataframe(df.iloc[:-count])
+        incremental.add_papers(df.iloc[-count:])
+        if graph_snapshot(incremental) != graph_snapshot(cg):
+            raise AssertionError(f"Artımlı ekleme ORCID kimliklerini farklı bağladı ({count} makale)")
+    # Aynı ad iki ORCID'de: yalnızca izlenen satırlar ORCID'e bağlanır, her bölünüşte aynı graf
+    rows = shared_name_rows()
+    rebuilt = build_graph_from_dataframe(rows)
+    if sorted(rebuilt.G.nodes[n]['name'] for n in rebuilt.identity.node_to_orcid) != ["J Smith", "J Smith"] \
+            or "J Smith" not in rebuilt.G:
+        raise AssertionError("İzlenmeyen ad ORCID düğümüne bağlandı")
+    rebuilt = graph_snapshot(rebuilt)
+    for cuts in range(1 << (len(rows) - 1)):
+        bounds = [0] + [i + 1 for i in range(len(rows) - 1) if cuts >> i & 1] + [len(rows)]
+        incremental = build_graph_from_dataframe(rows.iloc[:bounds[1]])
+        for a, b in zip(bounds[1:-1], bounds[2:]):
+            incremental.add_papers(rows.iloc[a:b])
+        if graph_snapshot(incremental) != rebuilt:
+            raise AssertionError(f"Artımlı ekleme ORCID'li grafı farklı oluşturdu (partiler {bounds})")
+    print(f"Artımlı ORCID yüklemesi yeniden oluşturmayla aynı ({1 << (len(rows) - 1)} bölünüş)")
+
+    for n_authors in (1000, 5000):
+        cg = build_graph_from_dataframe(synthetic_orcid_rows(n_authors, n_authors, 6))
+        authors = list_authors(cg)
+        old, old_time = timed(lambda: [scan_author_orcid(cg, node_id) for _, node_id, _, _ in authors])
+        new, new_time = timed(lambda: [author_orcid(cg, node_id) for _, node_id, _, _ in authors], repeat=3)
+        if old != new:
+            raise AssertionError("author_orcid doğrusal taramadan farklı sonuç verdi")
+        print(f"[{n_authors} ORCID'li yazar] liste ORCID'leri: tarama {old_time * 1000:.1f} ms, "
+              f"sözlük {new_time * 1000:.2f} ms")
+
+
+def subgraph_shortest_paths(G, author_id, k):
+    """Eski function5: k adımlık G.subgraph görünümü üzerinde tüm yollar"""
+    nodes = {author_id}
+    frontier = [author_id]
+    for _ in range(k):
+        frontier = [w for v in frontier for w in G.neighbors(v) if w not in nodes and not nodes.add(w)]
+    paths = nx.single_source_dijkstra_path(G.subgraph(nodes), author_id, weight='weight')
+    return {target: path for target, path in paths.items() if target != author_id}
+
+
+def bench_ego_paths(df, shown=100):
+    """Alt graf görünümündeki Dijkstra ile öncül dizili sınırlı Dijkstra'yı karşılaştır"""
+    cg = name_based_graph(df)
+    G = cg.G
+    rng = random.Random(11)
+    hubs = sorted(G.nodes(), key=G.degree, reverse=True)[:5]
+    sources = hubs + rng.sample(list(G.nodes()), 45)
+    plain = copy.copy(cg)
+    plain.csr = None
+    cg.enable_csr()
+    for k in (1, 2, 3):
+        old, old_time = timed(lambda: [subgraph_shortest_paths(G, a, k) for a in sources])
+        new, new_time = timed(lambda: [function5_shortest_paths_from_a(plain, a, k) for a in sources], repeat=3)
+        csr, csr_time = timed(lambda: [function5_shortest_paths_from_a(cg, a, k) for a in sources], repeat=3)
+        _, shown_time = timed(lambda: [list(islice(r.items(), shown)) for r in new], repeat=3)
+        # Eşit uzunlukta yollar arasında seçim de aynı olmalı
+        if [r.paths() for r in new] != old or [r.paths() for r in csr] != old:
+            raise AssertionError(f"Sınırlı Dijkstra alt graf yollarından farklı (k={k})")
+        targets = sum(len(r) for r in new)
+        print(f"k={k}: {targets / len(sources):.0f} hedef / yazar; alt graf + tüm yollar {old_time / len(sources) * 1000:.2f} ms, "
+              f"sınırlı Dijkstra {new_time / len(sources) * 1000:.2f} ms (CSR {csr_time / len(sources) * 1000:.2f} ms), "
+              f"ilk {shown} yol {shown_time / len(sources) * 1000:.3f} ms")
+
+    # Uzaklık sınırı: yalnızca cutoff'a kadar olan hedefler
+    hub = hubs[0]
+    full = function5_shortest_paths_from_a(plain, hub)
+    cutoff = sorted(full.dist)[len(full.dist) // 10]
+    bounded, bounded_time = timed(function5_shortest_paths_from_a, plain, hub, 2, cutoff, repeat=3)
+    expected = [t for t in full if full.distance(t) <= cutoff]
+    if sorted(bounded, key=str) != sorted(expected, key=str) or \
+            any(bounded.distance(t) != full.distance(t) for t in bounded):
+        raise AssertionError("cutoff ile bulunan uzaklıklar farklı")
+    print(f"cutoff={cutoff} ({G.nodes[hub]['name']}): {len(bounded)}/{len(full)} hedef, {bounded_time * 1000:.2f} ms")
+
+
+def bench_centrality(df, clicks=100):
+    """Merkezilik indeksi: function7 taraması, PageRank ve örneklemeli arasındalık"""
+    from networkx.algorithms.link_analysis.pagerank_alg import _pagerank_python
+
+    cg = name_based_graph(df)
+    G = cg.G
+    n = G.number_of_nodes()
+    scanned, scan_time = timed(lambda: [function7_most_collaborative(cg) for _ in range(clicks)])
+    index, build_time = timed(cg.enable_centrality, repeat=3)
+    indexed, lookup_time = timed(lambda: [function7_most_collaborative(cg) for _ in range(clicks)], repeat=3)
+    if scanned != indexed:
+        raise AssertionError("Merkezilik indeksi farklı en çok işbirlikçi yazar verdi")
+    _, top_time = timed(lambda: [top_authors(cg, 'weighted_degree', 10) for _ in range(clicks)], repeat=3)
+    print(f"{n} düğüm; indeks {build_time * 1000:.1f} ms; function7: tarama {scan_time / clicks * 1000:.3f} ms, "
+          f"indeks {lookup_time / clicks * 1000:.4f} ms; ilk 10 {top_time / clicks * 1000:.4f} ms / tıklama")
+
+    if any(index.value(v) != G.degree(v) or index.value(v, 'weighted_degree') != G.degree(v, weight='weight')
+           for v in G):
+        raise AssertionError("Derece dizileri networkx'ten farklı")
+    reference, nx_time = timed(_pagerank_python, G, weight='weight')
+    error = max(abs(reference[v] - index.value(v, 'pagerank')) for v in G)
+    print(f"PageRank: networkx (saf Python) {nx_time * 1000:.0f} ms, indeks kurulumunun içinde; en büyük fark {error:.1e}")
+    if error > 1e-9:
+        raise AssertionError("PageRank networkx'ten farklı")
+
+    exact, exact_time = timed(nx.betweenness_centrality, G)
+    exact = np.array([exact[v] for v in index.node_ids])
+    for epsilon in (0.2, 0.1, 0.05):
+        (values, samples), elapsed = timed(approximate_betweenness, index.indptr, index.indices, epsilon)
+        error = np.abs(values - exact).max()
+        top = {v for v, _, _ in CentralityIndex(cg, epsilon=epsilon).top('betweenness', 10)}
+        overlap = len(top & {index.node_ids[i] for i in np.argsort(-exact, kind='stable')[:10].tolist()})
+        print(f"arasındalık epsilon={epsilon}: {samples}/{n} kaynak, {elapsed * 1000:.0f} ms "
+              f"(kesin networkx {exact_time * 1000:.0f} ms), en büyük hata {error:.4f}, ilk 10 örtüşme {overlap}/10")
+        if error > epsilon * n / (n - 1):
+            raise AssertionError(f"Arasındalık hatası sınırı aştı (epsilon={epsilon})")
+
+    # Analiz iş parçacıkları arasındalığı aynı anda isteyebilir (TaskRunner 4 iş parçacığı)
+    shared = CentralityIndex(cg)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        tops = list(pool.map(lambda _: shared.top('betweenness', 10), range(8)))
+    if any(t != tops[0] for t in tops) or tops[0] != CentralityIndex(cg).top('betweenness', 10):
+        raise AssertionError("Eşzamanlı arasındalık istekleri farklı sonuç verdi")
+
+
+BENCHMARKS = {
+    'ingestion': bench_ingestion,
+    'snapshot': bench_snapshot,
+    'csr': bench_csr,
+    'incremental': bench_incremental,
+    'derived_update': bench_derived_update,
+    'longest_path': bench_longest_path,
+    'distance_oracle': bench_distance_oracle,
+    'node_lookup': bench_node_lookup,
+    'rendering': bench_rendering,
+    'layout': bench_layout,
+    'author_search': bench_author_search,
+    'name_resolution': bench_name_resolution,
+    'author_tree': bench_author_tree,
+    'tree_build': bench_tree_build,
+    'collaborator_queue': bench_collaborator_queue,
+    'paper_dedup': bench_paper_dedup,
+    'coauthor_parser': bench_coauthor_parser,
+    'author_identity': bench_author_identity,
+    'ego_paths': bench_ego_paths,
+    'centrality': bench_centrality,
+}
+
+
+def main(names=None):
+    df = read_dataset(EXCEL_PATH)
+    for name in names or BENCHMARKS:
+        print(f"\n=== {name} ===")
+        BENCHMARKS[name](df)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,254 @@
+"""Makale sayısına göre dengeli sıra istatistikli yazar ağacı
+
+Eski BST dengesizdi ve özyinelemeliydi: function2_queue_by_weight
+kuyruğu zaten makale sayısına göre sıralı olduğundan ağaç bağlı listeye
+dönüşür, ekleme O(n) sürer ve büyük kuyruklarda özyineleme sınırı aşılırdı.
+Silme de ağaç makale sayısına göre sıralıyken yazar ID'sine göre arandığı
+için düğümleri bulamıyordu.
+
+Bu ağaç bir AVL ağacıdır:
+
+- Anahtar (makale sayısı, yazar ID'si) çiftidir; eşit makale sayılı
+  yazarlar ID'ye göre sıralanır.
+- ID -> makale sayısı sözlüğü sayesinde ID ile silme O(log n)'dir.
+- Ekleme, silme ve gezinme yinelemelidir; derinlik O(log n) kalır.
+- Her düğüm alt ağaç boyutunu tutar: k'ıncı en üretken yazar, bir yazarın
+  sırası ve makale sayısı aralığı sorguları O(log n) (+ sonuç sayısı) sürer.
+- Sıralı girdiden (from_sorted) ağaç tek tek ekleme yapılmadan, dönmesiz
+  ve tam dengeli olarak O(n) sürede kurulur. Düğümler __slots__ kullanır ve
+  anahtar demeti saklamaz; karşılaştırma alanlar üzerinden yapılır.
+"""
+
+
+class BSTNode:
+    __slots__ = ('author_id', 'author_name', 'paper_count', 'left', 'right', 'height', 'size')
+
+    def __init__(self, author_id, author_name, paper_count):
+        self.author_id = author_id
+        self.author_name = author_name
+        self.paper_count = paper_count
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+
+
+def _before(paper_count, author_id, node):
+    """(paper_count, author_id) anahtarı düğümün anahtarından küçük mü"""
+    return paper_count < node.paper_count or (paper_count == node.paper_count and author_id < node.author_id)
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _update(node):
+    left, right = node.left, node.right
+    node.height = 1 + max(_height(left), _height(right))
+    node.size = 1 + _size(left) + _size(right)
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """Düğümün yüksekliğini güncelle, gerekiyorsa döndür; alt ağacın yeni kökü"""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _build_balanced(nodes, lo, hi):
+    """nodes[lo:hi] aralığının ortası kök olan tam dengeli alt ağaç; derinlik O(log n)"""
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = nodes[mid]
+    node.left = _build_balanced(nodes, lo, mid)
+    node.right = _build_balanced(nodes, mid + 1, hi)
+    _update(node)
+    return node
+
+
+class BST:
+    """(makale sayısı, yazar ID'si) sıralı AVL ağacı
+
+    inorder_traversal makale sayısına göre artan (node_id, ad, makale sayısı)
+    listesi döndürür.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.paper_counts = {}  # yazar ID'si -> makale sayısı
+
+    @classmethod
+    def from_sorted(cls, items):
+        """(node_id, ad, makale sayısı) öğelerinden tam dengeli ağaç kur
+
+        Öğeler (makale sayısı, node_id) anahtarına göre artan sıralı ve ID'ler
+        tekil olmalıdır.
+        """
+        tree = cls()
+        nodes = [BSTNode(author_id, name, paper_count) for author_id, name, paper_count in items]
+        tree.paper_counts = {author_id: paper_count for author_id, _, paper_count in items}
+        tree.root = _build_balanced(nodes, 0, len(nodes))
+        return tree
+
+    def __len__(self):
+        return len(self.paper_counts)
+
+    def __contains__(self, author_id):
+        return author_id in self.paper_counts
+
+    def _fix_path(self, path):
+        # Yol üzerindeki düğümleri aşağıdan yukarı dengele ve ebeveynlere bağla
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            subtree = _rebalance(node)
+            if i == 0:
+                self.root = subtree
+            elif path[i - 1].left is node:
+                path[i - 1].left = subtree
+            else:
+                path[i - 1].right = subtree
+
+    def insert(self, author_id, author_name, paper_count):
+        """Yazarı ekle; ID ağaçta varsa kaydı güncellenir"""
+        if author_id in self.paper_counts:
+            self.delete(author_id)
+        new = BSTNode(author_id, author_name, paper_count)
+        self.paper_counts[author_id] = paper_count
+        if self.root is None:
+            self.root = new
+            return
+
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node = node.left if _before(paper_count, author_id, node) else node.right
+        parent = path[-1]
+        if _before(paper_count, author_id, parent):
+            parent.left = new
+        else:
+            parent.right = new
+        self._fix_path(path)
+
+    def delete(self, author_id):
+        """Yazarı ID'siyle sil; ağaçta yoksa bir şey yapılmaz"""
+        paper_count = self.paper_counts.pop(author_id, None)
+        if paper_count is None:
+            return
+
+        path = []
+        node = self.root
+        while node.author_id != author_id:
+            path.append(node)
+            node = node.left if _before(paper_count, author_id, node) else node.right
+
+        if node.left is not None and node.right is not None:
+            # İki çocuk: sağ alt ağacın en küçüğünü bu düğüme taşı, onu sil
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.author_id = successor.author_id
+            node.author_name = successor.author_name
+            node.paper_count = successor.paper_count
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+            return
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self._fix_path(path)
+
+    def _nodes(self, low=None, high=None):
+        # Artan sırada düğümler; low/high verilirse makale sayısı aralığıyla budanır
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left if low is None or node.paper_count >= low else None
+            node = stack.pop()
+            if high is not None and node.paper_count > high:
+                return
+            if low is None or node.paper_count >= low:
+                yield node
+            node = node.right
+
+    def inorder_traversal(self):
+        return [(node.author_id, node.author_name, node.paper_count) for node in self._nodes()]
+
+    def select(self, index):
+        """Artan sıradaki index'inci (0'dan) yazar: (node_id, ad, makale sayısı)"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.author_id, node.author_name, node.paper_count
+            else:
+                index -= left + 1
+                node = node.right
+
+    def kth_most_productive(self, k):
+        """k'ıncı (1'den) en çok makalesi olan yazar; eşitlikte büyük ID önce"""
+        return self.select(len(self) - k)
+
+    def rank(self, author_id):
+        """Yazarın üretkenlik sırası (1 = en çok makale); ağaçta yoksa None"""
+        paper_count = self.paper_counts.get(author_id)
+        if paper_count is None:
+            return None
+        below = 0  # anahtarı yazarınkinden küçük düğüm sayısı
+        node = self.root
+        while node.author_id != author_id:
+            if _before(paper_count, author_id, node):
+                node = node.left
+            else:
+                below += _size(node.left) + 1
+                node = node.right
+        below += _size(node.left)
+        return len(self) - below
+
+    def range_by_paper_count(self, low, high):
+        """Makale sayısı low ile high (dahil) arasındaki yazarlar, artan sırada"""
+        return [(node.author_id, node.author_name, node.paper_count) for node in self._nodes(low, high)]
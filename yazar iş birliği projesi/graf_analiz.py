@@ -0,0 +1,206 @@
+import networkx as nx
+from collections import deque
+
+from graf_agac import BST
+from graf_ego import DEFAULT_HOPS, ego_paths
+from graf_kuyruk import top_collaborators
+from graf_merkezilik import CentralityIndex
+from graf_uzun_yol import EXACT, longest_simple_path
+
+def find_author_id(cg, author_input):
+    """Yazar ID'sini bul; (ID, kısmi eşleşmeler) döndürür
+
+    Tek bir yazar bulunursa ID döner; birden fazla kısmi eşleşme varsa ID
+    None olur ve eşleşmeler (node_id, yazar adı) listesi olarak döner.
+    Arama indeksi etkinse eşleşmeler makale sayısına göre sıralıdır.
+    """
+    G = cg.G
+    author_input = author_input.strip()
+
+    if cg.search_index is not None:
+        index = cg.search_index
+        author_id = index.exact(author_input)
+        if author_id is not None:
+            return author_id, []
+        matches = index.search(author_input)
+        if len(matches) == 1:
+            return matches[0][0], []
+        return None, matches
+
+    # Önce tam eşleşme ara
+    for node_id in G.nodes():
+        if str(node_id) == author_input or G.nodes[node_id]['name'] == author_input:
+            return node_id, []
+
+    # ORCID eşleşmesi ara
+    author_id = cg.identity.node_of(author_input)
+    if author_id is not None:
+        return author_id, []
+    orcid = cg.orcid_of_name(author_input)
+    if orcid is not None:
+        return cg.identity.node_of(orcid), []
+
+    # Kısmi eşleşme ara
+    matches = []
+    for node_id in G.nodes():
+        author_name = G.nodes[node_id]['name']
+        if author_input.lower() in author_name.lower():
+            matches.append((node_id, author_name))
+
+    # Eğer tek eşleşme varsa onu döndür
+    if len(matches) == 1:
+        return matches[0][0], []
+
+    return None, matches
+
+def function1_shortest_path(cg, author_a_id, author_b_id):
+    """1. A ile B yazarı arasındaki en kısa yolun bulunması
+
+    Yol yoksa None döndürür.
+    """
+    if cg.distance_oracle is not None:
+        return cg.distance_oracle.shortest_path(author_a_id, author_b_id)
+    if cg.csr is not None:
+        return cg.csr.shortest_path(author_a_id, author_b_id)
+
+    G = cg.G
+    # Yolların varlığını kontrol et
+    if not nx.has_path(G, author_a_id, author_b_id):
+        return None
+
+    # En kısa yolu hesapla
+    try:
+        return nx.shortest_path(G, author_a_id, author_b_id, weight='weight')
+    except nx.NetworkXNoPath:
+        return None
+
+def function2_queue_by_weight(cg, author_id, k=None, key='papers'):
+    """2. A yazarı ve işbirliği yaptığı yazarlar için düğüm ağırlıklarına göre kuyruk oluşturma
+
+    Kuyruk makale sayısına göre (en yüksekten en düşüğe) sıralıdır; key ile
+    kenar ağırlığı veya bileşik anahtar seçilebilir. k verilirse yalnızca en
+    iyi k yazar bir yığınla seçilir.
+    """
+    return deque(top_collaborators(cg, author_id, k, key))
+
+def function3_bst_creation(queue):
+    """3. Kuyruktaki yazarlardan bir BST oluşturma
+
+    Kuyruk makale sayısına göre zaten sıralı olduğundan sıralama neredeyse
+    doğrusal sürer ve ağaç toplu olarak kurulur.
+    """
+    items = sorted(queue, key=lambda x: (x[2], x[0]))
+    if len({node_id for node_id, _, _ in items}) == len(items):
+        return BST.from_sorted(items)
+
+    # Tekrarlanan ID'ler: tek tek ekle (son kayıt geçerli olur)
+    bst = BST()
+    for node_id, name, paper_count in queue:
+        bst.insert(node_id, name, paper_count)
+
+    return bst
+
+def function4_bst_delete(bst, author_id):
+    """BST'den yazar silme"""
+    bst.delete(author_id)
+    return bst
+
+def function5_shortest_paths_from_a(cg, author_id, k=DEFAULT_HOPS, cutoff=None):
+    """4. A yazarı ve işbirlikçi yazarlar arasında kısa yolların hesaplanması
+
+    Yollar yalnızca A'ya en fazla k adım uzaklıktaki yazarlardan geçer;
+    cutoff verilirse ağırlıklı uzaklığı cutoff'u aşan yazarlar dahil
+    edilmez. Hedefleri artan uzaklık sırasıyla veren EgoPaths döndürür;
+    yollar yalnızca istenen hedefler için (path, items) kurulur.
+    """
+    if cg.csr is not None:
+        return cg.csr.ego_paths(author_id, k, cutoff)
+    return ego_paths(cg.G, author_id, k, cutoff)
+
+def function6_collaborator_count(cg, author_id):
+    """5. A yazarının işbirliği yaptığı yazarların listesi (sayısı len ile alınır)"""
+    if cg.csr is not None:
+        return cg.csr.neighbors(author_id)
+    return list(cg.G.neighbors(author_id))
+
+def function7_most_collaborative(cg):
+    """6. En çok işbirliği yapan yazarın belirlenmesi; (düğüm, derece) döndürür"""
+    if cg.centrality is not None:
+        return cg.centrality.most_collaborative()
+    if cg.csr is not None:
+        return cg.csr.max_degree_node()
+
+    G = cg.G
+    # En yüksek dereceye sahip düğümü bul
+    max_degree = 0
+    most_collaborative_author = None
+
+    for node in G.nodes():
+        degree = G.degree(node)
+        if degree > max_degree:
+            max_degree = degree
+            most_collaborative_author = node
+
+    return most_collaborative_author, max_degree
+
+def top_authors(cg, metric='degree', k=10):
+    """Merkezilik ölçüsüne göre en yüksek k yazar; (node_id, ad, değer) listesi
+
+    Ölçüler: graf_merkezilik.CENTRALITY_METRICS. Merkezilik indeksi etkin
+    değilse bu çağrı için bir kez oluşturulur.
+    """
+    centrality = cg.centrality if cg.centrality is not None else CentralityIndex(cg)
+    return centrality.top(metric, k)
+
+def function8_longest_path(cg, author_id, mode=EXACT, time_limit=2.0, max_expansions=None,
+                           should_stop=None):
+    """7. Kullanıcıdan alınan yazar ID'sinden gidebileceği en uzun yolun bulunması
+
+    Arama süre/genişletme bütçesiyle sınırlıdır; (yol, kanıtlanmış_optimal)
+    döndürür. Bütçe dolarsa ya da should_stop() True dönerse yol o ana kadar
+    bulunan en uzun yoldur.
+    """
+    return longest_simple_path(cg.G, author_id, mode=mode, time_limit=time_limit,
+                               max_expansions=max_expansions, should_stop=should_stop)
+
+def author_orcid(cg, node_id):
+    """Düğüme ait ORCID'i döndür, yoksa None"""
+    return cg.identity.orcid_of(node_id)
+
+def list_authors(cg):
+    """Tüm yazarları makale sayısına göre azalan sırada döndür
+
+    Her eleman (yazar adı, node_id, makale sayısı, derece) biçimindedir.
+    """
+    G = cg.G
+    sorted_authors = []
+    for node_id in G.nodes():
+        author_name = G.nodes[node_id]['name']
+        paper_count = cg.author_paper_counts.get(author_name, 0)
+        degree = G.degree(node_id)
+        sorted_authors.append((author_name, node_id, paper_count, degree))
+
+    # Makale sayısına göre azalan sırada sırala
+    sorted_authors.sort(key=lambda x: x[2], reverse=True)
+    return sorted_authors
+
+def search_authors(cg, search_term):
+    """Adında arama terimi geçen yazarları makale sayısına göre sıralı döndür"""
+    G = cg.G
+    search_term = search_term.strip().lower()
+
+    if cg.search_index is not None:
+        return [(author_name, node_id, paper_count, G.degree(node_id))
+                for node_id, author_name, paper_count in cg.search_index.matches(search_term)]
+    matches = []
+
+    for node_id in G.nodes():
+        author_name = G.nodes[node_id]['name']
+        if search_term in author_name.lower():
+            paper_count = cg.author_paper_counts.get(author_name, 0)
+            degree = G.degree(node_id)
+            matches.append((author_name, node_id, paper_count, degree))
+
+    # Sonuçları makale sayısına göre sırala
+    matches.sort(key=lambda x: x[2], reverse=True)
+    return matches
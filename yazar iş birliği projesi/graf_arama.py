@@ -0,0 +1,239 @@
+"""Yazar arama indeksi: tam eşleşme tabloları ve n-gram alt dize indeksi
+
+find_author_id ve search_authors her sorguda tüm düğümleri gezerdi. İndeks
+graf yüklenirken bir kez oluşturulur:
+
+- Tam eşleşme: düğüm ID'si, yazar adı ve ORCID için sözlükler; ORCID
+  eşleşmesi ORCID'in bağlı olduğu düğümü döndürür.
+- Alt dize: küçük harfli adların 1, 2 ve 3 harflik parçaları (n-gram) için
+  geçiş listeleri. En fazla 3 harflik sorgunun sonucu doğrudan geçiş
+  listesidir; daha uzun sorgularda sorgunun 3-gram listeleri kesiştirilir ve
+  kalan adaylar gerçek alt dize kontrolüyle doğrulanır.
+
+Yazarlar makale sayısına göre azalan (eşitlikte graf sırasıyla) sıralanır ve
+geçiş listeleri bu sıradaki konumları tutar; kesişim sonucu bu yüzden
+kendiliğinden makale sayısına göre sıralıdır.
+
+Graf değiştiğinde indeks yerinde güncellenir: değişen yazarların ana
+indeksteki kayıtları silinmiş işaretlenir, güncel kayıtları küçük bir ek
+tabloya girer. Ek tablo kayıtları ana sıradaki yerleriyle (ikili arama)
+ve kendi n-gram geçiş kümeleriyle saklanır; sorguda yalnızca adayları
+denetlenir ve sonuçlara sırası bozulmadan katılır. Ek tablo
+büyüyünce indeks yeniden oluşturulur.
+"""
+from itertools import islice
+
+import numpy as np
+
+GRAM_SIZE = 3
+# Ek tablo bu boyutu ve ana indeksin 1/8'ini aşınca indeks yeniden oluşturulur
+EXTRA_LIMIT = 1024
+
+_EMPTY = np.empty(0, dtype=np.int32)
+
+
+def _grams(text):
+    """Metindeki en fazla GRAM_SIZE uzunluğundaki tüm parçalar"""
+    return {text[i:i + k] for k in range(1, GRAM_SIZE + 1) for i in range(len(text) - k + 1)}
+
+
+class AuthorSearchIndex:
+    """Yazar ID'si, adı ve ORCID'i için tam eşleşme ve alt dize araması"""
+
+    def __init__(self, cg):
+        self._build(cg)
+
+    def _build(self, cg):
+        G = cg.G
+        nodes = list(G.nodes())
+        names = [G.nodes[node]['name'] for node in nodes]
+        counts = [cg.author_paper_counts.get(name, 0) for name in names]
+
+        # Tam eşleşmelerde graf sırasındaki ilk düğüm kazanır; sonradan
+        # eklenen düğümler graf sırasında sona eklenir
+        self.graph_position = {node: i for i, node in enumerate(nodes)}
+        self.next_position = len(nodes)
+        self.by_id = {}
+        self.by_name = {}
+        for node, name in zip(nodes, names):
+            self.by_id.setdefault(str(node), node)
+            self.by_name.setdefault(name, node)
+        self._index_orcids(cg)
+
+        # Sıralama: makale sayısına göre azalan, eşitlikte graf sırası
+        order = sorted(range(len(nodes)), key=lambda i: -counts[i])
+        self.node_ids = [nodes[i] for i in order]
+        self.names = [names[i] for i in order]
+        self.paper_counts = [counts[i] for i in order]
+        self.lowered = [name.lower() for name in self.names]
+        # Ek tablo kayıtlarının ana sıradaki yeri için sıralama anahtarları
+        self.neg_counts = -np.asarray(self.paper_counts, dtype=np.int64)
+        self.rank_positions = np.asarray(order, dtype=np.int64)
+        self.rank_of = {node: rank for rank, node in enumerate(self.node_ids)}
+        self.dead = np.zeros(len(nodes), dtype=bool)
+        self.dead_count = 0
+        # Düğüm -> (ana sıradaki yer, -makale sayısı, graf sırası, düğüm, ad, makale sayısı, küçük harfli ad);
+        # aynı yere düşen kayıtlar kendi aralarında tam anahtarla sıralanır
+        self.extra = {}
+        # Ek tablo için n-gram -> düğümler (ana indeksteki geçiş listelerinin karşılığı)
+        self.extra_postings = {}
+
+        postings = {}
+        for rank, name in enumerate(self.lowered):
+            for gram in _grams(name):
+                postings.setdefault(gram, []).append(rank)
+        self.postings = {gram: np.array(ranks, dtype=np.int32) for gram, ranks in postings.items()}
+
+    def _index_orcids(self, cg):
+        # ORCID'ler eşleme sırasıyla: ORCID -> sıra, yazar adı -> ilk ORCID
+        self.orcid_nodes = dict(cg.identity.orcid_to_node)
+        self.orcid_position = {orcid: i for i, orcid in enumerate(cg.author_orcid_map)}
+        self.orcid_by_name = {}
+        for orcid, name in cg.author_orcid_map.items():
+            self.orcid_by_name.setdefault(name, orcid)
+
+    def _slot(self, count, position):
+        """(makale sayısı, graf sırası) anahtarının ana sıradaki yeri"""
+        lo = int(np.searchsorted(self.neg_counts, -count, side='left'))
+        hi = int(np.searchsorted(self.neg_counts, -count, side='right'))
+        return lo + int(np.searchsorted(self.rank_positions[lo:hi], position))
+
+    def update(self, cg, author_ids):
+        """Verilen yazarların kayıtlarını grafın güncel durumuna göre yenile"""
+        nodes = cg.G.nodes
+        # Yeni düğümler graf sırasının sonundadır; sıraları kayıt sırasından alınır
+        new = {node for node in author_ids if node in nodes and node not in self.graph_position}
+        for node in reversed(list(islice(reversed(cg.author_name_to_id), len(new)))):
+            if node in new:
+                self.graph_position[node] = self.next_position
+                self.next_position += 1
+                self.by_id.setdefault(str(node), node)
+                self.by_name.setdefault(nodes[node]['name'], node)
+
+        for node in author_ids:
+            rank = self.rank_of.pop(node, None)
+            if rank is not None:
+                old_name = self.names[rank]
+                self.dead[rank] = True
+                self.dead_count += 1
+            entry = self._pop_extra(node)
+            if entry is not None:
+                old_name = entry[4]
+
+            if node not in nodes:
+                # Silinen yazar: aynı adı taşıyan ilk düğüm tam eşleşmeyi devralır
+                del self.graph_position[node]
+                if self.by_id.get(str(node)) == node:
+                    del self.by_id[str(node)]
+                if self.by_name.get(old_name) == node:
+                    del self.by_name[old_name]
+                    for other in cg.author_ids_by_name.get(old_name, ()):
+                        self.by_name[old_name] = other
+                        break
+                continue
+
+            name = nodes[node]['name']
+            position = self.graph_position[node]
+            count = cg.author_paper_counts.get(name, 0)
+            self._add_extra((self._slot(count, position), -count, position, node, name, count, name.lower()))
+        self._index_orcids(cg)
+
+        if len(self.extra) > max(EXTRA_LIMIT, len(self.node_ids) // 8):
+            self._build(cg)
+
+    def _add_extra(self, entry):
+        node = entry[3]
+        self.extra[node] = entry
+        for gram in _grams(entry[6]):
+            self.extra_postings.setdefault(gram, set()).add(node)
+
+    def _pop_extra(self, node):
+        entry = self.extra.pop(node, None)
+        if entry is not None:
+            for gram in _grams(entry[6]):
+                nodes = self.extra_postings[gram]
+                nodes.discard(node)
+                if not nodes:
+                    del self.extra_postings[gram]
+        return entry
+
+    def _extra_matches(self, query):
+        """Ek tabloda adında query (küçük harfli) geçen kayıtlar, ana sıradaki yerlerine göre sıralı"""
+        if not self.extra:
+            return []
+        if not query:
+            candidates = self.extra
+        elif len(query) <= GRAM_SIZE:
+            candidates = self.extra_postings.get(query, ())
+        else:
+            grams = {query[i:i + GRAM_SIZE] for i in range(len(query) - GRAM_SIZE + 1)}
+            sets = sorted((self.extra_postings.get(gram, set()) for gram in grams), key=len)
+            candidates = set.intersection(*sets)
+        extra = self.extra
+        return sorted(entry for entry in map(extra.__getitem__, candidates) if query in entry[6])
+
+    def __len__(self):
+        return len(self.graph_position)
+
+    def exact(self, author_input):
+        """Girdiyle tam eşleşen düğüm ID'si, yoksa None
+
+        Önce düğüm ID'si ve adı (graf sırasıyla), sonra ORCID ve ORCID'e bağlı
+        ad (eşleme sırasıyla) denenir.
+        """
+        hits = [node for node in (self.by_id.get(author_input), self.by_name.get(author_input))
+                if node is not None]
+        if hits:
+            return min(hits, key=self.graph_position.get)
+        hits = [orcid for orcid in (author_input if author_input in self.orcid_position else None,
+                                    self.orcid_by_name.get(author_input))
+                if orcid is not None]
+        if hits:
+            return self.orcid_nodes[min(hits, key=self.orcid_position.get)]
+        return None
+
+    def _ranks(self, query):
+        """Ana indekste adında query geçen kayıtların sıra konumları (silinenler dahil)"""
+        query = query.lower()
+        if not query:
+            return np.arange(len(self.node_ids), dtype=np.int32)
+        if len(query) <= GRAM_SIZE:
+            return self.postings.get(query, _EMPTY)
+
+        # En kısa listeden başlayarak kesiştir
+        grams = {query[i:i + GRAM_SIZE] for i in range(len(query) - GRAM_SIZE + 1)}
+        lists = sorted((self.postings.get(gram, _EMPTY) for gram in grams), key=len)
+        found = lists[0]
+        for ranks in lists[1:]:
+            if len(found) == 0:
+                break
+            found = np.intersect1d(found, ranks, assume_unique=True)
+        lowered = self.lowered
+        return np.array([r for r in found.tolist() if query in lowered[r]], dtype=np.int32)
+
+    def matches(self, query, limit=None):
+        """Adında query geçen yazarlar; makale sayısına göre sıralı (node_id, ad, makale sayısı) listesi"""
+        ranks = self._ranks(query)
+        if self.dead_count:
+            ranks = ranks[~self.dead[ranks]]
+        extra = self._extra_matches(query.lower())
+        if limit is not None:
+            ranks, extra = ranks[:limit], extra[:limit]
+
+        node_ids, names, counts = self.node_ids, self.names, self.paper_counts
+        if not extra:
+            return [(node_ids[r], names[r], counts[r]) for r in ranks.tolist()]
+        # Ek tablo kayıtları ana sıradaki yerlerine yerleştirilir
+        result = []
+        start = 0
+        cuts = np.searchsorted(ranks, [entry[0] for entry in extra]).tolist()
+        for cut, entry in zip(cuts, extra):
+            result.extend((node_ids[r], names[r], counts[r]) for r in ranks[start:cut].tolist())
+            result.append(entry[3:6])
+            start = cut
+        result.extend((node_ids[r], names[r], counts[r]) for r in ranks[start:].tolist())
+        return result[:limit]
+
+    def search(self, query, limit=None):
+        """Adında query geçen yazarlar; makale sayısına göre sıralı (node_id, ad) listesi"""
+        return [(node_id, name) for node_id, name, _ in self.matches(query, limit)]
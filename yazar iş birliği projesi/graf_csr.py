@@ -0,0 +1,191 @@
+"""Sıkıştırılmış (CSR) komşuluk dizileriyle çalışan isteğe bağlı graf motoru
+
+networkx grafında her kenar ve komşuluk girdisi bir sözlüktür. CSRGraph
+yazarları tamsayı indekslerle tutar; komşular ve ağırlıklar NumPy CSR
+dizilerinde, yazarların makale ID'leri ise makale deposundan alınan ikinci
+bir CSR dizisinde (yazar -> makale geliş dizisi) saklanır.
+
+Sorgular networkx ile aynı komşu sırasını ve aynı eşitlik bozma kuralını
+kullanır; bu yüzden iki motor aynı yolları döndürür.
+"""
+from heapq import heappush, heappop
+from itertools import count
+
+import numpy as np
+
+from graf_ego import DEFAULT_HOPS, EgoPaths, bounded_dijkstra
+
+
+class CSRGraph:
+    """İş birliği grafının CSR gösterimi"""
+
+    def __init__(self, node_ids, names, indptr, indices, weights, edge_u, edge_v,
+                 author_paper_ptr, author_papers, paper_titles, paper_dois):
+        self.node_ids = node_ids  # indeks -> düğüm ID'si
+        self.names = names  # indeks -> yazar adı
+        self.index = {node_id: i for i, node_id in enumerate(node_ids)}
+        # Komşuluk: indices[indptr[i]:indptr[i+1]] i düğümünün komşuları
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        # Kenar tablosu
+        self.edge_u = edge_u
+        self.edge_v = edge_v
+        # Yazar -> makale ID'leri: author_papers[author_paper_ptr[i]:author_paper_ptr[i+1]]
+        self.author_paper_ptr = author_paper_ptr
+        self.author_papers = author_papers
+        # Makale tablosu (makale ID'si -> başlık / DOI)
+        self.paper_titles = paper_titles
+        self.paper_dois = paper_dois
+
+        self_loops = edge_u == edge_v
+        # networkx'te kendi kendine döngü dereceye iki kez sayılır
+        self.degrees = np.diff(indptr) + np.bincount(edge_u[self_loops], minlength=len(node_ids))
+
+    @classmethod
+    def from_collaboration_graph(cls, cg):
+        """CollaborationGraph'tan CSR motorunu oluştur (komşu sırası korunur)"""
+        G = cg.G
+        node_ids = list(G.nodes())
+        index = {node: i for i, node in enumerate(node_ids)}
+        names = [G.nodes[node]['name'] for node in node_ids]
+
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum([len(G.adj[node]) for node in node_ids], out=indptr[1:])
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        weights = np.empty(indptr[-1], dtype=np.int64)
+
+        edge_u, edge_v = [], []
+        pos = 0
+        for i, node in enumerate(node_ids):
+            for nbr, data in G.adj[node].items():
+                j = index[nbr]
+                # Her kenar bir kez, küçük indeksli uçtan kaydedilir
+                if i <= j:
+                    edge_u.append(i)
+                    edge_v.append(j)
+                indices[pos] = j
+                weights[pos] = data.get('weight', 1)
+                pos += 1
+
+        papers = cg.papers
+        author_paper_ptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum([len(papers.papers_of(node)) for node in node_ids], out=author_paper_ptr[1:])
+        author_papers = np.fromiter(
+            (p for node in node_ids for p in papers.papers_of(node)),
+            dtype=np.int32, count=author_paper_ptr[-1],
+        )
+        return cls(
+            node_ids, names, indptr, indices, weights,
+            np.array(edge_u, dtype=np.int32), np.array(edge_v, dtype=np.int32),
+            author_paper_ptr, author_papers, list(papers.titles), list(papers.dois),
+        )
+
+    @property
+    def number_of_nodes(self):
+        return len(self.node_ids)
+
+    @property
+    def number_of_edges(self):
+        return len(self.edge_u)
+
+    def nbytes(self):
+        """CSR ve kenar dizilerinin bellek kullanımı (bayt)"""
+        arrays = (self.indptr, self.indices, self.weights, self.edge_u, self.edge_v,
+                  self.author_paper_ptr, self.author_papers, self.degrees)
+        return sum(a.nbytes for a in arrays)
+
+    def _adjacency(self, i):
+        a, b = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[a:b].tolist(), self.weights[a:b].tolist())
+
+    def neighbors(self, node_id):
+        """Komşu düğüm ID'leri (networkx ile aynı sırada)"""
+        i = self.index[node_id]
+        node_ids = self.node_ids
+        return [node_ids[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]].tolist()]
+
+    def degree(self, node_id):
+        return int(self.degrees[self.index[node_id]])
+
+    def papers_of(self, node_id):
+        """Yazarın makale ID'leri (artan sırada)"""
+        i = self.index[node_id]
+        return self.author_papers[self.author_paper_ptr[i]:self.author_paper_ptr[i + 1]]
+
+    def edge_papers_between(self, u_id, v_id):
+        """İki yazarın ortak makale ID'leri, kenar yoksa boş liste"""
+        i, j = self.index[u_id], self.index[v_id]
+        if not np.any(self.indices[self.indptr[i]:self.indptr[i + 1]] == j):
+            return []
+        if i == j:
+            return self.papers_of(u_id).tolist()
+        return np.intersect1d(self.papers_of(u_id), self.papers_of(v_id), assume_unique=True).tolist()
+
+    def max_degree_node(self):
+        """En yüksek dereceli düğüm ve derecesi; tüm dereceler 0 ise (None, 0)"""
+        if self.number_of_nodes == 0:
+            return None, 0
+        i = int(np.argmax(self.degrees))
+        if self.degrees[i] == 0:
+            return None, 0
+        return self.node_ids[i], int(self.degrees[i])
+
+    def shortest_path(self, source_id, target_id):
+        """Ağırlıklı en kısa yol (çift yönlü Dijkstra), yol yoksa None
+
+        nx.bidirectional_dijkstra ile aynı genişletme sırasını izler.
+        """
+        source, target = self.index[source_id], self.index[target_id]
+        if source == target:
+            return [source_id]
+
+        dists = [{}, {}]
+        preds = [{source: None}, {target: None}]
+        seen = [{source: 0}, {target: 0}]
+        fringe = [[], []]
+        c = count()
+        heappush(fringe[0], (0, next(c), source))
+        heappush(fringe[1], (0, next(c), target))
+        finaldist = None
+        meetnode = None
+        direction = 1
+        while fringe[0] and fringe[1]:
+            direction = 1 - direction
+            dist, _, v = heappop(fringe[direction])
+            if v in dists[direction]:
+                continue
+            dists[direction][v] = dist
+            if v in dists[1 - direction]:
+                forward = []
+                node = meetnode
+                while node is not None:
+                    forward.append(node)
+                    node = preds[0][node]
+                forward.reverse()
+                node = preds[1][meetnode]
+                while node is not None:
+                    forward.append(node)
+                    node = preds[1][node]
+                return [self.node_ids[i] for i in forward]
+
+            dist_dir, seen_dir, seen_other = dists[direction], seen[direction], seen[1 - direction]
+            for w, cost in self._adjacency(v):
+                length = dist + cost
+                if w in dist_dir:
+                    continue
+                if w not in seen_dir or length < seen_dir[w]:
+                    seen_dir[w] = length
+                    heappush(fringe[direction], (length, next(c), w))
+                    preds[direction][w] = v
+                    if w in seen_other:
+                        total = length + seen_other[w]
+                        if finaldist is None or finaldist > total:
+                            finaldist, meetnode = total, w
+        return None
+
+    def ego_paths(self, node_id, k=DEFAULT_HOPS, cutoff=None):
+        """Yazarın k adımlık çevresindeki en kısa yollar (EgoPaths)"""
+        settled, pred, dist = bounded_dijkstra(self.index[node_id], self._adjacency, k, cutoff)
+        node_ids = self.node_ids
+        return EgoPaths([node_ids[i] for i in settled], pred, dist)
@@ -0,0 +1,67 @@
+"""Büyük graflar için ayrıntı düzeyi (level of detail) seçimi
+
+Görünüm alanı (xlim, ylim) değiştiğinde yalnızca görünen öğeler çizilir:
+
+- Kenarlar: görünüm alanını kesen kenarlar; sayıları max_edges'i aşarsa
+  (uzaklaşılmış görünüm) yalnızca en ağır kenarlar çizilir.
+- Düğümler: görünüm alanı (ve küçük bir kenar payı) içindekiler.
+- Etiketler: görünüm içindeki aday düğümlerden boyutu min_label_size'dan
+  büyük olanların en büyük max_labels tanesi.
+
+Seçim yalnızca NumPy dizileriyle yapılır; çizim arayüzün işidir.
+"""
+import numpy as np
+
+
+class DetailLevels:
+    """Görünüm alanına göre çizilecek kenar, düğüm ve etiket indeksleri"""
+
+    def __init__(self, coords, edges, edge_weights, node_sizes, label_nodes=None,
+                 max_edges=4000, max_labels=80, min_label_size=0, margin=0.05):
+        self.coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        weights = np.asarray(edge_weights, dtype=float)
+        sizes = np.asarray(node_sizes, dtype=float)
+        self.max_edges = max_edges
+        self.max_labels = max_labels
+        self.margin = margin
+
+        # Kenarlar ağırlığa göre azalan sırada; her kenarın sınır kutusu
+        self.edge_order = np.argsort(-weights, kind='stable')
+        ends = self.coords[edges[self.edge_order]]  # (m, 2 uç, 2 eksen)
+        self.edge_min = ends.min(axis=1) if len(ends) else np.empty((0, 2))
+        self.edge_max = ends.max(axis=1) if len(ends) else np.empty((0, 2))
+
+        # Etiket adayları boyuta göre azalan sırada
+        if label_nodes is None:
+            label_nodes = np.arange(len(sizes))
+        label_nodes = np.asarray(label_nodes, dtype=np.int64)
+        label_nodes = label_nodes[sizes[label_nodes] >= min_label_size]
+        self.label_order = label_nodes[np.argsort(-sizes[label_nodes], kind='stable')]
+
+    @staticmethod
+    def _bounds(xlim, ylim):
+        return min(xlim), max(xlim), min(ylim), max(ylim)
+
+    def visible_edges(self, xlim, ylim):
+        """Görünüm alanını kesen kenarlar (artan indeks sırasıyla)"""
+        x0, x1, y0, y1 = self._bounds(xlim, ylim)
+        inside = ((self.edge_max[:, 0] >= x0) & (self.edge_min[:, 0] <= x1)
+                  & (self.edge_max[:, 1] >= y0) & (self.edge_min[:, 1] <= y1))
+        # Sıra ağırlığa göre olduğundan ilk max_edges kenar en ağırlarıdır
+        ids = self.edge_order[inside][:self.max_edges]
+        return np.sort(ids)
+
+    def visible_nodes(self, xlim, ylim):
+        """Görünüm alanı ve kenar payı içindeki düğümler"""
+        x0, x1, y0, y1 = self._bounds(xlim, ylim)
+        mx, my = (x1 - x0) * self.margin, (y1 - y0) * self.margin
+        x, y = self.coords[:, 0], self.coords[:, 1]
+        return np.flatnonzero((x >= x0 - mx) & (x <= x1 + mx) & (y >= y0 - my) & (y <= y1 + my))
+
+    def visible_labels(self, xlim, ylim):
+        """Görünüm içindeki en büyük max_labels etiket adayı"""
+        x0, x1, y0, y1 = self._bounds(xlim, ylim)
+        x, y = self.coords[self.label_order, 0], self.coords[self.label_order, 1]
+        inside = (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+        return self.label_order[inside][:self.max_labels]
@@ -0,0 +1,135 @@
+"""Yazarın k adımlık çevresinde (ego ağı) en kısa yollar
+
+function5_shortest_paths_from_a önceden 2 adımlık bir G.subgraph görünümü
+oluşturup üzerinde single_source_dijkstra_path çalıştırıyordu. Görünümün
+filtreli komşulukları her komşu gezinmesinde ek maliyet getiriyor ve her
+hedef için tam yol listesi kuruluyordu.
+
+bounded_dijkstra doğrudan komşuluk üzerinde çalışır:
+
+- Önce kaynaktan en fazla k adımdaki yazarlar BFS ile işaretlenir; Dijkstra
+  yalnızca bu yazarlardan geçer (eski 2 adımlık alt grafla aynı yollar).
+- cutoff verilirse ağırlıklı uzaklığı cutoff'u aşan yazarlara gidilmez.
+- Sonuç yol listeleri değil öncül dizileridir: yazarlar yerleşme sırasıyla
+  (artan uzaklık) tutulur, her yazar için öncülünün konumu saklanır.
+  EgoPaths yolları yalnızca istenen hedefler için geri kurar.
+
+Eşitlik bozma nx.single_source_dijkstra ile aynıdır: aynı komşuluk sırası ve
+yalnızca daha kısa uzaklıkta öncül güncellenir.
+"""
+from heapq import heappush, heappop
+from itertools import count
+
+DEFAULT_HOPS = 2
+
+
+def bounded_dijkstra(source, neighbors, k=DEFAULT_HOPS, cutoff=None):
+    """Adım ve uzaklık sınırlı tek kaynaklı Dijkstra
+
+    neighbors(v) v'nin (komşu, ağırlık) çiftlerini verir. k None ise adım
+    sınırı yoktur. (yerleşen düğümler, öncül konumları, uzaklıklar) döndürür;
+    kaynak ilk düğümdür ve öncülü -1'dir.
+    """
+    allowed = None
+    if k is not None:
+        allowed = {source}
+        frontier = [source]
+        for _ in range(k):
+            next_frontier = []
+            for v in frontier:
+                for w, _ in neighbors(v):
+                    if w not in allowed:
+                        allowed.add(w)
+                        next_frontier.append(w)
+            frontier = next_frontier
+
+    settled, preds, dists = [], [], []
+    position = {}  # yerleşen düğüm -> konum
+    seen = {source: 0}
+    pred = {source: -1}
+    fringe = [(0, 0, source)]
+    c = count(1)
+    while fringe:
+        d, _, v = heappop(fringe)
+        if v in position:
+            continue
+        i = len(settled)
+        position[v] = i
+        settled.append(v)
+        preds.append(pred[v])
+        dists.append(d)
+        for w, cost in neighbors(v):
+            if allowed is not None and w not in allowed:
+                continue
+            length = d + cost
+            if cutoff is not None and length > cutoff:
+                continue
+            if w in position:
+                continue
+            if w not in seen or length < seen[w]:
+                seen[w] = length
+                heappush(fringe, (length, next(c), w))
+                pred[w] = i
+    return settled, preds, dists
+
+
+class EgoPaths:
+    """Kaynaktan çevredeki yazarlara en kısa yollar (öncül dizileriyle)
+
+    Hedefler artan uzaklık sırasıyla gezilir; kaynak hedef sayılmaz.
+    items() (hedef, yol) çiftlerini tembel olarak verir.
+    """
+
+    def __init__(self, node_ids, pred, dist):
+        self.node_ids = node_ids  # yerleşme sırasıyla; 0 kaynaktır
+        self.pred = pred
+        self.dist = dist
+        self.position = {node: i for i, node in enumerate(node_ids)}
+
+    @property
+    def source(self):
+        return self.node_ids[0]
+
+    def __len__(self):
+        return len(self.node_ids) - 1
+
+    def __contains__(self, target):
+        return self.position.get(target, 0) > 0
+
+    def __iter__(self):
+        return iter(self.node_ids[1:])
+
+    def distance(self, target):
+        """Hedefin ağırlıklı uzaklığı; çevrede değilse KeyError"""
+        return self.dist[self.position[target]]
+
+    def path(self, target):
+        """Kaynaktan hedefe yol (düğüm listesi); çevrede değilse KeyError"""
+        node_ids, pred = self.node_ids, self.pred
+        i = self.position[target]
+        path = []
+        while i >= 0:
+            path.append(node_ids[i])
+            i = pred[i]
+        path.reverse()
+        return path
+
+    def items(self):
+        for target in self:
+            yield target, self.path(target)
+
+    def paths(self, targets=None):
+        """Hedef -> yol sözlüğü (targets verilmezse tüm hedefler)"""
+        if targets is None:
+            targets = self
+        return {target: self.path(target) for target in targets}
+
+
+def ego_paths(G, author_id, k=DEFAULT_HOPS, cutoff=None):
+    """networkx grafında yazarın k adımlık çevresindeki en kısa yollar"""
+    adj = G.adj
+
+    def neighbors(v):
+        return [(w, data.get('weight', 1)) for w, data in adj[v].items()]
+
+    return EgoPaths(*bounded_dijkstra(author_id, neighbors, k, cutoff))
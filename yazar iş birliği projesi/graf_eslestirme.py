@@ -0,0 +1,249 @@
+"""Yazar adı varyantları için varlık çözümleme (entity resolution)
+
+AuthorNameIndex yalnızca büyük/küçük harf ve boşluk farkı olan adları
+birleştirir. Bu modül ayrıştırılmış (makale, yazar) tablosundaki adları
+ölçeklenebilir biçimde eşleştirir:
+
+- Katlama: bozuk kodlanmış (UTF-8'i cp1252 olarak okunmuş) adlar onarılır,
+  Türkçe ve diğer aksanlı harfler ASCII'ye indirgenir, unvanlar (Dr, Prof)
+  ve noktalama atılır, bitişik baş harfler ("RK") ayrılır.
+- Bloklama: adlar yalnızca aynı (soyad, ilk baş harf) bloğundaki adlarla
+  karşılaştırılır; karşılaştırma sayısı blok boyutlarının karelerinin
+  toplamıdır, tüm çiftlerin değil.
+- Puanlama: blok içinde adların harf 3-gram vektörleri NumPy ile tek
+  matris çarpımında karşılaştırılır (kosinüs benzerliği). Biri diğerinin
+  kısaltması olan adlar ("J Smith" ~ "John Smith") ve benzerliği eşiği
+  geçen adlar aday olur. Bir ad ancak kümenin tüm üyeleriyle uyumluysa
+  kümeye katılır; böylece "A Kumar" gibi kısa adlar farklı kişileri
+  birbirine zincirleyemez.
+- Eşitlik bozma: bir ad birden fazla kümeye uyuyorsa ortak yazar örtüşmesi
+  en yüksek olan küme seçilir; örtüşme de ayırt etmiyorsa ad birleştirilmez.
+
+Sonuç, varyant -> kanonik ad eşlemesi ve birleştirme raporudur. Kanonik ad
+kümede en sık geçen yazılıştır (sabit adlar varsa onlardan biri).
+"""
+import re
+import unicodedata
+from collections import Counter, defaultdict
+
+import numpy as np
+
+SIMILARITY_THRESHOLD = 0.8
+
+# Ayrışmayan harfler (NFKD ile ASCII'ye inmeyenler)
+_LETTERS = str.maketrans({"ı": "i", "İ": "I", "ł": "l", "Ł": "L", "ø": "o", "Ø": "O",
+                          "đ": "d", "Đ": "D", "ß": "ss", "æ": "ae", "Æ": "AE"})
+_MOJIBAKE_MARKERS = ("Ã", "Å", "Ä")
+_TITLE_RE = re.compile(r'^(?:Dr|Prof|Mr|Mrs|Ms)\.?\s*(?=[A-Z])')
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def _repair_encoding(name):
+    """cp1252 olarak okunmuş UTF-8 adı ("GarcÃ­a") onar; onarılamazsa aynen döndür"""
+    if any(marker in name for marker in _MOJIBAKE_MARKERS):
+        try:
+            return name.encode('cp1252').decode('utf-8')
+        except UnicodeError:
+            pass
+    return name
+
+
+def fold_name(name):
+    """Adı karşılaştırma için ASCII, küçük harfli parçalara indir"""
+    text = _TITLE_RE.sub('', _repair_encoding(name.strip())).translate(_LETTERS)
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    tokens = []
+    for token in _TOKEN_RE.findall(text):
+        # Bitişik baş harfler ("RK Gupta", "MUF Khan") ayrı baş harflerdir
+        if 1 < len(token) <= 3 and token.isupper():
+            tokens.extend(token.lower())
+        else:
+            tokens.append(token.lower())
+    return tuple(tokens)
+
+
+def block_key(tokens):
+    """Bloklama anahtarı: (soyad, ilk adın baş harfi)"""
+    if not tokens:
+        return None
+    return tokens[-1], tokens[0][0] if len(tokens) > 1 else ''
+
+
+def abbreviates(short, full):
+    """short, full'un kısaltması mı ("j" ~ "john", "rajeev k" ~ "rajeev kumar")
+
+    short'un her parçası full'un ilk parçaları hizalı bir alt dizisindeki
+    parçayla aynı ya da onun baş harfi olmalıdır.
+    """
+    if not short or len(short) > len(full):
+        return False
+
+    def match(x, y):
+        return x == y or (len(x) == 1 and y[0] == x)
+
+    if not match(short[0], full[0]):
+        return False
+    j = 1
+    for token in short[1:]:
+        while j < len(full) and not match(token, full[j]):
+            j += 1
+        if j == len(full):
+            return False
+        j += 1
+    return True
+
+
+def compatible(given_a, given_b):
+    """Ad parçalarından biri diğerinin kısaltması mı"""
+    return abbreviates(given_a, given_b) or abbreviates(given_b, given_a)
+
+
+def _similarity_matrix(strings):
+    """Harf 3-gram vektörlerinin kosinüs benzerlik matrisi"""
+    vocab = {}
+    rows, cols = [], []
+    for i, text in enumerate(strings):
+        padded = f"  {text} "
+        for gram in {padded[k:k + 3] for k in range(len(padded) - 2)}:
+            rows.append(i)
+            cols.append(vocab.setdefault(gram, len(vocab)))
+    vectors = np.zeros((len(strings), len(vocab)), dtype=np.float32)
+    vectors[rows, cols] = 1.0
+    vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    return vectors @ vectors.T
+
+
+class _Clusters:
+    """Birleşim-bul (union-find)"""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a, b):
+        self.parent[self.find(a)] = self.find(b)
+
+
+def resolve_name_variants(table, fixed_names=(), threshold=SIMILARITY_THRESHOLD):
+    """(paper, author) tablosundaki ad varyantlarını eşleştir
+
+    fixed_names mevcut (yeniden adlandırılamayacak) adlardır; bir kümede
+    sabit ad varsa kanonik ad onlardan seçilir. (varyant -> kanonik ad
+    eşlemesi, rapor) döndürür; rapor (kanonik ad, varyantlar, neden)
+    listesidir ve eşlemede yalnızca adı değişen varyantlar bulunur.
+    """
+    fixed_names = set(fixed_names)
+    occurrences = Counter(table['author'].tolist())
+    for name in fixed_names:
+        occurrences.setdefault(name, 0)
+    names = list(occurrences)
+    folded = [fold_name(name) for name in names]
+
+    # Aynı katlanmış parçalara sahip adlar tek "biçim"dir
+    form_index = {}
+    form_of_name = [form_index.setdefault(tokens, len(form_index)) for tokens in folded]
+    forms = list(form_index)
+
+    # Ortak yazar imzası: biçimin birlikte göründüğü blok anahtarları
+    name_position = {name: i for i, name in enumerate(names)}
+    signature = [set() for _ in forms]
+    by_paper = defaultdict(list)
+    for paper, author in zip(table['paper'].tolist(), table['author'].tolist()):
+        by_paper[paper].append(form_of_name[name_position[author]])
+    for members in by_paper.values():
+        keys = {block_key(forms[f]) for f in members}
+        for f in members:
+            signature[f].update(keys - {block_key(forms[f])})
+
+    clusters = _Clusters(len(forms))
+    reasons = {}
+    blocks = defaultdict(list)
+    for f, tokens in enumerate(forms):
+        key = block_key(tokens)
+        if key is not None and key[1]:
+            blocks[key].append(f)
+
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        given = [forms[f][:-1] for f in members]
+        sim = _similarity_matrix([" ".join(g) for g in given])
+        # Önce en ayrıntılı biçimler; daha az ayrıntılı biçim onlara bağlanır
+        detail = [sum(len(t) for t in g) for g in given]
+        order = sorted(range(len(members)), key=lambda i: (-detail[i], i))
+        processed = []
+        cluster_members = defaultdict(list)  # küme kökü -> bloktaki üye konumları
+
+        def match(i, j):
+            if compatible(given[i], given[j]):
+                return "kısaltma"
+            if sim[i, j] >= threshold and len(given[i]) == len(given[j]):
+                return "benzerlik"
+            return None
+
+        for i in order:
+            candidates = {}
+            for j in processed:
+                reason = match(i, j)
+                if reason is None:
+                    continue
+                root = clusters.find(members[j])
+                best = candidates.get(root)
+                if best is None or sim[i, j] > best[0]:
+                    candidates[root] = (float(sim[i, j]), reason)
+            processed.append(i)
+            # Kümenin tüm üyeleriyle uyumlu olmayan adaylar elenir
+            candidates = {root: c for root, c in candidates.items()
+                          if all(match(i, j) is not None for j in cluster_members[root])}
+            if not candidates:
+                cluster_members[clusters.find(members[i])].append(i)
+                continue
+
+            if len(candidates) == 1:
+                (root, (_, reason)), = candidates.items()
+            else:
+                # Ortak yazar örtüşmesi en yüksek küme; eşitlikte birleştirme yok
+                own = signature[members[i]]
+                overlap = {root: len(own & signature[root]) for root in candidates}
+                ranked = sorted(overlap.values(), reverse=True)
+                if ranked[0] == 0 or ranked[0] == ranked[1]:
+                    # Birleşmeyen ad kendi kümesinin üyesi olarak kaydedilir;
+                    # yoksa sonraki adlar onunla uyumluluk kontrolünü atlar
+                    cluster_members[clusters.find(members[i])].append(i)
+                    continue
+                root = max(overlap, key=overlap.get)
+                reason = candidates[root][1] + " (ortak yazar)"
+            f = members[i]
+            clusters.union(f, root)
+            new_root = clusters.find(f)
+            signature[new_root] = signature[f] | signature[root]
+            cluster_members[new_root] = cluster_members.pop(root) + [i]
+            reasons[new_root] = reasons.pop(root, []) + reasons.pop(f, []) + [reason]
+
+    # Kümelerin kanonik adı: sabit adlar önce, sonra en sık, en uzun, ilk görülen
+    groups = defaultdict(list)
+    for i, name in enumerate(names):
+        groups[clusters.find(form_of_name[i])].append(i)
+    mapping, report = {}, []
+    for root, group in groups.items():
+        if len(group) < 2:
+            continue
+        canonical = names[min(group, key=lambda i: (names[i] not in fixed_names, -occurrences[names[i]],
+                                                    -len(names[i]), i))]
+        variants = [names[i] for i in group if names[i] != canonical and names[i] not in fixed_names]
+        if not variants:
+            continue
+        for variant in variants:
+            mapping[variant] = canonical
+        kinds = set(reasons.get(root, []))
+        if len({form_of_name[i] for i in group}) < len(group):
+            kinds.add("yazım")  # yalnızca harf, aksan veya noktalama farkı
+        report.append((canonical, variants, ", ".join(sorted(kinds))))
+    return mapping, report
@@ -0,0 +1,157 @@
+"""Analizleri arka planda çalıştıran görev havuzu
+
+Tk arayüzü tek iş parçacıklıdır; uzun bir analiz ana döngüde çalışırsa
+pencere donar. Analizler bu yüzden bir iş parçacığı havuzunda çalışır:
+
+- Sonuç, hata ve ilerleme bildirimleri iş parçacığı güvenli bir kuyruğa
+  yazılır. Arayüz kuyruğu schedule (Tk'de root.after) ile düzenli
+  aralıklarla boşaltır; geri çağırmalar her zaman ana iş parçacığında çalışır.
+- İptal iş birliğine dayalıdır: görev fonksiyonu task.check() ile (veya
+  task.cancelled özelliğini sorarak) iptal edilip edilmediğini denetler.
+  İptal edilen görevin sonucu arayüze iletilmez.
+- Aynı anda birden fazla görev çalışabilir. Görevler grafı yalnızca okur;
+  çalışan görev varken (busy) graf değiştirilmemelidir.
+
+Havuz süreç değil iş parçacığı kullanır: her sorgu için grafın başka bir
+sürece kopyalanması sorgunun kendisinden pahalıdır.
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskCancelled(Exception):
+    """Görev iptal edildiğinde task.check() tarafından yükseltilir"""
+
+
+class Task:
+    """Havuzda çalışan tek bir analiz; iptal bayrağı ve ilerleme bildirimi"""
+
+    def __init__(self, runner, name, on_done=None, on_error=None):
+        self.runner = runner
+        self.name = name
+        self.on_done = on_done
+        self.on_error = on_error
+        self.fraction = None  # bilinmiyorsa None, yoksa 0..1
+        self._cancel = threading.Event()
+        self._reported = -1
+        self.future = None
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def check(self):
+        """İptal edildiyse TaskCancelled yükselt"""
+        if self._cancel.is_set():
+            raise TaskCancelled(self.name)
+
+    def progress(self, done, total):
+        """İlerlemeyi bildir; yüzde değişmedikçe kuyruğa yazılmaz"""
+        percent = 100 * done // total if total else 100
+        if percent != self._reported:
+            self._reported = percent
+            self.runner._events.put(("progress", self, percent / 100))
+
+
+class TaskRunner:
+    """Görevleri havuza gönderir, sonuçları ana iş parçacığına taşır
+
+    schedule(ms, func) ana döngüde func'ı ms milisaniye sonra çalıştırmalıdır
+    (Tk'de root.after). on_change(runner) görev listesi veya ilerleme
+    değiştiğinde ana iş parçacığında çağrılır.
+    """
+
+    def __init__(self, schedule, max_workers=4, poll_ms=50, on_change=None):
+        self.schedule = schedule
+        self.poll_ms = poll_ms
+        self.on_change = on_change
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analiz")
+        self.active = []
+        self._events = queue.SimpleQueue()
+        self._polling = False
+
+    @property
+    def busy(self):
+        """Bitmemiş (iptal edilmiş ama hâlâ çalışan dahil) görev var mı"""
+        return bool(self.active)
+
+    def submit(self, name, func, on_done=None, on_error=None):
+        """func(task) fonksiyonunu havuzda çalıştır
+
+        on_done(sonuç) ve on_error(istisna) ana iş parçacığında çağrılır.
+        """
+        task = Task(self, name, on_done, on_error)
+        self.active.append(task)
+        task.future = self.executor.submit(self._run, task, func)
+        self._changed()
+        if not self._polling:
+            self._polling = True
+            self.schedule(self.poll_ms, self.poll)
+        return task
+
+    def _run(self, task, func):
+        # İş parçacığında çalışır: yalnızca kuyruğa yazar
+        try:
+            task.check()  # kuyrukta beklerken iptal edilmiş olabilir
+            result = func(task)
+        except TaskCancelled:
+            self._events.put(("cancelled", task, None))
+        except Exception as e:
+            self._events.put(("error", task, e))
+        else:
+            self._events.put(("done", task, result))
+
+    def cancel_all(self):
+        for task in self.active:
+            task.cancel()
+
+    def poll(self):
+        """Kuyruktaki olayları işle; görev kaldıkça yeniden zamanla"""
+        self._drain()
+        if self.active:
+            self.schedule(self.poll_ms, self.poll)
+        else:
+            self._polling = False
+
+    def _drain(self):
+        # Ana iş parçacığında çalışır: geri çağırmalar burada çağrılır
+        changed = False
+        while True:
+            try:
+                kind, task, value = self._events.get_nowait()
+            except queue.Empty:
+                break
+            changed = True
+            if kind == "progress":
+                task.fraction = value
+                continue
+            self.active.remove(task)
+            if task.cancelled:
+                continue
+            if kind == "done" and task.on_done is not None:
+                task.on_done(value)
+            elif kind == "error":
+                if task.on_error is None:
+                    raise value
+                task.on_error(value)
+        if changed:
+            self._changed()
+
+    def wait(self):
+        """Tüm görevler bitene kadar bekle ve sonuçlarını işle (betikler için)"""
+        while self.active:
+            for task in list(self.active):
+                task.future.exception()
+            self._drain()
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change(self)
+
+    def shutdown(self):
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,93 @@
+"""ORCID'e bağlı yazar kimlikleri
+
+Veri her (izlenen yazar, makale) için bir satırdır ve satırın orcid değeri
+yalnızca author_position konumundaki yazara (author_name) aittir. Eskiden
+ORCID makalenin tüm ortak yazarlarına verilirdi; ORCID'li grafta her izlenen
+yazar ortak yazarlarıyla tek düğümde toplanıyordu.
+
+- link_tracked_authors ORCID'i author_position konumundaki ortak yazara
+  bağlar. O konumdaki ad author_name ile uyuşmazsa makaledeki adlar
+  aranır; hiçbiri uyuşmazsa ORCID o makalede bağlanmaz.
+- AuthorIdentity ORCID <-> düğüm sözlüklerini iki yönlü tutar; düğümün
+  ORCID'i ve ORCID'in düğümü O(1) sürede bulunur.
+
+Yalnızca izlenen yazar ORCID'e bağlanır. Aynı ad başka makalelerde izlenmeden
+geçtiğinde ad tabanlı düğüme gider; bir ad birden fazla ORCID'e ait
+olabileceği için ORCID'siz satırlar adla tahmin edilmez.
+"""
+from graf_eslestirme import compatible, fold_name
+
+
+def same_person(folded_a, folded_b):
+    """Katlanmış iki ad aynı yazarı gösterebilir mi (aynı soyad, uyumlu ad)"""
+    if not folded_a or not folded_b:
+        return False
+    if folded_a == folded_b:
+        return True
+    return folded_a[-1] == folded_b[-1] and compatible(folded_a[:-1], folded_b[:-1])
+
+
+def link_tracked_authors(coauthors, tracked):
+    """Makalenin izlenen yazarlarını ortak yazar konumlarına bağla
+
+    coauthors makalenin ortak yazar adları, tracked (ORCID, ad, konum)
+    demetleridir (konum 1'den başlar). Her ortak yazar için bağlanan ORCID
+    veya None listesi döndürür.
+    """
+    links = [None] * len(coauthors)
+    bound = set()  # bu makalede bağlanan ORCID'ler
+    for orcid, name, position in tracked:
+        if orcid is None or orcid in bound:
+            continue
+        at = position - 1 if position is not None and 0 < position <= len(coauthors) else None
+        if name is None:
+            # Ad yoksa yalnızca konuma güvenilir
+            target = at
+        else:
+            folded = fold_name(name)
+            target = None
+            if at is not None and same_person(folded, fold_name(coauthors[at])):
+                target = at
+            else:
+                # Konum kaymışsa makalede adı uyuşan ilk bağlanmamış yazar
+                target = next((i for i, author in enumerate(coauthors)
+                               if links[i] is None and same_person(folded, fold_name(author))), None)
+        if target is not None and links[target] is None:
+            links[target] = orcid
+            bound.add(orcid)
+    return links
+
+
+class AuthorIdentity:
+    """ORCID <-> düğüm eşlemeleri"""
+
+    def __init__(self):
+        self.orcid_to_node = {}
+        self.node_to_orcid = {}
+
+    def __len__(self):
+        return len(self.orcid_to_node)
+
+    def node_of(self, orcid):
+        """ORCID'in düğümü, yoksa None"""
+        return self.orcid_to_node.get(orcid)
+
+    def orcid_of(self, node_id):
+        """Düğümün ORCID'i, yoksa None"""
+        return self.node_to_orcid.get(node_id)
+
+    def bind(self, orcid, node_id):
+        self.orcid_to_node[orcid] = node_id
+        self.node_to_orcid[node_id] = orcid
+
+    def unbind(self, node_id):
+        """Düğümün ORCID bağını kaldır; ORCID'i (yoksa None) döndür"""
+        orcid = self.node_to_orcid.pop(node_id, None)
+        if orcid is not None:
+            del self.orcid_to_node[orcid]
+        return orcid
+
+    def assign(self, coauthor_lists, tracked_lists):
+        """Makalelerin izlenen yazarlarına ORCID ata; makale başına ORCID veya None listeleri"""
+        return [link_tracked_authors(coauthors, tracked) if tracked else [None] * len(coauthors)
+                for coauthors, tracked in zip(coauthor_lists, tracked_lists)]
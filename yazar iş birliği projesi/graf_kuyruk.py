@@ -0,0 +1,199 @@
+"""İşbirlikçi kuyruğu: sınırlı en iyi k, tembel gezinme ve önceden sıralama
+
+function2_queue_by_weight her istekte yazarın tüm komşularını sıralardı.
+Binlerce işbirlikçisi olan merkez yazarlar için:
+
+- top_collaborators komşuların makale sayılarını ve kenar ağırlıklarını
+  NumPy dizilerine alır, ilk k yazarı np.partition ile seçer ve yalnızca
+  onları kararlı sıralar; öğe demetleri yalnızca bu k yazar için oluşturulur.
+- iter_collaborators sırayı aynı dizilerle bir kez hesaplar, öğeleri tembel
+  olarak verir.
+- CollaboratorRanking tüm yazarların işbirlikçilerini her anahtar için bir
+  kez (NumPy lexsort ile) sıralar; etkinse aynı yazar için tekrarlanan kuyruk
+  istekleri O(k) sürer. Graf değiştiğinde yalnızca etkilenen yazarların
+  (komşuluğu veya bir işbirlikçisinin makale sayısı değişenler) kuyrukları
+  yeniden sıralanır.
+
+Sıralama anahtarları (büyükten küçüğe):
+
+- 'papers': işbirlikçinin makale sayısı
+- 'weight': ortak makale sayısı (kenar ağırlığı)
+- 'composite': önce makale sayısı, eşitlikte kenar ağırlığı
+
+Eşitlikte komşuluk (G.neighbors) sırası korunur; üç yol da aynı sırayı verir.
+Kuyruk öğeleri (node_id, ad, makale sayısı) demetleridir.
+"""
+from itertools import repeat
+
+import numpy as np
+
+QUEUE_KEYS = ('papers', 'weight', 'composite')
+
+
+def _neighbor_arrays(cg, author_id):
+    """Komşular, adları ve (makale sayısı, kenar ağırlığı) dizileri (komşuluk sırasıyla)
+
+    Aramalar map ile yapılır; komşu başına Python düzeyinde demet oluşturulmaz.
+    """
+    adj = cg.G.adj[author_id]
+    neighbors = list(adj)
+    # author_name_to_id: düğüm ID'si -> ad (düğümün 'name' özniteliğiyle aynı)
+    names = list(map(cg.author_name_to_id.__getitem__, neighbors))
+    paper_counts = np.fromiter(map(cg.author_paper_counts.get, names, repeat(0)),
+                               dtype=np.int64, count=len(names))
+    weights = np.fromiter(map(dict.get, adj.values(), repeat('weight'), repeat(1)),
+                          dtype=np.int64, count=len(names))
+    return neighbors, names, paper_counts, weights
+
+
+def _check_key(key):
+    if key not in QUEUE_KEYS:
+        raise ValueError(f"Bilinmeyen sıralama anahtarı: {key} ({', '.join(QUEUE_KEYS)})")
+
+
+def _rank_values(key, paper_counts, weights):
+    """Artan sırada sıralanacak tek değer dizisi (küçük olan önce)"""
+    _check_key(key)
+    if key == 'papers':
+        return -paper_counts
+    if key == 'weight':
+        return -weights
+    # 'composite': önce makale sayısı, eşitlikte kenar ağırlığı
+    scale = int(weights.max()) + 1 if len(weights) else 1
+    return -(paper_counts * scale + weights)
+
+
+def _ranked_positions(values, k=None):
+    """Değerlere göre ilk k komşunun konumları; eşitlikte komşuluk sırası korunur"""
+    if k is not None and k < len(values):
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        # k. en küçük değere eşit veya küçük olanlar (eşitlerin tümü) adaydır
+        kth = np.partition(values, k - 1)[k - 1]
+        candidates = np.flatnonzero(values <= kth)
+        return candidates[np.argsort(values[candidates], kind='stable')][:k]
+    return np.argsort(values, kind='stable')
+
+
+def _lexsort_keys(position, counts, weights):
+    # lexsort'ta son anahtar birincildir
+    return {
+        'papers': (position, -counts),
+        'weight': (position, -weights),
+        'composite': (position, -weights, -counts),
+    }
+
+
+def top_collaborators(cg, author_id, k=None, key='papers'):
+    """Anahtara göre en iyi k işbirlikçi (k None ise tümü), sıralı liste"""
+    if cg.collaborator_ranking is not None:
+        return cg.collaborator_ranking.top(author_id, k, key)
+    neighbors, names, paper_counts, weights = _neighbor_arrays(cg, author_id)
+    values = _rank_values(key, paper_counts, weights)
+    return [(neighbors[i], names[i], int(paper_counts[i])) for i in _ranked_positions(values, k).tolist()]
+
+
+def iter_collaborators(cg, author_id, key='papers'):
+    """İşbirlikçileri anahtara göre sırayla, tembel olarak ver"""
+    if cg.collaborator_ranking is not None:
+        yield from cg.collaborator_ranking.iter_ranked(author_id, key)
+        return
+    neighbors, names, paper_counts, weights = _neighbor_arrays(cg, author_id)
+    for i in _ranked_positions(_rank_values(key, paper_counts, weights)).tolist():
+        yield neighbors[i], names[i], int(paper_counts[i])
+
+
+class CollaboratorRanking:
+    """Tüm yazarların işbirlikçileri, her sıralama anahtarı için önceden sıralı"""
+
+    def __init__(self, cg):
+        G = cg.G
+        self.node_ids = list(G.nodes())
+        self.index = {node: i for i, node in enumerate(self.node_ids)}
+        self.names = [G.nodes[node]['name'] for node in self.node_ids]
+        self.paper_counts = [cg.author_paper_counts.get(name, 0) for name in self.names]
+
+        degrees = [len(G.adj[node]) for node in self.node_ids]
+        self.indptr = np.zeros(len(self.node_ids) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=self.indptr[1:])
+        index = self.index
+        neighbors = np.fromiter((index[nbr] for node in self.node_ids for nbr in G.adj[node]),
+                                dtype=np.int32, count=int(self.indptr[-1]))
+        weights = np.fromiter((data.get('weight', 1) for node in self.node_ids
+                               for data in G.adj[node].values()),
+                              dtype=np.int64, count=int(self.indptr[-1]))
+        rows = np.repeat(np.arange(len(self.node_ids), dtype=np.int32), degrees)
+        counts = np.asarray(self.paper_counts, dtype=np.int64)[neighbors]
+        position = np.arange(len(neighbors))
+
+        # Satır en son (birincil) anahtardır; satırlar bitişik kalır
+        self.ranked = {key: neighbors[np.lexsort(keys + (rows,))]
+                       for key, keys in _lexsort_keys(position, counts, weights).items()}
+        # Graf değiştikten sonra yeniden sıralanan yazarlar: indeks -> anahtar -> sıralı komşular
+        self.overrides = {}
+
+    def _rank(self, G, author_id):
+        """Tek yazarın işbirlikçilerini her anahtar için sırala"""
+        adj = G.adj[author_id]
+        index, paper_counts = self.index, self.paper_counts
+        neighbors = np.fromiter((index[nbr] for nbr in adj), dtype=np.int32, count=len(adj))
+        weights = np.fromiter((data.get('weight', 1) for data in adj.values()), dtype=np.int64, count=len(adj))
+        counts = np.fromiter((paper_counts[j] for j in neighbors.tolist()), dtype=np.int64, count=len(adj))
+        position = np.arange(len(adj))
+        return {key: neighbors[np.lexsort(keys)] for key, keys in _lexsort_keys(position, counts, weights).items()}
+
+    def update(self, cg, changed, recounted):
+        """Graf değişikliğinden etkilenen kuyrukları yeniden sırala
+
+        changed komşuluğu değişen, recounted makale sayısı değişen yazarlardır;
+        makale sayısı değişen yazarın işbirlikçilerinin kuyrukları da etkilenir.
+        """
+        G = cg.G
+        index = self.index
+        for author_id in changed:
+            if author_id not in G and author_id in index:
+                self.overrides.pop(index.pop(author_id), None)
+        for author_id in changed | recounted:
+            if author_id not in G:
+                continue
+            name = G.nodes[author_id]['name']
+            if author_id not in index:
+                index[author_id] = len(self.node_ids)
+                self.node_ids.append(author_id)
+                self.names.append(name)
+                self.paper_counts.append(0)
+            self.paper_counts[index[author_id]] = cg.author_paper_counts.get(name, 0)
+
+        affected = {author_id for author_id in changed if author_id in G}
+        for author_id in recounted:
+            if author_id in G:
+                affected.update(G.adj[author_id])
+        for author_id in affected:
+            self.overrides[index[author_id]] = self._rank(G, author_id)
+
+    def _segment(self, author_id, key):
+        ranked = self.ranked.get(key)
+        if ranked is None:
+            _check_key(key)
+        i = self.index[author_id]
+        override = self.overrides.get(i)
+        if override is not None:
+            ranked = override[key]
+            return ranked, 0, len(ranked)
+        return ranked, int(self.indptr[i]), int(self.indptr[i + 1])
+
+    def _item(self, j):
+        return self.node_ids[j], self.names[j], self.paper_counts[j]
+
+    def top(self, author_id, k=None, key='papers'):
+        """En iyi k işbirlikçi; O(k)"""
+        ranked, start, end = self._segment(author_id, key)
+        if k is not None:
+            end = min(end, start + max(k, 0))
+        return [self._item(j) for j in ranked[start:end].tolist()]
+
+    def iter_ranked(self, author_id, key='papers'):
+        """İşbirlikçileri sırayla ver"""
+        ranked, start, end = self._segment(author_id, key)
+        for j in ranked[start:end]:
+            yield self._item(int(j))
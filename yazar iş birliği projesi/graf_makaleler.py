@@ -0,0 +1,157 @@
+"""Yazar <-> makale iki parçalı (bipartite) geliş deposu
+
+Makale başlığı ve DOI'si her makale için bir kez saklanır; her yazarın
+makaleleri artan makale ID'leri listesi olarak tutulur. Yazar grafındaki
+kenarlar (ortak yazarlık izdüşümü) bu depodan türetilir, bu yüzden makale
+bilgisi kenarlarda tekrar edilmez.
+
+Her makalenin tekilleştirme anahtarı (normalize DOI, yoksa normalize başlık)
+by_key sözlüğünde tutulur; yükleme zaten eklenmiş makaleleri bununla atlar.
+"""
+import re
+
+import pandas as pd
+
+_DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:)\s*', re.IGNORECASE)
+_TITLE_NOISE_RE = re.compile(r'[\W_]+')
+
+
+def coauthor_pairs(author_ids):
+    """Bir makaledeki tüm yazar çiftleri (yazar sırasıyla, i < j)"""
+    for i in range(len(author_ids)):
+        for j in range(i + 1, len(author_ids)):
+            yield author_ids[i], author_ids[j]
+
+
+def doi_key(doi):
+    """Normalize DOI: önekler atılır, küçük harfe çevrilir; DOI yoksa None"""
+    if pd.notna(doi):
+        key = _DOI_PREFIX_RE.sub('', str(doi).strip()).lower()
+        if key:
+            return key
+    return None
+
+
+def paper_key(title, doi):
+    """Makalenin tekilleştirme anahtarı: normalize DOI, yoksa normalize başlık
+
+    DOI'ler büyük/küçük harf duyarsızdır ve "https://doi.org/" gibi öneklerle
+    yazılabilir; başlıkta yalnızca harf ve rakamlar karşılaştırılır. DOI ve
+    başlık yoksa None döner (makale tekilleştirilemez).
+    """
+    key = doi_key(doi)
+    if key is not None:
+        return 'doi:' + key
+    if pd.notna(title):
+        key = ' '.join(_TITLE_NOISE_RE.sub(' ', str(title).lower()).split())
+        if key:
+            return 'title:' + key
+    return None
+
+
+class PaperStore:
+    """Makale tablosu ve yazar -> makale ID'leri eşlemesi"""
+
+    def __init__(self):
+        self.titles = []  # makale ID'si -> başlık
+        self.dois = []  # makale ID'si -> DOI
+        # Makale ID'si -> yazar ID'leri (makaledeki sırayla, tekrarlar dahil)
+        self.paper_authors = []
+        # Makale ID'si -> yazar adları (yazar sayımlarını geri almak için)
+        self.paper_author_names = []
+        # Yazar ID'si -> artan sırada makale ID'leri (her makale bir kez)
+        self.author_papers = {}
+        # Normalize DOI (doi_key) -> makale ID'leri
+        self.by_doi = {}
+        # Tekilleştirme anahtarı (paper_key) -> makale ID'si
+        self.by_key = {}
+        # Silinen makalelerin ID'leri (ID'ler yeniden kullanılmaz)
+        self.removed = set()
+        self._interned = {}
+
+    def __len__(self):
+        return len(self.titles)
+
+    @property
+    def number_of_papers(self):
+        return len(self.titles) - len(self.removed)
+
+    def _intern(self, value):
+        # Aynı başlık/DOI metni tek bir nesne olarak tutulur
+        if isinstance(value, str):
+            return self._interned.setdefault(value, value)
+        return value
+
+    def add_paper(self, title, doi, author_ids, author_names):
+        """Makaleyi ekle ve yeni makale ID'sini döndür"""
+        paper_id = len(self.titles)
+        doi = self._intern(doi)
+        self.titles.append(self._intern(title))
+        self.dois.append(doi)
+        self.paper_authors.append(list(author_ids))
+        self.paper_author_names.append(list(author_names))
+        for author_id in author_ids:
+            papers = self.author_papers.setdefault(author_id, [])
+            if not papers or papers[-1] != paper_id:
+                papers.append(paper_id)
+        key = doi_key(doi)
+        if key is not None:
+            self.by_doi.setdefault(key, []).append(paper_id)
+        key = paper_key(title, doi)
+        if key is not None:
+            self.by_key.setdefault(key, paper_id)
+        return paper_id
+
+    def remove_paper(self, paper_id):
+        """Makaleyi sil; (yazar ID'leri, yazar adları) döndürür"""
+        author_ids = self.paper_authors[paper_id]
+        author_names = self.paper_author_names[paper_id]
+        for author_id in dict.fromkeys(author_ids):
+            papers = self.author_papers[author_id]
+            papers.remove(paper_id)
+            if not papers:
+                del self.author_papers[author_id]
+        doi = self.dois[paper_id]
+        key = doi_key(doi)
+        if key is not None:
+            self.by_doi[key].remove(paper_id)
+            if not self.by_doi[key]:
+                del self.by_doi[key]
+        key = paper_key(self.titles[paper_id], doi)
+        if self.by_key.get(key) == paper_id:
+            del self.by_key[key]
+        self.paper_authors[paper_id] = []
+        self.paper_author_names[paper_id] = []
+        self.removed.add(paper_id)
+        return author_ids, author_names
+
+    def find_doi(self, doi):
+        """DOI'si verilen makalelerin ID'leri (önek ve büyük/küçük harf duyarsız)"""
+        return list(self.by_doi.get(doi_key(doi), []))
+
+    def papers_of(self, author_id):
+        """Yazarın makale ID'leri (artan sırada)"""
+        return self.author_papers.get(author_id, [])
+
+    def titles_of(self, author_id):
+        """Yazarın makale başlıkları, tekrarsız ve makale sırasıyla"""
+        return list(dict.fromkeys(self.titles[p] for p in self.papers_of(author_id)))
+
+    def shared_papers(self, author_a, author_b):
+        """İki yazarın ortak makale ID'leri (artan sırada)"""
+        a, b = self.papers_of(author_a), self.papers_of(author_b)
+        if author_a == author_b:
+            return list(a)
+        # Sıralı iki listenin kesişimi
+        shared = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] == b[j]:
+                shared.append(a[i])
+                i += 1
+                j += 1
+            elif a[i] < b[j]:
+                i += 1
+            else:
+                j += 1
+        return shared
@@ -0,0 +1,199 @@
+"""Önceden hesaplanan merkezilik indeksi: derece, ağırlıklı derece, PageRank, arasındalık
+
+function7_most_collaborative her çağrıda tüm düğümlerin derecesini geziyor
+ve yalnızca dereceyi raporluyordu. CentralityIndex graf yüklenirken bir kez
+oluşturulur (graf değiştiğinde yeniden) ve ölçüleri düğüm sırasıyla NumPy
+dizilerinde tutar:
+
+- 'degree': işbirlikçi sayısı (G.degree; kendi kendine döngü 2 sayılır)
+- 'weighted_degree': kenar ağırlıkları toplamı (ortak makale sayıları)
+- 'pagerank': ağırlıklı PageRank; kenar listesi (COO) üzerinde bincount ile
+  seyrek matris-vektör çarpımı ve kuvvet yinelemesi (nx.pagerank ile aynı
+  yakınsama ölçütü)
+- 'betweenness': örneklemeli yaklaşık arasındalık (adım sayısına göre en
+  kısa yollar, nx normalized=True ölçeği). Brandes algoritması rastgele
+  seçilen kaynaklardan çalıştırılır; her kaynakta BFS seviyeleri ve bağımlılık
+  birikimi NumPy ile seviye seviye hesaplanır. Örnek sayısı Hoeffding sınırından
+  seçilir: en fazla epsilon * n / (n - 1) hata, 1 - delta olasılıkla tüm
+  düğümler için aynı anda. Sınır düğüm sayısını aşarsa tüm kaynaklar
+  kullanılır (kesin sonuç). En pahalı ölçü olduğu için ilk istendiğinde
+  hesaplanır; hesaplama bir kilitle korunur, analiz iş parçacıklarından
+  gelen eşzamanlı istekler aynı hesaplamayı bekler.
+
+Her ölçü için azalan sıralama (eşitlikte graf sırası) bir kez yapılır;
+top(metric, k) O(k) sürer.
+"""
+import math
+import threading
+
+import numpy as np
+
+CENTRALITY_METRICS = ('degree', 'weighted_degree', 'pagerank', 'betweenness')
+
+PAGERANK_ALPHA = 0.85
+BETWEENNESS_EPSILON = 0.05
+BETWEENNESS_DELTA = 0.1
+
+
+def pagerank(n, src, dst, weight, alpha=PAGERANK_ALPHA, max_iter=100, tol=1.0e-6):
+    """Yönlü kenar listesinde (src -> dst, ağırlık) ağırlıklı PageRank
+
+    Çıkış ağırlığı olmayan düğümlerin değeri tüm düğümlere eşit dağıtılır.
+    L1 değişimi n * tol'un altına inince (en fazla max_iter adım) durur.
+    """
+    if n == 0:
+        return np.zeros(0)
+    out = np.bincount(src, weights=weight, minlength=n)
+    dangling = out == 0
+    share = np.divide(weight, out[src], out=np.zeros(len(weight)), where=out[src] != 0)
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        last = x
+        x = alpha * np.bincount(dst, weights=last[src] * share, minlength=n)
+        x += (alpha * last[dangling].sum() + 1.0 - alpha) / n
+        if np.abs(x - last).sum() < n * tol:
+            break
+    return x
+
+
+def betweenness_sample_size(n, epsilon=BETWEENNESS_EPSILON, delta=BETWEENNESS_DELTA):
+    """Hoeffding + birleşim sınırıyla gereken kaynak sayısı (en fazla n)"""
+    if n < 3:
+        return n
+    return min(n, math.ceil(math.log(2 * n / delta) / (2 * epsilon ** 2)))
+
+
+def _expand(indptr, indices, frontier):
+    """Öncü düğümlerin tüm komşulukları: (kaynak, komşu) dizileri"""
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    owners = np.repeat(frontier, counts)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+    return owners, indices[offsets]
+
+
+def _dependencies(indptr, indices, source, n):
+    """Tek kaynaktan Brandes bağımlılıkları (adım sayısına göre en kısa yollar)"""
+    dist = np.full(n, -1, dtype=np.int64)
+    sigma = np.zeros(n)
+    dist[source] = 0
+    sigma[source] = 1.0
+    frontier = np.array([source], dtype=np.int64)
+    dag = []  # seviye başına en kısa yol kenarları (u -> w)
+    level = 0
+    while len(frontier):
+        u, w = _expand(indptr, indices, frontier)
+        new = w[dist[w] == -1]
+        dist[new] = level + 1
+        on_path = dist[w] == level + 1
+        u, w = u[on_path], w[on_path]
+        sigma += np.bincount(w, weights=sigma[u], minlength=n)
+        dag.append((u, w))
+        frontier = np.unique(new)
+        level += 1
+
+    delta = np.zeros(n)
+    for u, w in reversed(dag):
+        delta += np.bincount(u, weights=sigma[u] / sigma[w] * (1.0 + delta[w]), minlength=n)
+    delta[source] = 0.0
+    return delta
+
+
+def approximate_betweenness(indptr, indices, epsilon=BETWEENNESS_EPSILON, delta=BETWEENNESS_DELTA, seed=0):
+    """Örneklemeli arasındalık (nx normalized=True ölçeği); (değerler, örnek sayısı)"""
+    n = len(indptr) - 1
+    samples = betweenness_sample_size(n, epsilon, delta)
+    if samples < n:
+        sources = np.random.default_rng(seed).choice(n, size=samples, replace=False)
+    else:
+        sources = np.arange(n)
+    total = np.zeros(n)
+    for s in sources.tolist():
+        total += _dependencies(indptr, indices, s, n)
+    if n < 3:
+        return total, samples
+    return total * (n / samples) / ((n - 1) * (n - 2)), samples
+
+
+class CentralityIndex:
+    """Düğüm sırasıyla merkezilik dizileri ve önceden sıralı liderlik tabloları"""
+
+    def __init__(self, cg, epsilon=BETWEENNESS_EPSILON, delta=BETWEENNESS_DELTA, seed=0):
+        G = cg.G
+        self.node_ids = list(G.nodes())
+        self.index = {node: i for i, node in enumerate(self.node_ids)}
+        self.names = [G.nodes[node]['name'] for node in self.node_ids]
+        self.epsilon, self.delta, self.seed = epsilon, delta, seed
+        n = len(self.node_ids)
+
+        index = self.index
+        m = G.number_of_edges()
+        u = np.fromiter((index[a] for a, _ in G.edges()), dtype=np.int64, count=m)
+        v = np.fromiter((index[b] for _, b in G.edges()), dtype=np.int64, count=m)
+        w = np.fromiter((data.get('weight', 1) for _, _, data in G.edges(data=True)), dtype=np.float64, count=m)
+        loop = u == v
+
+        values = {
+            'degree': np.bincount(u, minlength=n) + np.bincount(v, minlength=n),
+            'weighted_degree': np.bincount(u, weights=w, minlength=n) + np.bincount(v, weights=w, minlength=n),
+        }
+        if np.all(w == np.round(w)):
+            values['weighted_degree'] = values['weighted_degree'].astype(np.int64)
+        # PageRank için her kenar iki yönlü; kendi kendine döngü tek yönlü
+        cross = ~loop
+        values['pagerank'] = pagerank(n, np.concatenate([u, v[cross]]), np.concatenate([v, u[cross]]),
+                                      np.concatenate([w, w[cross]]))
+        self.values = values
+        self.order = {metric: np.argsort(-array, kind='stable') for metric, array in values.items()}
+
+        # Arasındalık için döngüsüz, iki yönlü CSR komşuluğu
+        src = np.concatenate([u[cross], v[cross]])
+        dst = np.concatenate([v[cross], u[cross]])
+        by_src = np.argsort(src, kind='stable')
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        self.indices = dst[by_src]
+        self.betweenness_samples = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def _ensure(self, metric):
+        if metric == 'betweenness':
+            if metric in self.order:
+                return
+            with self._lock:
+                # Kilidi bekleyen diğer iş parçacığı hesaplamış olabilir
+                if metric in self.order:
+                    return
+                values, samples = approximate_betweenness(
+                    self.indptr, self.indices, self.epsilon, self.delta, self.seed)
+                self.betweenness_samples = samples
+                self.values[metric] = values
+                # Sıralama en son yazılır: order'da olan ölçünün değerleri hazırdır
+                self.order[metric] = np.argsort(-values, kind='stable')
+        elif metric not in CENTRALITY_METRICS:
+            raise ValueError(f"Bilinmeyen merkezilik ölçüsü: {metric} ({', '.join(CENTRALITY_METRICS)})")
+
+    def value(self, node_id, metric='degree'):
+        """Düğümün ölçü değeri"""
+        self._ensure(metric)
+        return self.values[metric][self.index[node_id]].item()
+
+    def top(self, metric='degree', k=10):
+        """Ölçüye göre en yüksek k yazar: (node_id, ad, değer) listesi; O(k)"""
+        self._ensure(metric)
+        values = self.values[metric]
+        return [(self.node_ids[i], self.names[i], values[i].item()) for i in self.order[metric][:k].tolist()]
+
+    def most_collaborative(self):
+        """En yüksek dereceli düğüm ve derecesi; tüm dereceler 0 ise (None, 0)"""
+        if not self.node_ids:
+            return None, 0
+        i = int(self.order['degree'][0])
+        degree = int(self.values['degree'][i])
+        if degree == 0:
+            return None, 0
+        return self.node_ids[i], degree
@@ -0,0 +1,190 @@
+"""Tekrarlanan en kısa yol sorguları için önceden hesaplanan mesafe kahini
+
+Graf bir kez işlenir:
+
+- Bağlı bileşen etiketleri: farklı bileşendeki iki yazar için yol olmadığı
+  arama yapılmadan O(1) sürede anlaşılır.
+- ALT (A*, landmark, üçgen eşitsizliği): her büyük bileşende seçilen işaret
+  düğümlerinden tüm düğümlere ağırlıklı mesafeler saklanır. Sorgu sırasında
+  |d(L, t) - d(L, v)| alt sınırları çift yönlü A* aramasını hedefe yönlendirir.
+
+Sonuç her zaman ağırlıklı en kısa yoldur; eşit uzunlukta birden fazla yol
+varsa networkx'ten farklı (ama aynı uzunlukta) bir yol dönebilir.
+"""
+from heapq import heappush, heappop
+from itertools import count
+
+import numpy as np
+
+from graf_csr import CSRGraph
+
+
+class DistanceOracle:
+    """Bileşen etiketleri ve ALT işaret düğümleriyle en kısa yol sorguları"""
+
+    def __init__(self, csr, num_landmarks=8, min_component_size=64):
+        self.csr = csr
+        n = csr.number_of_nodes
+        indptr = csr.indptr.tolist()
+        indices = csr.indices.tolist()
+        weights = csr.weights.tolist()
+        # Komşuluk listeleri (kendi kendine döngüler yola katkı yapmaz)
+        self.adj = [
+            [(j, w) for j, w in zip(indices[indptr[i]:indptr[i + 1]], weights[indptr[i]:indptr[i + 1]]) if j != i]
+            for i in range(n)
+        ]
+        self.labels, self.component_sizes = self._component_labels()
+
+        # Bileşen -> işaret düğümleri; düğüm -> işaretlere mesafeler
+        self.landmarks = {}
+        self.landmark_dist = [()] * n
+        for label, size in enumerate(self.component_sizes):
+            if size >= min_component_size:
+                self._select_landmarks(label, num_landmarks)
+
+    @classmethod
+    def from_collaboration_graph(cls, cg, **kwargs):
+        csr = cg.csr if cg.csr is not None else CSRGraph.from_collaboration_graph(cg)
+        return cls(csr, **kwargs)
+
+    def _component_labels(self):
+        labels = np.full(len(self.adj), -1, dtype=np.int32)
+        sizes = []
+        for start in range(len(self.adj)):
+            if labels[start] >= 0:
+                continue
+            label = len(sizes)
+            labels[start] = label
+            stack = [start]
+            size = 0
+            while stack:
+                v = stack.pop()
+                size += 1
+                for w, _ in self.adj[v]:
+                    if labels[w] < 0:
+                        labels[w] = label
+                        stack.append(w)
+            sizes.append(size)
+        return labels, sizes
+
+    def _dijkstra(self, source):
+        """Tek kaynaklı ağırlıklı mesafeler (ulaşılamayanlar yok)"""
+        dist = {}
+        fringe = [(0, source)]
+        seen = {source: 0}
+        while fringe:
+            d, v = heappop(fringe)
+            if v in dist:
+                continue
+            dist[v] = d
+            for w, cost in self.adj[v]:
+                nd = d + cost
+                if w not in dist and (w not in seen or nd < seen[w]):
+                    seen[w] = nd
+                    heappush(fringe, (nd, w))
+        return dist
+
+    def _select_landmarks(self, label, num_landmarks):
+        """En uzak nokta sezgisiyle işaret düğümleri seç ve mesafeleri sakla"""
+        members = np.flatnonzero(self.labels == label).tolist()
+        degrees = self.csr.degrees
+        # İlk işaret: bileşendeki en yüksek dereceli düğümden en uzak düğüm
+        hub = max(members, key=lambda i: degrees[i])
+        far = self._dijkstra(hub)
+        current = max(far, key=far.get)
+
+        chosen, tables = [], []
+        closest = {v: float('inf') for v in members}
+        for _ in range(min(num_landmarks, len(members))):
+            dist = self._dijkstra(current)
+            chosen.append(current)
+            tables.append(dist)
+            for v in members:
+                if dist[v] < closest[v]:
+                    closest[v] = dist[v]
+            # Sonraki işaret: mevcut işaretlere en uzak düğüm
+            current = max(members, key=lambda v: closest[v])
+            if closest[current] == 0:
+                break
+
+        self.landmarks[label] = chosen
+        for v in members:
+            self.landmark_dist[v] = tuple(dist[v] for dist in tables)
+
+    def connected(self, source_id, target_id):
+        index = self.csr.index
+        return self.labels[index[source_id]] == self.labels[index[target_id]]
+
+    def lower_bound(self, source_id, target_id):
+        """İki yazar arasındaki ağırlıklı mesafe için ALT alt sınırı"""
+        index = self.csr.index
+        return self._bound(self.landmark_dist[index[source_id]], self.landmark_dist[index[target_id]])
+
+    @staticmethod
+    def _bound(a, b):
+        return max((abs(x - y) for x, y in zip(a, b)), default=0)
+
+    def shortest_path(self, source_id, target_id):
+        """Ağırlıklı en kısa yol (çift yönlü ALT A*), yol yoksa None"""
+        index = self.csr.index
+        s, t = index[source_id], index[target_id]
+        if self.labels[s] != self.labels[t]:
+            return None
+        if s == t:
+            return [source_id]
+
+        adj, ld, bound = self.adj, self.landmark_dist, self._bound
+        ld_s, ld_t = ld[s], ld[t]
+        potential_cache = {}
+
+        def potential(v):
+            # İleri yön potansiyeli; geri yön için işareti ters çevrilir
+            p = potential_cache.get(v)
+            if p is None:
+                p = potential_cache[v] = (bound(ld[v], ld_t) - bound(ld[v], ld_s)) / 2
+            return p
+
+        c = count()
+        dist = [{s: 0}, {t: 0}]  # kesinleşmemiş en iyi mesafeler
+        done = [set(), set()]
+        preds = [{s: None}, {t: None}]
+        fringe = [[(potential(s), next(c), s)], [(-potential(t), next(c), t)]]
+        best, meet = float('inf'), None
+        while fringe[0] and fringe[1]:
+            # Anahtarlar toplamı bulunan en iyi yoldan büyükse yol kesinleşmiştir
+            if fringe[0][0][0] + fringe[1][0][0] >= best:
+                break
+            direction = 0 if fringe[0][0][0] <= fringe[1][0][0] else 1
+            sign = 1 if direction == 0 else -1
+            _, _, v = heappop(fringe[direction])
+            if v in done[direction]:
+                continue
+            done[direction].add(v)
+            dist_dir, other = dist[direction], dist[1 - direction]
+            dv = dist_dir[v]
+            for w, cost in adj[v]:
+                nd = dv + cost
+                if w in done[direction] or nd >= dist_dir.get(w, float('inf')):
+                    continue
+                dist_dir[w] = nd
+                preds[direction][w] = v
+                heappush(fringe[direction], (nd + sign * potential(w), next(c), w))
+                if w in other and nd + other[w] < best:
+                    best, meet = nd + other[w], w
+            if v in other and dv + other[v] < best:
+                best, meet = dv + other[v], v
+
+        if meet is None:
+            return None
+        path = []
+        node = meet
+        while node is not None:
+            path.append(node)
+            node = preds[0][node]
+        path.reverse()
+        node = preds[1][meet]
+        while node is not None:
+            path.append(node)
+            node = preds[1][node]
+        node_ids = self.csr.node_ids
+        return [node_ids[i] for i in path]
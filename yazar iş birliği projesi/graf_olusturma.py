@@ -0,0 +1,856 @@
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+from graf_csr import CSRGraph
+from graf_mesafe import DistanceOracle
+from graf_arama import AuthorSearchIndex
+from graf_kuyruk import CollaboratorRanking
+from graf_merkezilik import CentralityIndex
+from graf_eslestirme import resolve_name_variants
+from graf_kimlik import AuthorIdentity
+from graf_makaleler import PaperStore, coauthor_pairs, paper_key
+
+# Excel dosyasının adı
+EXCEL_PATH = "PROLAB 3 - GÜNCEL DATASET (1).xlsx"
+
+title_col = 'paper_title'
+coauthors_col = 'coauthors'
+doi_col = 'doi'
+# Satırın izlenen yazarı (ORCID sütunu find_orcid_column ile bulunur)
+author_name_col = 'author_name'
+author_position_col = 'author_position'
+
+# Graf değiştiğinde eskimiş sayılıp ilk erişimde yeniden oluşturulan yapılar
+LAZY_DERIVED = ('csr', 'distance_oracle', 'centrality')
+
+# Yazar listelerinde denenecek ayırıcılar (uygulanma sırasıyla)
+AUTHOR_SEPARATORS = [';', '|', '\n', ' and ', ' & ', ',']
+EMPTY_AUTHOR_VALUES = ['nan', 'none', 'null', '']
+
+
+# Python liste literali biçimi: ['A. Parandaman','B. Rajakumar'] (\' kaçışlı)
+_QUOTED = r"'(?:[^'\\]|\\.)*'" r'|"(?:[^"\\]|\\.)*"'
+_LIST_LITERAL_RE = re.compile(rf"\[\s*(?:(?:{_QUOTED})\s*(?:,\s*(?:{_QUOTED})\s*)*,?\s*)?\]", re.DOTALL)
+_LIST_ITEM_RE = re.compile(r"'((?:[^'\\]|\\.)*)'" r'|"((?:[^"\\]|\\.)*)"', re.DOTALL)
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+
+def normalize_author_name(name):
+    """Yazar adını normalize et (büyük/küçük harf, boşluklar)"""
+    return name.strip().lower()
+
+def clean_author_name(name):
+    """Yazar adını temizle ve standardize et"""
+    # Noktalama işaretlerini temizle ve boşlukları normalize et
+    return ' '.join(name.replace('.', '').replace(',', '').replace(';', '').replace(':', '').split())
+
+class AuthorNameIndex:
+    """Normalize ad -> yazar ID indeksi (benzer yazar adı araması)
+
+    Önce tam normalize eşleşme, yoksa yalnızca boşluk farkı olan eşleşme
+    aranır. Her anahtar için ID'ler eklenme sırasıyla saklanır ve ilki
+    döndürülür; yani benzer adlı ilk kayıtlı yazar bulunur.
+    Anahtarın sahibi silinince anahtarı sıradaki ID devralır.
+    """
+
+    def __init__(self):
+        self.by_normalized = {}  # normalize ad -> ID'ler (eklenme sırasıyla)
+        self.by_compact = {}  # boşluksuz normalize ad -> ID'ler (eklenme sırasıyla)
+
+    def add(self, author_id, name):
+        normalized = normalize_author_name(name)
+        self.by_normalized.setdefault(normalized, []).append(author_id)
+        self.by_compact.setdefault(normalized.replace(' ', ''), []).append(author_id)
+
+    def remove(self, author_id, name):
+        """Yazarın add ile eklenen anahtarlarından ID'sini sil"""
+        normalized = normalize_author_name(name)
+        for index, key in ((self.by_normalized, normalized), (self.by_compact, normalized.replace(' ', ''))):
+            ids = index[key]
+            ids.remove(author_id)
+            if not ids:
+                del index[key]
+
+    def owner(self, normalized):
+        """Normalize anahtarı tutan ID, yoksa None"""
+        ids = self.by_normalized.get(normalized)
+        return ids[0] if ids else None
+
+    def lookup(self, name):
+        """Benzer yazarın ID'sini döndür, yoksa None"""
+        normalized = normalize_author_name(name)
+        # Tam eşleşme
+        author_id = self.owner(normalized)
+        if author_id is not None:
+            return author_id
+        # Çok benzer eşleşme (sadece boşluk farkı)
+        ids = self.by_compact.get(normalized.replace(' ', ''))
+        return ids[0] if ids else None
+
+def split_list_literal(authors_str):
+    """Liste literali biçimindeki yazar listesini öğelerine ayır
+
+    Biçim uymuyorsa None döndürür (ayırıcılı serbest metin sezgisi kullanılır).
+    """
+    if not (authors_str.startswith('[') and authors_str.endswith(']')):
+        return None
+    inner = authors_str[1:-1].strip()
+    # Hızlı yol: kaçışsız, tek tırnaklı ve boşluksuz ayrılmış öğeler
+    if inner.startswith("'") and inner.endswith("'") and '\\' not in inner and '"' not in inner:
+        items = inner[1:-1].split("','")
+        if inner.count("'") == 2 * len(items):
+            return items
+    if not _LIST_LITERAL_RE.fullmatch(authors_str):
+        return None
+    return [_ESCAPE_RE.sub(r'\1', item) if '\\' in item else item
+            for item in (single or double for single, double in _LIST_ITEM_RE.findall(authors_str))]
+
+def split_author_separators(authors_str):
+    """Serbest metin yazar listesini AUTHOR_SEPARATORS ile sırayla böl"""
+    raw_authors = [authors_str]
+
+    for sep in AUTHOR_SEPARATORS:
+        if any(sep in author for author in raw_authors):
+            new_raw_authors = []
+            for author in raw_authors:
+                if sep in author:
+                    new_raw_authors.extend(author.split(sep))
+                else:
+                    new_raw_authors.append(author)
+            raw_authors = new_raw_authors
+    return raw_authors
+
+def _clean_author(author):
+    """Ayrılmış tek yazar parçasını temizle; atlanacaksa None"""
+    author = author.strip()
+    # Boş değerleri atla
+    if not author or author.lower() in EMPTY_AUTHOR_VALUES:
+        return None
+
+    # Parantez içindeki bilgileri temizle ama yazar adını koru
+    if '(' in author:
+        # Parantez içindeki ORCID bilgilerini çıkar
+        lowered = author.lower()
+        if 'orcid' in lowered or 'doi' in lowered:
+            author = author.split('(')[0].strip()
+        # Diğer parantez içi bilgileri koru (üniversite, vb.)
+
+    # Tırnak işaretlerini temizle, adı standardize et
+    author = clean_author_name(author.strip('"\''))
+
+    # Sayısal değerleri atla (sadece tamamen sayısal olanları)
+    if not author or (author.isdigit() and len(author) < 4):  # Kısa sayısal değerleri atla
+        return None
+    return author
+
+def split_authors(authors_str, structured=True):
+    """Yazar listesini temizlenmemiş parçalarına ayır
+
+    Liste literalleri (['A. B', 'C. D']) öğe öğe ayrılır; diğer biçimlerde
+    (veya structured=False ise) ayırıcılar sırayla denenir.
+    """
+    raw_authors = split_list_literal(authors_str) if structured else None
+    if raw_authors is None:
+        raw_authors = split_author_separators(authors_str)
+    return raw_authors
+
+def parse_authors(authors_str, structured=True):
+    """Yazar string'ini ayrıştır ve temizle - TÜM YAZARLARI AL"""
+    if pd.isna(authors_str):
+        return []
+
+    authors_str = str(authors_str).strip()
+    if not authors_str or authors_str.lower() in EMPTY_AUTHOR_VALUES:
+        return []
+
+    return [author for author in map(_clean_author, split_authors(authors_str, structured)) if author is not None]
+
+def explode_coauthors(coauthors, structured=True):
+    """coauthors sütununu tek geçişte (paper, author) tablosuna dönüştür
+
+    Her hücre parse_authors ile aynı adımlarla ayrılıp temizlenir; 'paper'
+    sütunu satırın konumudur ve yazarlar satır içindeki sıralarını korur.
+    Nesne türlü sütunlarda pandas string işlemleri de eleman başına Python
+    döngüsüdür; bu yüzden tek bir geçiş ardışık on str işleminden hızlıdır.
+    """
+    papers, authors = [], []
+    for paper, value in enumerate(pd.Series(coauthors).tolist()):
+        if pd.isna(value):
+            continue
+        value = str(value).strip()
+        if not value or value.lower() in EMPTY_AUTHOR_VALUES:
+            continue
+        for author in split_authors(value, structured):
+            author = _clean_author(author)
+            if author is not None:
+                papers.append(paper)
+                authors.append(author)
+    return pd.DataFrame({
+        'paper': np.array(papers, dtype=np.int64),
+        'author': np.array(authors, dtype=object),
+    })
+
+def orcid_key(orcid_raw):
+    """Geçerli ORCID değerini temizlenmiş olarak döndür, yoksa None"""
+    if orcid_raw and pd.notna(orcid_raw) and str(orcid_raw).strip():
+        return str(orcid_raw).strip()
+    return None
+
+def find_orcid_column(df):
+    """ORCID sütununu bul, yoksa None döndür"""
+    for col in df.columns:
+        if 'orcid' in col.lower():
+            return col
+    return None
+
+
+def dedupe_papers(df, known=()):
+    """Aynı makalenin tekrarlanan satırlarını tek makale kaydına indir
+
+    Veri her (izlenen yazar, makale) için bir satırdır; birden fazla izlenen
+    yazarı olan makale aynı DOI ve coauthors listesiyle birkaç kez gelir.
+    Satırlar paper_key ile (DOI, yoksa başlık) gruplanır ve her gruptan ilk
+    satır kalır. Satırların (ORCID, author_name, author_position) bilgileri
+    kalan satırın 'tracked_authors' sütununda (tekrarsız, görülme sırasıyla;
+    konumu boş veya sayısal olmayanlar sonda) birleştirilir. Anahtarı known
+    içinde olan (zaten eklenmiş) makaleler atlanır.
+    """
+    titles = df[title_col].tolist() if title_col in df else [None] * len(df)
+    dois = df[doi_col].tolist() if doi_col in df else [None] * len(df)
+    orcid_col = find_orcid_column(df)
+    orcids = [orcid_key(v) for v in df[orcid_col]] if orcid_col else [None] * len(df)
+    names = [v if pd.notna(v) else None for v in df[author_name_col]] if author_name_col in df else [None] * len(df)
+    # Boş veya sayısal olmayan konumlar eksik sayılır (izlenen yazar adla eşleşir)
+    if author_position_col in df:
+        numeric = pd.to_numeric(df[author_position_col], errors='coerce')
+        positions = [int(v) if np.isfinite(v) and v == int(v) else None for v in numeric.tolist()]
+    else:
+        positions = [None] * len(df)
+
+    keep, merged, slot = [], [], {}
+    for pos, (title, doi, tracked) in enumerate(zip(titles, dois, zip(orcids, names, positions))):
+        key = paper_key(title, doi)
+        if key is not None and key in known:
+            continue
+        i = slot.get(key) if key is not None else None
+        if i is None:
+            if key is not None:
+                slot[key] = len(keep)
+            keep.append(pos)
+            merged.append([tracked])
+        elif tracked not in merged[i]:
+            merged[i].append(tracked)
+
+    out = df.iloc[keep].copy() if len(keep) < len(df) else df.copy()
+    # Konumu eksik kayıtlar sona: konumlu yazarlar yerlerini önce alır
+    out['tracked_authors'] = [tuple(sorted((t for t in group if t != (None, None, None)),
+                                           key=lambda t: t[2] is None))
+                              for group in merged]
+    return out
+
+
+def _lazy_derived(name):
+    """Eskimişse ilk erişimde yeniden oluşturulan türetilmiş yapı özelliği
+
+    Yapı '_<ad>', eskimişse yeniden oluşturma argümanları '_<ad>_stale'
+    özniteliğinde tutulur (sığ kopyalar bağımsız kalır).
+    """
+    attr, stale = '_' + name, '_' + name + '_stale'
+
+    def get(self):
+        if getattr(self, stale) is not None:
+            with self._derived_lock:
+                # Kilidi bekleyen diğer iş parçacığı oluşturmuş olabilir
+                kwargs = getattr(self, stale)
+                if kwargs is not None:
+                    getattr(self, 'enable_' + name)(**kwargs)
+        return getattr(self, attr)
+
+    def set(self, value):
+        # Önce yapı yazılır: eskime işaretini kaldıran iş parçacığı yapıyı hazır bulur
+        setattr(self, attr, value)
+        setattr(self, stale, None)
+
+    return property(get, set)
+
+
+class CollaborationGraph:
+    """Yazar iş birliği grafı ve ona bağlı yazar tabloları"""
+
+    csr = _lazy_derived('csr')
+    distance_oracle = _lazy_derived('distance_oracle')
+    centrality = _lazy_derived('centrality')
+
+    def __init__(self, resolve_names=False):
+        self.G = nx.Graph()
+        # Her yazarın yazdığı makale sayısı
+        self.author_paper_counts = {}
+        # Yazar ID'sinden yazar adına eşleme
+        self.author_name_to_id = {}
+        # Yazar adından yazar ID'lerine (kayıt, yani graf sırasıyla)
+        self.author_ids_by_name = {}
+        self.author_orcid_map = {}  # ORCID'den yazar adına eşleme
+        # Yazar adı -> o adı taşıyan ilk ORCID (orcid_of_name; eşleme değişince silinir)
+        self._orcid_by_name = None
+        # ORCID <-> düğüm eşlemeleri
+        self.identity = AuthorIdentity()
+        # Benzer yazar adları için indeks
+        self.name_index = AuthorNameIndex()
+        # Ad varyantları (baş harf, aksan, yazım farkı) kanonik ada eşlenir mi
+        self.resolve_names = resolve_names
+        self.name_merges = []  # (kanonik ad, varyantlar, neden)
+        # Makale bilgileri (kenarlar yalnızca ağırlık taşır)
+        self.papers = PaperStore()
+        # Tembel türetilmiş yapıların enable argümanları ve yeniden oluşturma kilidi
+        self._derived_kwargs = {}
+        self._derived_lock = threading.RLock()
+        # İsteğe bağlı sıkıştırılmış analiz motoru (enable_csr ile oluşturulur)
+        self.csr = None
+        # İsteğe bağlı en kısa yol kahini (enable_distance_oracle ile oluşturulur)
+        self.distance_oracle = None
+        # İsteğe bağlı yazar arama indeksi (enable_search_index ile oluşturulur)
+        self.search_index = None
+        # İsteğe bağlı önceden sıralı işbirlikçi kuyrukları (enable_collaborator_ranking ile)
+        self.collaborator_ranking = None
+        # İsteğe bağlı merkezilik indeksi (enable_centrality ile oluşturulur)
+        self.centrality = None
+        # İstatistikler
+        self.total_papers = 0
+        self.total_authors_found = 0
+        self.unique_authors = set()
+
+    def orcid_node(self, orcid):
+        """ORCID'in düğüm ID'si; ilk görülen ORCID için düğüm ID'si ORCID'dir"""
+        identity = self.identity
+        node_id = identity.node_of(orcid)
+        if node_id is None:
+            node_id = orcid
+            identity.bind(orcid, node_id)
+        return node_id
+
+    def resolve_author_id(self, author, orcid=None):
+        """Yazar için graf düğüm ID'sini belirle"""
+        # Yazara bağlı ORCID varsa onun düğümü, yoksa yazar adı kullanılır
+        if orcid is not None:
+            self.author_orcid_map[orcid] = author
+            self._orcid_by_name = None
+            return self.orcid_node(orcid)
+
+        # Yazar adını temizle
+        clean_author = clean_author_name(author)
+
+        # Benzer yazar adı var mı kontrol et
+        similar_id = self.name_index.lookup(clean_author)
+        if similar_id is not None:
+            # Benzer yazar bulundu, onun ID'sini kullan
+            return similar_id
+        # Yeni yazar, yeni ID oluştur
+        return clean_author
+
+    def register_author(self, author_id, author):
+        # Aynı ID'li yazarları birleştir
+        if author_id not in self.author_name_to_id:
+            self.author_name_to_id[author_id] = author
+            self.author_ids_by_name.setdefault(author, []).append(author_id)
+            # ORCID düğümleri adla eşleşmez
+            if author_id not in self.identity.node_to_orcid:
+                self.name_index.add(author_id, author)
+            self.G.add_node(author_id, name=author)
+
+    def add_paper(self, title, doi, coauthors, orcids=None):
+        """Ayrıştırılmış bir makaleyi grafa ekle, yazar ID'lerini döndür
+
+        orcids her ortak yazarın ORCID'i veya None listesidir
+        (AuthorIdentity.assign).
+        """
+        self.total_papers += 1
+        author_ids = []
+        if orcids is None:
+            orcids = [None] * len(coauthors)
+
+        # Her yazarı işle
+        for author, orcid in zip(coauthors, orcids):
+            self.unique_authors.add(author)
+            self.total_authors_found += 1
+            author_id = self.resolve_author_id(author, orcid)
+
+            self.register_author(author_id, author)
+
+            author_ids.append(author_id)
+            # Makale sayısını güncelle
+            self.author_paper_counts[author] = self.author_paper_counts.get(author, 0) + 1
+
+        self.papers.add_paper(title, doi, author_ids, coauthors)
+
+        # Kenarları oluştur - TÜM YAZARLAR ARASINDA
+        G = self.G
+        for u, v in coauthor_pairs(author_ids):
+            if not G.has_edge(u, v):
+                G.add_edge(u, v, weight=1)
+            else:
+                G[u][v]["weight"] += 1
+
+        return author_ids
+
+    def _resolve_table_ids(self, table):
+        """Yazar tablosundaki her satır için düğüm ID'sini belirle
+
+        İndeks durumu eklenme sırasına bağlı olduğu için çözümleme satır
+        sırasıyla yapılır. ORCID'li satırlarda yalnızca her ORCID'in ilk
+        görülmesi, diğerlerinde ise sonucu artık değişemeyecek adlar
+        (normalize anahtarı aynı ID'ye bağlı olanlar) önbelleğe alınır.
+        """
+        orcids = table['orcid'].to_numpy(dtype=object)
+        authors = table['author'].to_numpy(dtype=object)
+        has_orcid = table['orcid'].notna().to_numpy()
+        first_orcid = has_orcid & ~table['orcid'].duplicated().to_numpy()
+
+        ids = orcids.copy()
+        stable_ids = {}
+        name_index = self.name_index
+        for i in np.flatnonzero(first_orcid | ~has_orcid):
+            author = authors[i]
+            if has_orcid[i]:
+                author_id = self.orcid_node(orcids[i])
+            else:
+                author_id = stable_ids.get(author)
+                if author_id is None:
+                    author_id = self.resolve_author_id(author)
+                    self.register_author(author_id, author)
+                    if name_index.owner(normalize_author_name(author)) == author_id:
+                        stable_ids[author] = author_id
+                ids[i] = author_id
+                continue
+            self.register_author(author_id, author)
+        orcid_to_node = self.identity.orcid_to_node
+        ids[has_orcid] = [orcid_to_node[orcid] for orcid in orcids[has_orcid]]
+
+        # ORCID -> yazar eşlemesi her ORCID için son görülen adı tutar
+        if has_orcid.any():
+            orcid_rows = table[has_orcid]
+            for orcid in orcid_rows['orcid'].drop_duplicates():
+                self.author_orcid_map.setdefault(orcid, None)
+            last = orcid_rows.drop_duplicates('orcid', keep='last')
+            self.author_orcid_map.update(zip(last['orcid'], last['author']))
+            self._orcid_by_name = None
+        return ids
+
+    def ingest_dataframe(self, df, verbose=False):
+        """Makale tablosunu sütun bazlı işlemlerle grafa ekle
+
+        Her satır için add_paper(parse_authors(...)) çağırmakla aynı grafı
+        üretir; yazar sayımı ve kenar ağırlıkları satır döngüsü yerine
+        NumPy işlemleriyle hesaplanır (yazar çiftleri indeks aritmetiğiyle
+        açılır, kenar ağırlıkları np.unique ile sayılır). Aynı makalenin
+        tekrarlanan satırları (ve grafta zaten bulunan makaleler) önce
+        dedupe_papers ile elenir; yazar çiftleri her makale için bir kez açılır.
+        """
+        rows = len(df)
+        df = dedupe_papers(df, known=self.papers.by_key)
+        if verbose and len(df) < rows:
+            print(f"{rows - len(df)} tekrarlanan makale satırı birleştirildi")
+        table = explode_coauthors(df[coauthors_col])
+
+        if verbose:
+            coauthors = df[coauthors_col].to_numpy(dtype=object)
+            parsed = set(table['paper'])
+            for pos, idx in enumerate(df.index):
+                if pd.isna(coauthors[pos]):
+                    print(f"Satır {idx}: coauthors boş, atlanıyor")
+                elif pos not in parsed:
+                    print(f"Satır {idx}: Hiç yazar bulunamadı: '{coauthors[pos]}'")
+
+        if table.empty:
+            return
+        if self.resolve_names:
+            table = self._merge_name_variants(table)
+
+        # ORCID'ler yalnızca izlenen yazarlara verilir
+        paper = table['paper'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, paper[1:] != paper[:-1]])
+        names = table['author'].tolist()
+        bounds = starts.tolist() + [len(names)]
+        tracked = df['tracked_authors'].to_numpy(dtype=object)[paper[starts]].tolist()
+        links = self.identity.assign([names[a:b] for a, b in zip(bounds[:-1], bounds[1:])], tracked)
+        table['orcid'] = pd.Series([orcid for paper_links in links for orcid in paper_links], dtype=object)
+
+        author_ids = self._resolve_table_ids(table)
+
+        # İstatistikler ve makale sayıları
+        self.total_papers += table['paper'].nunique()
+        self.total_authors_found += len(table)
+        self.unique_authors.update(table['author'])
+        for author, count in table.groupby('author', sort=False).size().items():
+            self.author_paper_counts[author] = self.author_paper_counts.get(author, 0) + int(count)
+
+        # Makaleleri yazar ID'leriyle birlikte makale deposuna ekle
+        ids = author_ids.tolist()
+        titles = df[title_col].to_numpy(dtype=object)[paper[starts]].tolist()
+        dois = df[doi_col].to_numpy(dtype=object)[paper[starts]].tolist()
+        for title, doi, a, b in zip(titles, dois, bounds[:-1], bounds[1:]):
+            self.papers.add_paper(title, doi, ids[a:b], names[a:b])
+
+        # Aynı makaledeki tüm yazar çiftleri (satır ve yazar sırasıyla): her
+        # yazar görülmesi, makalesinde kendisinden sonra gelenlerle eşlenir
+        n = len(table)
+        sizes = np.diff(bounds)
+        later = np.repeat(starts + sizes, sizes) - np.arange(n) - 1
+        first = np.repeat(np.arange(n), later)
+        offsets = np.repeat(np.cumsum(later) - later, later)
+        second = first + 1 + np.arange(len(first)) - offsets
+
+        # Kenar anahtarı yönsüz kod çiftidir; ağırlık anahtarın tekrar sayısı,
+        # kenar sırası ise ilk görülme sırasıdır
+        codes, uniques = pd.factorize(author_ids)
+        code_a, code_b = codes[first], codes[second]
+        key = np.minimum(code_a, code_b) * len(uniques) + np.maximum(code_a, code_b)
+        _, first_seen, inverse = np.unique(key, return_index=True, return_inverse=True)
+        weights = np.bincount(inverse.ravel())
+        order = np.argsort(first_seen, kind='stable')
+        pair = first_seen[order]
+        edges = zip(author_ids[first[pair]].tolist(), author_ids[second[pair]].tolist(), weights[order].tolist())
+
+        # Kenarları oluştur - TÜM YAZARLAR ARASINDA
+        G = self.G
+        if G.number_of_edges():
+            new_edges = []
+            for u, v, weight in edges:
+                if not G.has_edge(u, v):
+                    new_edges.append((u, v, weight))
+                else:
+                    G[u][v]["weight"] += weight
+            edges = new_edges
+        G.add_weighted_edges_from(edges)
+
+        if verbose:
+            print(f"İşlenen makale: {self.total_papers}, Bulunan yazar: {self.total_authors_found}, Benzersiz yazar: {len(self.unique_authors)}")
+
+    def _merge_name_variants(self, table):
+        """Tablodaki ad varyantlarını kanonik adlarla değiştir
+
+        Grafta zaten bulunan adlar sabittir; yeni varyantlar onlara eşlenir.
+        """
+        mapping, report = resolve_name_variants(table, fixed_names=self.author_paper_counts)
+        if mapping:
+            table = table.assign(author=table['author'].map(mapping).fillna(table['author']))
+            self.name_merges.extend(report)
+        return table
+
+    def add_papers(self, rows, verbose=False):
+        """Yeni makale satırlarını mevcut grafa ekle
+
+        rows bir DataFrame ya da sütun adlarıyla sözlükler listesidir
+        (paper_title, coauthors, doi; isteğe bağlı orcid, author_name ve
+        author_position). Graf yeniden
+        oluşturulmaz; düğümler, kenar ağırlıkları ve makale sayıları yerinde
+        güncellenir. Eklenen makalelerin yazar ID'leri kümesini döndürür.
+        """
+        df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+        # Çağıranın DataFrame'i değiştirilmez
+        df = df.rename(columns=str.strip)
+        first = len(self.papers)
+        self.ingest_dataframe(df, verbose=verbose)
+        changed = {author_id for ids in self.papers.paper_authors[first:] for author_id in ids}
+        names = {name for paper_names in self.papers.paper_author_names[first:] for name in paper_names}
+        self._update_derived(changed, names)
+        return changed
+
+    def remove_paper(self, doi):
+        """DOI'si verilen makaleleri graftan çıkar
+
+        Kenar ağırlıkları ve makale sayıları azaltılır; ağırlığı sıfıra inen
+        kenarlar ve makalesi kalmayan yazarlar silinir. DOI, tekilleştirmedeki
+        gibi önekten ve büyük/küçük harften bağımsız eşlenir. Makalesi kalan
+        yazarlar ilk görülen adlarını korur; grafı silinen makale olmadan
+        yeniden oluşturmak düğüme kalan makalelerdeki yazılışı verebilir.
+        Etkilenen yazar ID'leri kümesini döndürür (makale bulunamazsa boş küme).
+        """
+        G = self.G
+        changed, names = set(), set()
+        for paper_id in self.papers.find_doi(doi):
+            author_ids, author_names = self.papers.remove_paper(paper_id)
+            self.total_papers -= 1
+            self.total_authors_found -= len(author_names)
+            for author in author_names:
+                self.author_paper_counts[author] -= 1
+                if self.author_paper_counts[author] == 0:
+                    del self.author_paper_counts[author]
+                    self.unique_authors.discard(author)
+            for u, v in coauthor_pairs(author_ids):
+                G[u][v]["weight"] -= 1
+                if G[u][v]["weight"] == 0:
+                    G.remove_edge(u, v)
+            changed.update(author_ids)
+            names.update(author_names)
+
+        # Makalesi kalmayan yazarları kaldır
+        for author_id in changed:
+            if not self.papers.papers_of(author_id):
+                self._unregister_author(author_id)
+        if changed:
+            self._update_derived(changed, names)
+        return changed
+
+    def _unregister_author(self, author_id):
+        author = self.author_name_to_id.pop(author_id)
+        same_name = self.author_ids_by_name[author]
+        same_name.remove(author_id)
+        if not same_name:
+            del self.author_ids_by_name[author]
+        orcid = self.identity.unbind(author_id)
+        # ORCID düğümleri indekste değildir; boşalan anahtarları sıradaki ID devralır
+        if orcid is None:
+            self.name_index.remove(author_id, author)
+        if orcid is not None:
+            self.author_orcid_map.pop(orcid, None)
+            self._orcid_by_name = None
+        self.G.remove_node(author_id)
+
+    def _update_derived(self, changed, names):
+        """Etkin türetilmiş yapıları graf değişikliğine göre güncelle
+
+        changed komşuluğu değişen yazar ID'leri, names eklenen veya silinen
+        makalelerdeki yazar adlarıdır (makale sayısı değişen adlar). Arama
+        indeksi ve işbirlikçi kuyrukları yalnızca etkilenen yazarlar için
+        yerinde güncellenir; CSR, mesafe kahini ve merkezilik eskimiş sayılır
+        ve ilk kullanıldıklarında aynı argümanlarla yeniden oluşturulur.
+        """
+        # Makale sayısı değişen adları taşıyan tüm düğümler
+        recounted = {author_id for name in names for author_id in self.author_ids_by_name.get(name, ())}
+        if self.search_index is not None:
+            self.search_index.update(self, changed | recounted)
+        if self.collaborator_ranking is not None:
+            self.collaborator_ranking.update(self, changed, recounted)
+        for name in LAZY_DERIVED:
+            if getattr(self, '_' + name) is not None:
+                setattr(self, '_' + name + '_stale', self._derived_kwargs.get(name, {}))
+
+    def enable_csr(self):
+        """Analiz fonksiyonları için CSR motorunu oluştur ve etkinleştir"""
+        self.csr = CSRGraph.from_collaboration_graph(self)
+        return self.csr
+
+    def enable_distance_oracle(self, **kwargs):
+        """Tekrarlanan en kısa yol sorguları için mesafe kahinini oluştur"""
+        # Sözlük sığ kopyalarla paylaşılabilir; yerinde değiştirilmez
+        self._derived_kwargs = {**self._derived_kwargs, 'distance_oracle': kwargs}
+        self.distance_oracle = DistanceOracle.from_collaboration_graph(self, **kwargs)
+        return self.distance_oracle
+
+    def enable_search_index(self):
+        """Yazar araması için tam eşleşme ve n-gram indeksini oluştur"""
+        self.search_index = AuthorSearchIndex(self)
+        return self.search_index
+
+    def enable_collaborator_ranking(self):
+        """Tüm yazarların işbirlikçi kuyruklarını önceden sırala"""
+        self.collaborator_ranking = CollaboratorRanking(self)
+        return self.collaborator_ranking
+
+    def enable_centrality(self, **kwargs):
+        """Derece, ağırlıklı derece, PageRank ve arasındalık indeksini oluştur"""
+        self._derived_kwargs = {**self._derived_kwargs, 'centrality': kwargs}
+        self.centrality = CentralityIndex(self, **kwargs)
+        return self.centrality
+
+    def orcid_of_name(self, name):
+        """author_orcid_map'te adı verilen ilk (eşleme sırasıyla) ORCID, yoksa None"""
+        by_name = self._orcid_by_name
+        if by_name is None:
+            by_name = {}
+            for orcid, author in self.author_orcid_map.items():
+                by_name.setdefault(author, orcid)
+            self._orcid_by_name = by_name
+        return by_name.get(name)
+
+    def author_orcid(self, node_id):
+        """Düğümün ORCID'i, yoksa None; O(1)"""
+        return self.identity.orcid_of(node_id)
+
+    def author_name(self, node_id):
+        return self.G.nodes[node_id]['name']
+
+    def paper_count(self, node_id):
+        return self.author_paper_counts.get(self.G.nodes[node_id]['name'], 0)
+
+    def papers_between(self, author_a, author_b):
+        """İki yazarın ortak makaleleri; (başlık, DOI) listesi"""
+        papers = self.papers
+        return [(papers.titles[p], papers.dois[p]) for p in papers.shared_papers(author_a, author_b)]
+
+
+def read_dataset(path=EXCEL_PATH):
+    """Excel dosyasını oku ve sütun adlarını temizle"""
+    df = pd.read_excel(path)
+    df.columns = df.columns.str.strip()
+    return df
+
+def build_graph_from_dataframe(df, verbose=False, resolve_names=False):
+    """DataFrame'deki makalelerden iş birliği grafını oluştur
+
+    resolve_names True ise aynı yazarın ad varyantları birleştirilir.
+    """
+    cg = CollaborationGraph(resolve_names=resolve_names)
+    cg.ingest_dataframe(df, verbose=verbose)
+    return cg
+
+def build_graph_from_rows(df, verbose=False):
+    """Grafı satır satır parse_authors ile oluştur (sütun bazlı yolun referansı)"""
+    cg = CollaborationGraph()
+    papers = []
+
+    for idx, row in dedupe_papers(df).iterrows():
+        title = row[title_col]
+        doi = row[doi_col]
+        coauthors_raw = row[coauthors_col]
+
+        if pd.isna(coauthors_raw):
+            if verbose:
+                print(f"Satır {idx}: coauthors boş, atlanıyor")
+            continue
+
+        coauthors = parse_authors(coauthors_raw)
+
+        if not coauthors:
+            if verbose:
+                print(f"Satır {idx}: Hiç yazar bulunamadı: '{coauthors_raw}'")
+            continue
+
+        papers.append((title, doi, coauthors, row['tracked_authors']))
+
+    # ORCID'ler tüm makaleler için önceden bağlanır (sütun bazlı yoldaki gibi)
+    links = cg.identity.assign([p[2] for p in papers], [p[3] for p in papers])
+    for (title, doi, coauthors, _), orcids in zip(papers, links):
+        cg.add_paper(title, doi, coauthors, orcids)
+
+        # Her 100 makalede bir ilerleme raporu
+        if verbose and cg.total_papers % 100 == 0:
+            print(f"İşlenen makale: {cg.total_papers}, Bulunan yazar: {cg.total_authors_found}, Benzersiz yazar: {len(cg.unique_authors)}")
+
+    return cg
+
+def build_graph(path=EXCEL_PATH, verbose=False, resolve_names=False):
+    """Excel dosyasından iş birliği grafını oluştur"""
+    df = read_dataset(path)
+    return build_graph_from_dataframe(df, verbose=verbose, resolve_names=resolve_names)
+
+def print_dataset_summary(df):
+    """Excel verisinin sütunlarını ve kalitesini yazdır"""
+    # Sütun isimlerini kontrol et
+    print("Excel sütunları:", df.columns.tolist())
+    print(f"Toplam satır sayısı: {len(df)}")
+
+    # Veri kalitesi kontrolü
+    print("\nVeri kalitesi kontrolü:")
+    print(f"paper_title boş satırlar: {df['paper_title'].isna().sum()}")
+    print(f"coauthors boş satırlar: {df['coauthors'].isna().sum()}")
+    print(f"doi boş satırlar: {df['doi'].isna().sum()}")
+
+    # İlk birkaç satırı göster
+    print("\nİlk 3 satırın coauthors verileri:")
+    for i in range(min(3, len(df))):
+        print(f"Satır {i}: {df.iloc[i]['coauthors']}")
+
+    orcid_col = find_orcid_column(df)
+    if orcid_col:
+        print(f"ORCID sütunu bulundu: {orcid_col}")
+    else:
+        print("ORCID sütunu bulunamadı, yazar adları kullanılacak")
+
+def print_graph_report(cg, df=None):
+    """Graf oluşturma istatistiklerini ve yazar analizini yazdır"""
+    G = cg.G
+    unique_authors = cg.unique_authors
+
+    print(f"\n=== GRAF OLUŞTURMA İSTATİSTİKLERİ ===")
+    print(f"Toplam işlenen makale sayısı: {cg.total_papers}")
+    print(f"Toplam bulunan yazar sayısı: {cg.total_authors_found}")
+    print(f"Benzersiz yazar sayısı: {len(unique_authors)}")
+    print(f"Graf düğüm sayısı: {G.number_of_nodes()}")
+    print(f"Graf kenar sayısı: {G.number_of_edges()}")
+
+    # Yazar sayısı kontrolü
+    if len(unique_authors) != G.number_of_nodes():
+        print(f"⚠️  UYARI: Benzersiz yazar sayısı ({len(unique_authors)}) ile graf düğüm sayısı ({G.number_of_nodes()}) farklı!")
+        print("Bu, aynı yazarın farklı ID'lerle kaydedildiğini gösteriyor.")
+
+    # Yazar sayısını analiz et
+    print(f"\n=== YAZAR SAYISI ANALİZİ ===")
+    print(f"Excel'den okunan benzersiz yazar sayısı: {len(unique_authors)}")
+    print(f"Graf düğüm sayısı: {G.number_of_nodes()}")
+
+    # Benzer yazar adlarını bul
+    similar_groups = {}
+    for author in unique_authors:
+        normalized = normalize_author_name(author)
+        if normalized not in similar_groups:
+            similar_groups[normalized] = []
+        similar_groups[normalized].append(author)
+
+    # Birden fazla varyantı olan yazarları göster
+    duplicate_authors = {norm: authors for norm, authors in similar_groups.items() if len(authors) > 1}
+    if duplicate_authors:
+        print(f"\n⚠️  Aynı yazarın farklı yazılışları bulundu ({len(duplicate_authors)} grup):")
+        for norm, authors in list(duplicate_authors.items())[:5]:  # İlk 5 grubu göster
+            print(f"  {norm}: {authors}")
+        if len(duplicate_authors) > 5:
+            print(f"  ... ve {len(duplicate_authors) - 5} grup daha")
+
+    # Varlık çözümlemesiyle birleştirilen ad varyantları
+    if cg.name_merges:
+        merged = sum(len(variants) for _, variants, _ in cg.name_merges)
+        print(f"\nBirleştirilen ad varyantları: {merged} varyant, {len(cg.name_merges)} grup")
+        for canonical, variants, reason in cg.name_merges[:5]:  # İlk 5 grubu göster
+            print(f"  {canonical} <- {variants} ({reason})")
+        if len(cg.name_merges) > 5:
+            print(f"  ... ve {len(cg.name_merges) - 5} grup daha")
+
+    # En çok makale yazan yazarları göster
+    top_authors = sorted(cg.author_paper_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+    print(f"\nEn çok makale yazan 10 yazar:")
+    for i, (author, count) in enumerate(top_authors, 1):
+        print(f"{i:2d}. {author}: {count} makale")
+
+    # Yazar sayısını düzelt
+    cleaned_count = len(set(clean_author_name(a) for a in unique_authors))
+    print(f"\n=== DÜZELTİLMİŞ YAZAR SAYISI ===")
+    print(f"Temizlenmiş benzersiz yazar sayısı: {cleaned_count}")
+    print(f"Graf düğüm sayısı: {G.number_of_nodes()}")
+
+    # Eğer hala fazla yazar varsa, manuel kontrol öner
+    if cleaned_count > 110:  # %10 tolerans
+        print(f"\n⚠️  Yazar sayısı hala fazla görünüyor.")
+        print("Excel dosyasını kontrol edin ve aynı yazarın farklı yazılışlarını düzeltin.")
+
+    # Eğer yazar sayısı beklenenden azsa, ek kontroller yap
+    if df is not None and len(unique_authors) < 500:  # Beklenen minimum yazar sayısı
+        print("\n⚠️  UYARI: Yazar sayısı beklenenden az!")
+        print("Ek kontroller yapılıyor...")
+
+        # Tüm coauthors sütununu tekrar kontrol et
+        all_authors_sample = []
+        for value in df[coauthors_col]:
+            if not pd.isna(value):
+                coauthors_str = str(value)
+                if coauthors_str and coauthors_str.lower() not in ['nan', 'none', '']:
+                    all_authors_sample.append(coauthors_str[:100])  # İlk 100 karakter
+
+        print(f"Coauthors örnekleri (ilk 5):")
+        for i, sample in enumerate(all_authors_sample[:5]):
+            print(f"  {i+1}: {sample}")
+
+        # Farklı ayırıcıları test et
+        separator_test = {}
+        for sample in all_authors_sample[:10]:  # İlk 10 örneği test et
+            for sep in [',', ';', '|', '\n', ' and ', ' & ']:
+                if sep in sample:
+                    separator_test[sep] = separator_test.get(sep, 0) + 1
+
+        print(f"En çok kullanılan ayırıcılar: {separator_test}")
+
+    print(f"Toplam yazar sayısı: {G.number_of_nodes()}")
+    print(f"Toplam iş birliği (kenar) sayısı: {G.number_of_edges()}")
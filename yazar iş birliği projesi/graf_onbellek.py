@@ -0,0 +1,312 @@
+"""Oluşturulan grafın diske ikili anlık görüntü (snapshot) olarak kaydedilmesi
+
+Excel dosyasını her açılışta yeniden ayrıştırmak yerine graf, yazar
+tabloları ve makale deposu NumPy dizileri olarak bir klasöre yazılır.
+Sonraki açılışlarda diziler bellek eşlemeli (mmap) okunur. Anlık görüntü
+kaynak dosyanın boyutu, değişiklik zamanı ve SHA-256 özetiyle eşleşmezse
+geçersiz sayılır ve graf yeniden oluşturulur.
+
+Düğüm yerleşimi de aynı klasörde saklanır; graf (düğüm sırası, kenarlar ve
+ağırlıklar) değişmediği sürece sonraki açılışlarda yeniden hesaplanmaz.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+from collections import deque
+
+from graf_olusturma import EXCEL_PATH, CollaborationGraph, read_dataset, build_graph_from_dataframe
+from graf_yerlesim import DEFAULT_LAYOUT_ENGINE, initial_layout
+
+SNAPSHOT_FORMAT_VERSION = 9
+CACHE_DIR_NAME = ".graf_onbellek"
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Dosyanın SHA-256 özetini hesapla"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def default_snapshot_dir(path):
+    """Kaynak dosyanın yanındaki önbellek klasöründe anlık görüntü yolu"""
+    path = os.path.abspath(path)
+    return os.path.join(os.path.dirname(path), CACHE_DIR_NAME, os.path.basename(path) + ".snapshot")
+
+def source_key(path, sha256=None):
+    """Anlık görüntünün geçerliliğini belirleyen kaynak dosya bilgileri"""
+    stat = os.stat(path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha256 if sha256 is not None else file_sha256(path),
+    }
+
+
+def _pack_strings(values):
+    """Metin listesini (karakter ofsetleri, UTF-8 bayt dizisi) olarak paketle"""
+    values = [str(v) for v in values]
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum([len(v) for v in values], out=offsets[1:])
+    blob = np.frombuffer("".join(values).encode("utf-8"), dtype=np.uint8)
+    return offsets, blob
+
+def _unpack_strings(offsets, blob):
+    text = blob.tobytes().decode("utf-8")
+    bounds = offsets.tolist()
+    return [text[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+def _intern(values):
+    """Değerleri tekil tabloya ve kodlara dönüştür; eksik değerler -1 olur"""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    return codes.astype(np.int32), list(uniques)
+
+def _adjacency_preserving_edge_order(G, node_pos):
+    """Her düğümün komşu sırasını koruyan bir kenar ekleme sırası bul
+
+    networkx komşu sözlüklerinin sırası kenarların eklenme sırasına bağlıdır.
+    Her düğümün komşu listesi bir zincir kısıtıdır; zincirlerin topolojik
+    sıralaması grafın birebir aynı komşu sırasıyla yeniden kurulmasını sağlar.
+    """
+    edge_index = {}
+    chains = []
+    for u, nbrs in G.adj.items():
+        chain = []
+        for v in nbrs:
+            key = (u, v) if node_pos[u] <= node_pos[v] else (v, u)
+            if key not in edge_index:
+                edge_index[key] = len(edge_index)
+            chain.append(edge_index[key])
+        chains.append(chain)
+
+    successors = [[] for _ in edge_index]
+    indegree = [0] * len(edge_index)
+    for chain in chains:
+        for a, b in zip(chain, chain[1:]):
+            successors[a].append(b)
+            indegree[b] += 1
+
+    edges = list(edge_index)
+    ready = deque(i for i, d in enumerate(indegree) if d == 0)
+    order = []
+    while ready:
+        i = ready.popleft()
+        order.append(edges[i])
+        for j in successors[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                ready.append(j)
+    return order
+
+
+def save_snapshot(cg, snapshot_dir, key):
+    """Grafı ve yazar tablolarını anlık görüntü klasörüne yaz"""
+    G = cg.G
+    nodes = list(G.nodes())
+    node_pos = {node: i for i, node in enumerate(nodes)}
+    edges = _adjacency_preserving_edge_order(G, node_pos)
+
+    arrays = {}
+    arrays["node_id_offsets"], arrays["node_id_blob"] = _pack_strings(nodes)
+    arrays["node_name_offsets"], arrays["node_name_blob"] = _pack_strings(G.nodes[n]["name"] for n in nodes)
+
+    arrays["edge_u"] = np.fromiter((node_pos[u] for u, v in edges), dtype=np.int32, count=len(edges))
+    arrays["edge_v"] = np.fromiter((node_pos[v] for u, v in edges), dtype=np.int32, count=len(edges))
+    arrays["edge_weight"] = np.fromiter((G[u][v]["weight"] for u, v in edges), dtype=np.int64, count=len(edges))
+
+    # Makale deposu: tekil başlık/DOI tablolarına kodlar + makale başına yazar düğümleri ve adları
+    papers = cg.papers
+    title_codes, titles = _intern(papers.titles)
+    doi_codes, dois = _intern(papers.dois)
+    arrays["paper_title_codes"], arrays["paper_doi_codes"] = title_codes, doi_codes
+    arrays["title_offsets"], arrays["title_blob"] = _pack_strings(titles)
+    arrays["doi_offsets"], arrays["doi_blob"] = _pack_strings(dois)
+    author_offsets = np.zeros(len(papers) + 1, dtype=np.int64)
+    np.cumsum([len(ids) for ids in papers.paper_authors], out=author_offsets[1:])
+    arrays["paper_author_offsets"] = author_offsets
+    arrays["paper_author_nodes"] = np.fromiter(
+        (node_pos[a] for ids in papers.paper_authors for a in ids), dtype=np.int32, count=author_offsets[-1])
+    arrays["paper_author_name_offsets"], arrays["paper_author_name_blob"] = _pack_strings(
+        name for names in papers.paper_author_names for name in names)
+    arrays["paper_removed"] = np.fromiter(sorted(papers.removed), dtype=np.int64, count=len(papers.removed))
+
+    arrays["count_author_offsets"], arrays["count_author_blob"] = _pack_strings(cg.author_paper_counts)
+    arrays["count_values"] = np.fromiter(cg.author_paper_counts.values(), dtype=np.int64,
+                                         count=len(cg.author_paper_counts))
+    arrays["orcid_offsets"], arrays["orcid_blob"] = _pack_strings(cg.author_orcid_map)
+    arrays["orcid_name_offsets"], arrays["orcid_name_blob"] = _pack_strings(cg.author_orcid_map.values())
+    # ORCID -> düğüm bağları
+    identity = cg.identity
+    arrays["identity_orcid_offsets"], arrays["identity_orcid_blob"] = _pack_strings(identity.orcid_to_node)
+    arrays["identity_node"] = np.fromiter((node_pos[n] for n in identity.orcid_to_node.values()),
+                                          dtype=np.int32, count=len(identity))
+    arrays["unique_author_offsets"], arrays["unique_author_blob"] = _pack_strings(sorted(cg.unique_authors))
+    # Birleştirilen ad varyantları (rapor önbellekten yüklemede de gösterilir)
+    merges = cg.name_merges
+    arrays["merge_canonical_offsets"], arrays["merge_canonical_blob"] = _pack_strings(c for c, _, _ in merges)
+    arrays["merge_reason_offsets"], arrays["merge_reason_blob"] = _pack_strings(r for _, _, r in merges)
+    variant_offsets = np.zeros(len(merges) + 1, dtype=np.int64)
+    np.cumsum([len(v) for _, v, _ in merges], out=variant_offsets[1:])
+    arrays["merge_group_offsets"] = variant_offsets
+    arrays["merge_variant_offsets"], arrays["merge_variant_blob"] = _pack_strings(
+        variant for _, variants, _ in merges for variant in variants)
+
+    meta = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "source": key,
+        "total_papers": cg.total_papers,
+        "total_authors_found": cg.total_authors_found,
+        "resolve_names": cg.resolve_names,
+    }
+
+    # Yarım kalmış yazmaları önlemek için geçici klasöre yazıp yer değiştir
+    parent = os.path.dirname(os.path.abspath(snapshot_dir))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".snapshot-", dir=parent)
+    try:
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_dir, name + ".npy"), array)
+        with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        if os.path.isdir(snapshot_dir):
+            shutil.rmtree(snapshot_dir)
+        os.replace(tmp_dir, snapshot_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+def read_snapshot_meta(snapshot_dir):
+    """Anlık görüntü bilgilerini oku, yoksa veya bozuksa None döndür"""
+    try:
+        with open(os.path.join(snapshot_dir, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        return None
+    return meta
+
+def load_snapshot(snapshot_dir, meta=None):
+    """Anlık görüntüden CollaborationGraph oluştur"""
+    if meta is None:
+        meta = read_snapshot_meta(snapshot_dir)
+
+    def load(name):
+        return np.load(os.path.join(snapshot_dir, name + ".npy"), mmap_mode="r")
+
+    def strings(prefix):
+        return _unpack_strings(load(prefix + "_offsets"), load(prefix + "_blob"))
+
+    cg = CollaborationGraph(resolve_names=meta.get("resolve_names", False))
+    nodes = strings("node_id")
+    names = strings("node_name")
+    # Bağlar düğümlerden önce kurulur: ORCID düğümleri ad indeksine girmez
+    for orcid, i in zip(strings("identity_orcid"), load("identity_node").tolist()):
+        cg.identity.bind(orcid, nodes[i])
+    for node_id, name in zip(nodes, names):
+        cg.register_author(node_id, name)
+
+    cg.G.add_edges_from(
+        (nodes[u], nodes[v], {"weight": weight})
+        for u, v, weight in zip(load("edge_u").tolist(), load("edge_v").tolist(), load("edge_weight").tolist())
+    )
+
+    titles = strings("title")
+    dois = strings("doi")
+    author_nodes = load("paper_author_nodes").tolist()
+    author_names = strings("paper_author_name")
+    offsets = load("paper_author_offsets").tolist()
+    for t, d, a, b in zip(load("paper_title_codes").tolist(), load("paper_doi_codes").tolist(),
+                          offsets[:-1], offsets[1:]):
+        cg.papers.add_paper(titles[t] if t >= 0 else np.nan, dois[d] if d >= 0 else np.nan,
+                            [nodes[i] for i in author_nodes[a:b]], author_names[a:b])
+    # Silinmiş makaleler boş kayıt olarak saklanır, ID'leri korunur
+    for paper_id in load("paper_removed").tolist():
+        cg.papers.remove_paper(paper_id)
+
+    cg.author_paper_counts = dict(zip(strings("count_author"), load("count_values").tolist()))
+    cg.author_orcid_map = dict(zip(strings("orcid"), strings("orcid_name")))
+    cg.unique_authors = set(strings("unique_author"))
+    variants = strings("merge_variant")
+    bounds = load("merge_group_offsets").tolist()
+    cg.name_merges = [(canonical, variants[a:b], reason) for canonical, reason, a, b in zip(
+        strings("merge_canonical"), strings("merge_reason"), bounds[:-1], bounds[1:])]
+    cg.total_papers = meta["total_papers"]
+    cg.total_authors_found = meta["total_authors_found"]
+    return cg
+
+def load_or_build_graph(path=EXCEL_PATH, snapshot_dir=None, verbose=False, resolve_names=False):
+    """Geçerli anlık görüntü varsa onu yükle, yoksa grafı oluşturup kaydet
+
+    (CollaborationGraph, DataFrame veya None) döndürür; DataFrame yalnızca
+    graf Excel dosyasından yeniden oluşturulduğunda döner. Anlık görüntü
+    farklı bir resolve_names ayarıyla oluşturulduysa graf yeniden oluşturulur.
+    """
+    if snapshot_dir is None:
+        snapshot_dir = default_snapshot_dir(path)
+
+    meta = read_snapshot_meta(snapshot_dir)
+    if meta is not None and meta.get("resolve_names", False) == resolve_names:
+        cached = meta["source"]
+        stat = os.stat(path)
+        if stat.st_size == cached["size"] and stat.st_mtime_ns == cached["mtime_ns"]:
+            return load_snapshot(snapshot_dir, meta), None
+        # Zaman damgası değişti; içerik aynıysa anlık görüntüyü yeniden kullan
+        sha256 = file_sha256(path)
+        if sha256 == cached["sha256"]:
+            meta["source"] = source_key(path, sha256)
+            with open(os.path.join(snapshot_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            return load_snapshot(snapshot_dir, meta), None
+
+    if verbose:
+        print("Graf önbelleği bulunamadı veya geçersiz, Excel dosyasından oluşturuluyor...")
+    key = source_key(path)
+    df = read_dataset(path)
+    cg = build_graph_from_dataframe(df, verbose=verbose, resolve_names=resolve_names)
+    save_snapshot(cg, snapshot_dir, key)
+    return cg, df
+
+
+def graph_fingerprint(G):
+    """Yerleşim önbelleğinin geçerliliği için düğüm sırası ve kenarların özeti"""
+    digest = hashlib.sha256()
+    for node in G.nodes():
+        digest.update(str(node).encode("utf-8") + b"\0")
+    digest.update(b"\1")
+    edges = sorted(tuple(sorted((str(u), str(v)))) + (str(w),) for u, v, w in G.edges(data="weight", default=1))
+    for edge in edges:
+        digest.update("\0".join(edge).encode("utf-8") + b"\1")
+    return digest.hexdigest()
+
+def load_or_compute_layout(G, snapshot_dir, engine=DEFAULT_LAYOUT_ENGINE, seed=42):
+    """Anlık görüntü klasöründeki yerleşimi yükle; yoksa hesaplayıp kaydet"""
+    path = os.path.join(snapshot_dir, f"layout-{engine}-{seed}.npz")
+    fingerprint = graph_fingerprint(G)
+    try:
+        with np.load(path) as data:
+            if str(data["fingerprint"]) == fingerprint:
+                return dict(zip(G.nodes(), data["coords"]))
+    except (OSError, KeyError, ValueError):
+        pass
+
+    pos = initial_layout(G, seed=seed, engine=engine)
+    if os.path.isdir(snapshot_dir):
+        coords = np.array([pos[node] for node in G.nodes()], dtype=float).reshape(-1, 2)
+        # Yarım kalmış yazmaları önlemek için geçici dosyaya yazıp yer değiştir
+        fd, tmp_path = tempfile.mkstemp(prefix=".layout-", suffix=".npz", dir=snapshot_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, coords=coords, fingerprint=np.array(fingerprint))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return pos
@@ -0,0 +1,76 @@
+"""Düğüm konumları için düzgün ızgara (uniform grid) uzamsal indeksi
+
+Konumlar hücrelere bölünür ve hücre numarasına göre sıralanır; bir
+dikdörtgen içindeki düğümler yalnızca o dikdörtgenin kestiği hücrelere
+bakılarak bulunur. İndeks yerleşim değiştiğinde yeniden oluşturulur.
+"""
+import math
+
+import numpy as np
+
+
+class GridIndex:
+    """2B noktalar için ızgara indeksi"""
+
+    def __init__(self, keys, coords, points_per_cell=2):
+        self.keys = list(keys)
+        self.coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        n = len(self.keys)
+        if n == 0:
+            self.origin = np.zeros(2)
+            self.cell_size = 1.0
+            self.shape = (1, 1)
+            self.order = np.empty(0, dtype=np.int64)
+            self.sorted_cells = np.empty(0, dtype=np.int64)
+            return
+
+        self.origin = self.coords.min(axis=0)
+        width, height = self.coords.max(axis=0) - self.origin
+        # Hücre başına ortalama points_per_cell nokta düşecek şekilde boyut seç
+        area = max(width * height, max(width, height) ** 2 / n, 1e-12)
+        self.cell_size = math.sqrt(area * points_per_cell / n)
+        cells = np.floor((self.coords - self.origin) / self.cell_size).astype(np.int64)
+        self.shape = (int(cells[:, 0].max()) + 1, int(cells[:, 1].max()) + 1)
+        flat = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self.order = np.argsort(flat, kind='stable')
+        self.sorted_cells = flat[self.order]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def candidates(self, x, y, rx, ry):
+        """(x, y) merkezli, yarı genişliği rx ve yarı yüksekliği ry olan
+        dikdörtgendeki noktaların indeksleri"""
+        if not self.keys:
+            return np.empty(0, dtype=np.int64)
+        cs = self.cell_size
+        ox, oy = self.origin
+        cols, rows = self.shape
+        c0 = max(int(math.floor((x - rx - ox) / cs)), 0)
+        c1 = min(int(math.floor((x + rx - ox) / cs)), cols - 1)
+        r0 = max(int(math.floor((y - ry - oy) / cs)), 0)
+        r1 = min(int(math.floor((y + ry - oy) / cs)), rows - 1)
+        if c0 > c1 or r0 > r1:
+            return np.empty(0, dtype=np.int64)
+
+        # Her sütunda ardışık satır hücreleri sıralı dizide tek bir aralıktır
+        starts = np.arange(c0, c1 + 1) * rows
+        lo = np.searchsorted(self.sorted_cells, starts + r0, side='left')
+        hi = np.searchsorted(self.sorted_cells, starts + r1, side='right')
+        found = np.concatenate([self.order[a:b] for a, b in zip(lo.tolist(), hi.tolist())])
+        if len(found) == 0:
+            return found
+        dx = np.abs(self.coords[found, 0] - x)
+        dy = np.abs(self.coords[found, 1] - y)
+        return found[(dx <= rx) & (dy <= ry)]
+
+    def nearest(self, x, y, radius):
+        """radius içindeki en yakın noktanın anahtarı, yoksa None"""
+        found = self.candidates(x, y, radius, radius)
+        if len(found) == 0:
+            return None
+        d2 = ((self.coords[found] - (x, y)) ** 2).sum(axis=1)
+        i = int(np.argmin(d2))
+        if d2[i] > radius * radius:
+            return None
+        return self.keys[found[i]]
@@ -0,0 +1,289 @@
+"""Süre/genişletme bütçeli en uzun basit yol araması
+
+En uzun basit yol problemi NP-zordur. Arama, başlangıç düğümünün bağlı
+bileşeni üzerinde yinelemeli (özyinelemesiz) dal-sınır ile yapılır:
+
+- Bileşen boyutu sınırı: yol, o ana kadar ziyaret edilmemiş ve ulaşılabilir
+  düğümlerden fazlasını ekleyemez.
+- İki bağlı bileşen (blok) sınırı: basit bir yol bir kesim düğümünden başka
+  bir bloğa geçtikten sonra geri dönemez; bu yüzden bir düğümden başlayan
+  yol en fazla blok-kesim ağacındaki bir yol boyunca blokları dolaşabilir.
+
+Bütçe dolduğunda o ana kadar bulunan en iyi yol döner. Sezgisel mod
+rastgele sıralı DFS yeniden başlatmalarıyla yalnızca iyi bir yol arar.
+"""
+import random
+import time
+
+import networkx as nx
+
+EXACT = "exact"
+HEURISTIC = "heuristic"
+
+
+class _Component:
+    """Başlangıç düğümünün bileşeni: tamsayı komşuluk listeleri ve blok sınırları"""
+
+    def __init__(self, G, source):
+        nodes = list(nx.node_connected_component(G, source))
+        self.nodes = nodes
+        index = {node: i for i, node in enumerate(nodes)}
+        self.source = index[source]
+        # Kendi kendine döngüler basit yola katkı yapmaz
+        self.adj = [[index[n] for n in G.adj[node] if n != node] for node in nodes]
+        self.block_bound = self._block_bounds(G.subgraph(nodes), index)
+
+    def _block_bounds(self, H, index):
+        """Her düğümden başlayan basit yolun blok-kesim ağacına göre üst sınırı
+
+        Her blok (iki bağlı bileşen) giriş düğümü dışında en fazla |blok|-1
+        yeni düğüm ekleyebilir; sınır, ağaçtaki en ağır yoldur.
+        """
+        n = len(self.nodes)
+        if n == 1:
+            return [0]
+        blocks = [list(b) for b in nx.biconnected_components(H)]
+        cut_nodes = {}
+        tree = []  # ağaç düğümü -> komşu ağaç düğümleri
+        weight = []
+        for block in blocks:
+            tree.append([])
+            weight.append(len(block) - 1)
+        for node in nx.articulation_points(H):
+            t = len(tree)
+            cut_nodes[node] = t
+            tree.append([])
+            weight.append(0)
+        for b, block in enumerate(blocks):
+            for node in block:
+                t = cut_nodes.get(node)
+                if t is not None:
+                    tree[b].append(t)
+                    tree[t].append(b)
+
+        farthest = _farthest_weights(tree, weight)
+        bounds = [0] * n
+        for b, block in enumerate(blocks):
+            for node in block:
+                if node not in cut_nodes:
+                    bounds[index[node]] = farthest[b]
+        for node, t in cut_nodes.items():
+            bounds[index[node]] = farthest[t]
+        return bounds
+
+    def reachable(self, start, on_path, limit):
+        """Yol dışındaki düğümlerden start'tan ulaşılabilenlerin sayısı (en fazla limit)"""
+        adj = self.adj
+        seen = {start}
+        stack = [start]
+        count = 0
+        while stack:
+            v = stack.pop()
+            for w in adj[v]:
+                if w not in seen and not on_path[w]:
+                    seen.add(w)
+                    count += 1
+                    if count >= limit:
+                        return count
+                    stack.append(w)
+        return count
+
+
+def _farthest_weights(tree, weight):
+    """Ağaçta her düğümden başlayan en ağır yolun ağırlığı (yeniden köklendirme)"""
+    n = len(tree)
+    parent = [-1] * n
+    order = []
+    seen = [False] * n
+    for root in range(n):
+        if seen[root]:
+            continue
+        seen[root] = True
+        stack = [root]
+        while stack:
+            v = stack.pop()
+            order.append(v)
+            for w in tree[v]:
+                if not seen[w]:
+                    seen[w] = True
+                    parent[w] = v
+                    stack.append(w)
+
+    # down[v]: v'den alt ağaca inen en ağır yol (v dahil)
+    down = weight[:]
+    for v in reversed(order):
+        p = parent[v]
+        if p >= 0:
+            down[p] = max(down[p], weight[p] + down[v])
+
+    # up[v]: v'den ebeveyn yönüne giden en ağır yol (v hariç)
+    up = [0] * n
+    for v in order:
+        children = [w for w in tree[v] if parent[w] == v]
+        # En iyi iki çocuk; her çocuk için kendisi dışındaki en iyisi kullanılır
+        first = second = 0
+        first_child = -1
+        for c in children:
+            if down[c] > first:
+                first, second, first_child = down[c], first, c
+            elif down[c] > second:
+                second = down[c]
+        for c in children:
+            other = second if c == first_child else first
+            up[c] = weight[v] + max(up[v], other)
+    return [weight[v] + max(up[v], down[v] - weight[v]) for v in range(n)]
+
+
+class _Search:
+    """Bütçeli arama durumu ve bulunan en iyi yol"""
+
+    def __init__(self, component, time_limit, max_expansions, seed, should_stop=None):
+        self.c = component
+        self.should_stop = should_stop
+        self.deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.max_expansions = max_expansions
+        self.expansions = 0
+        self.rng = random.Random(seed)
+        self.best = [component.source]
+        # Üst sınır: bileşen boyutu ve blok-kesim ağacı sınırından küçüğü
+        self.upper = min(len(component.nodes) - 1, component.block_bound[component.source])
+
+    def exhausted(self):
+        self.expansions += 1
+        if self.max_expansions is not None and self.expansions > self.max_expansions:
+            return True
+        # Saat ve dışarıdan durdurma isteği her 256 genişletmede bir kontrol edilir
+        if self.expansions % 256:
+            return False
+        if self.should_stop is not None and self.should_stop():
+            return True
+        return self.deadline is not None and time.perf_counter() > self.deadline
+
+    def record(self, path):
+        if len(path) > len(self.best):
+            self.best = path[:]
+
+    @property
+    def solved(self):
+        return len(self.best) - 1 >= self.upper
+
+    def dfs_restarts(self, restarts):
+        """Rastgele sıralı DFS ağaçlarındaki en derin dal; bütçe dolarsa True
+
+        İlk deneme komşuları graf sırasıyla gezer (eski function8 sonucu);
+        sonrakiler her düğümde komşu sırasını karıştırır.
+        """
+        c = self.c
+        adj = c.adj
+        for attempt in range(restarts):
+            if self.solved:
+                return False
+            parent = {c.source: None}
+            depth = {c.source: 0}
+            deepest = c.source
+            stack = [iter(adj[c.source])]
+            nodes = [c.source]
+            stopped = False
+            while stack:
+                if self.exhausted():
+                    stopped = True
+                    break
+                w = next(stack[-1], None)
+                if w is None:
+                    stack.pop()
+                    nodes.pop()
+                    continue
+                if w in parent:
+                    continue
+                v = nodes[-1]
+                parent[w] = v
+                depth[w] = depth[v] + 1
+                if depth[w] > depth[deepest]:
+                    deepest = w
+                nbrs = adj[w]
+                if attempt > 0:
+                    nbrs = nbrs[:]
+                    self.rng.shuffle(nbrs)
+                stack.append(iter(nbrs))
+                nodes.append(w)
+
+            path = []
+            node = deepest
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            path.reverse()
+            self.record(path)
+            if stopped:
+                return True
+        return False
+
+    def branch_and_bound(self):
+        """Yinelemeli dal-sınır araması; bütçe dolarsa False döndürür"""
+        c = self.c
+        adj, block_bound = c.adj, c.block_bound
+        on_path = [False] * len(adj)
+        on_path[c.source] = True
+        path = [c.source]
+
+        def ordered(v):
+            # Az sayıda boş komşusu olan düğümler önce denenir
+            return iter(sorted((w for w in adj[v] if not on_path[w]),
+                               key=lambda w: sum(1 for x in adj[w] if not on_path[x])))
+
+        stack = [ordered(c.source)]
+        while stack:
+            if self.solved:
+                return True
+            w = next(stack[-1], None)
+            if w is None:
+                stack.pop()
+                on_path[path.pop()] = False
+                continue
+            if on_path[w]:
+                continue
+            if self.exhausted():
+                return False
+
+            depth = len(path)  # w eklendiğinde yolun kenar sayısı
+            best = len(self.best) - 1
+            # Önce ucuz blok sınırı, sonra ulaşılabilir düğüm sayısı
+            if depth + block_bound[w] <= best:
+                continue
+            on_path[w] = True
+            if depth + c.reachable(w, on_path, best - depth + 1) <= best:
+                on_path[w] = False
+                continue
+            path.append(w)
+            self.record(path)
+            stack.append(ordered(w))
+        return True
+
+
+def longest_simple_path(G, source, mode=EXACT, time_limit=2.0, max_expansions=None,
+                        restarts=32, seed=0, should_stop=None):
+    """source'tan başlayan en uzun basit yolu ara; (yol, kanıtlanmış_optimal) döndürür
+
+    mode=EXACT dal-sınır araması yapar; bütçe (time_limit saniye veya
+    max_expansions genişletme) dolarsa o ana kadarki en iyi yol döner.
+    mode=HEURISTIC yalnızca rastgele sıralı DFS yeniden başlatmaları kullanır.
+    Yol bileşen ve blok üst sınırına ulaşırsa her iki modda da optimal
+    olduğu kanıtlanmış sayılır. should_stop() True döndürürse arama bütçe
+    dolmuş gibi durur (arayüzden iptal için).
+    """
+    if mode not in (EXACT, HEURISTIC):
+        raise ValueError(f"Bilinmeyen arama modu: {mode}")
+    component = _Component(G, source)
+    search = _Search(component, time_limit, max_expansions, seed, should_stop)
+
+    # Sezgisel yollar dal-sınır için başlangıç alt sınırı sağlar
+    stopped = search.dfs_restarts(restarts if mode == EXACT else max(restarts, 1))
+    if mode == HEURISTIC:
+        while not stopped and not search.solved and (time_limit is not None or max_expansions is not None):
+            stopped = search.dfs_restarts(restarts)
+        optimal = search.solved
+    else:
+        optimal = search.solved or (not stopped and search.branch_and_bound())
+
+    nodes = component.nodes
+    return [nodes[i] for i in search.best], optimal
@@ -0,0 +1,336 @@
+"""Graf düğüm yerleşimi (layout) hesapları
+
+Tam yerleşim yalnızca ilk açılışta hesaplanır. Graf makale ekleme/silme ile
+değiştiğinde refine_layout yalnızca değişen düğümleri ve komşularını yeniden
+yerleştirir; grafın geri kalanı yerinde kalır. Gevşetme çok seviyeli
+yerleşimin NumPy adımlarıyla yapılır, scipy gerekmez.
+
+Yerleşim motorları LAYOUT_ENGINES sözlüğünde adlarıyla tutulur:
+
+- "multilevel" (varsayılan): çok seviyeli kuvvet yönelimli yerleşim. Graf
+  eşleştirmeyle kabalaştırılır, en kaba seviye yerleştirilip her seviyede
+  NumPy ile vektörleştirilmiş Fruchterman-Reingold adımlarıyla
+  iyileştirilir. Büyük seviyelerde itme kuvveti yalnızca ızgarada komşu
+  hücrelerdeki düğümler arasında hesaplanır. Her bağlı bileşen ayrı
+  yerleştirilip bileşenler satırlar halinde paketlenir.
+- "spring": networkx spring_layout (500 düğümden büyük graflarda scipy gerekir).
+"""
+import math
+
+import networkx as nx
+import numpy as np
+
+COARSEST_SIZE = 40  # bu boyuta inen seviyede kabalaştırma durur
+EXACT_REPULSION_LIMIT = 1000  # daha küçük seviyelerde itme tüm çiftler için hesaplanır
+FINE_LEVEL_SIZE = 5000  # bundan büyük seviyelerde gevşetme adımları azaltılır
+LEAF_SIZE = 4  # yaklaşık itmede en ince ızgara hücresindeki ortalama düğüm sayısı
+
+
+def spring_layout(G, seed=42):
+    """Tüm graf için yay (spring) yerleşimi"""
+    # Layout - daha kompakt ve merkezi yerleşim
+    return nx.spring_layout(G, seed=seed, k=1, iterations=100)
+
+def multilevel_layout(G, seed=42, iterations=50):
+    """Bileşen bazlı çok seviyeli kuvvet yönelimli yerleşim; [-1, 1] karesine ölçeklenir"""
+    nodes = list(G.nodes())
+    if not nodes:
+        return {}
+    index = {node: i for i, node in enumerate(nodes)}
+    eu, ev, ew = _edge_arrays(G, index)
+
+    rng = np.random.default_rng(seed)
+    components = sorted((sorted(index[n] for n in c) for c in nx.connected_components(G)),
+                        key=len, reverse=True)
+    label = np.empty(len(nodes), dtype=np.int64)
+    local = np.empty(len(nodes), dtype=np.int64)
+    for c, members in enumerate(components):
+        label[members] = c
+        local[members] = np.arange(len(members))
+    # Kenarları bileşenlere ayır
+    order = np.argsort(label[eu], kind='stable')
+    bounds = np.searchsorted(label[eu][order], np.arange(len(components) + 1))
+
+    layouts = []
+    for c, members in enumerate(components):
+        part = order[bounds[c]:bounds[c + 1]]
+        layouts.append(_component_layout(len(members), local[eu[part]], local[ev[part]], ew[part],
+                                         rng, iterations))
+
+    coords = np.empty((len(nodes), 2))
+    for members, placed in zip(components, _pack_components(layouts)):
+        coords[members] = placed
+    coords -= (coords.min(axis=0) + coords.max(axis=0)) / 2
+    extent = np.abs(coords).max()
+    if extent > 0:
+        coords /= extent
+    return dict(zip(nodes, coords))
+
+LAYOUT_ENGINES = {
+    "multilevel": multilevel_layout,
+    "spring": spring_layout,
+}
+DEFAULT_LAYOUT_ENGINE = "multilevel"
+
+
+def initial_layout(G, seed=42, engine=DEFAULT_LAYOUT_ENGINE):
+    """Tüm graf için seçilen motorla yerleşim"""
+    if engine not in LAYOUT_ENGINES:
+        raise ValueError(f"Bilinmeyen yerleşim motoru: {engine}")
+    return LAYOUT_ENGINES[engine](G, seed=seed)
+
+
+def _edge_arrays(G, index):
+    """Döngüsüz kenarların uç indeksleri ve ağırlıkları"""
+    edges = [(index[u], index[v], d.get('weight', 1)) for u, v, d in G.edges(data=True) if u != v]
+    eu = np.array([e[0] for e in edges], dtype=np.int64)
+    ev = np.array([e[1] for e in edges], dtype=np.int64)
+    ew = np.array([e[2] for e in edges], dtype=float)
+    return eu, ev, ew
+
+def _component_layout(n, eu, ev, ew, rng, iterations):
+    """Bağlı bir bileşenin yerleşimi (ideal kenar uzunluğu 1)"""
+    if n == 1:
+        return np.zeros((1, 2))
+    levels = []
+    graph = (n, eu, ev, ew)
+    while graph[0] > COARSEST_SIZE:
+        parent, coarse_n = _coarsen(*graph, rng)
+        if coarse_n > 0.85 * graph[0]:
+            break
+        levels.append((graph, parent))
+        graph = _contract(coarse_n, parent, *graph[1:])
+
+    # En kaba seviye rastgele başlar ve daha uzun gevşetilir
+    pos = rng.uniform(-1, 1, (graph[0], 2)) * math.sqrt(graph[0])
+    pos = _relax(pos, *graph[1:], iterations=iterations * 2)
+    for fine, parent in reversed(levels):
+        # Alt düğümler üst düğümün konumunda, ortalama aralık korunarak başlar
+        scale = math.sqrt(fine[0] / len(pos))
+        pos = pos[parent] * scale + rng.normal(0, 0.1, (fine[0], 2))
+        # Büyük seviyelerde yapı kaba seviyelerden geldiği için daha az adım yeterli
+        steps = max(10, int(iterations * min(1.0, math.sqrt(FINE_LEVEL_SIZE / fine[0]))))
+        pos = _relax(pos, *fine[1:], iterations=steps)
+    return pos
+
+def _coarsen(n, eu, ev, ew, rng):
+    """Ağır kenar eşleştirmesi; (düğüm -> kaba düğüm, kaba düğüm sayısı)
+
+    Her düğüm en ağır komşusunu seçer (eşitlikte rastgele); karşılıklı seçen
+    çiftler birleşir, eşleşmeyen düğümler seçtikleri komşunun grubuna katılır.
+    """
+    src = np.concatenate([eu, ev])
+    dst = np.concatenate([ev, eu])
+    weight = np.concatenate([ew, ew])
+    order = np.lexsort((rng.random(len(src)), -weight, src))
+    src, dst = src[order], dst[order]
+    first = np.ones(len(src), dtype=bool)
+    first[1:] = src[1:] != src[:-1]
+    best = np.full(n, -1, dtype=np.int64)
+    best[src[first]] = dst[first]
+
+    group = np.full(n, -1, dtype=np.int64)
+    candidates = np.flatnonzero(best >= 0)
+    mutual = candidates[(best[best[candidates]] == candidates) & (candidates < best[candidates])]
+    group[mutual] = np.arange(len(mutual))
+    group[best[mutual]] = group[mutual]
+    count = len(mutual)
+
+    lonely = np.flatnonzero((group < 0) & (best >= 0))
+    joined = group[best[lonely]]
+    group[lonely] = joined
+    rest = np.flatnonzero(group < 0)
+    group[rest] = count + np.arange(len(rest))
+    return group, count + len(rest)
+
+def _contract(coarse_n, parent, eu, ev, ew):
+    """Kaba seviyenin kenarları; paralel kenarların ağırlıkları toplanır"""
+    cu, cv = parent[eu], parent[ev]
+    keep = cu != cv
+    a, b = np.minimum(cu[keep], cv[keep]), np.maximum(cu[keep], cv[keep])
+    keys, inverse = np.unique(a * coarse_n + b, return_inverse=True)
+    weights = np.bincount(inverse, weights=ew[keep], minlength=len(keys))
+    return coarse_n, keys // coarse_n, keys % coarse_n, weights
+
+def _relax(pos, eu, ev, ew, iterations, fixed=None):
+    """Fruchterman-Reingold adımları (k = 1), sıcaklık doğrusal olarak azalır
+
+    fixed verilirse (düğüm maskesi) işaretli düğümler yerinde kalır.
+    """
+    n = len(pos)
+    if n < 2:
+        return pos
+    extent = float(np.ptp(pos, axis=0).max())
+    temperature = max(extent, 1.0) * 0.1
+    cooling = temperature / (iterations + 1)
+    repulsion = _exact_repulsion if n <= EXACT_REPULSION_LIMIT else _tree_repulsion
+    for _ in range(iterations):
+        disp = repulsion(pos)
+        # Çekme: |F| = d² * ağırlık
+        delta = pos[eu] - pos[ev]
+        dist = np.sqrt((delta ** 2).sum(axis=1))
+        pull = delta * (dist * ew)[:, None]
+        for axis in range(2):
+            disp[:, axis] -= np.bincount(eu, weights=pull[:, axis], minlength=n)
+            disp[:, axis] += np.bincount(ev, weights=pull[:, axis], minlength=n)
+        # Adım boyu sıcaklıkla sınırlanır
+        if fixed is not None:
+            disp[fixed] = 0.0
+        length = np.sqrt((disp ** 2).sum(axis=1))
+        pos = pos + disp * (np.minimum(length, temperature) / np.maximum(length, 1e-9))[:, None]
+        temperature -= cooling
+    return pos
+
+def _exact_repulsion(pos):
+    """Tüm düğüm çiftleri arasında itme: |F| = 1 / d"""
+    x, y = pos[:, 0], pos[:, 1]
+    dx = x[:, None] - x[None, :]
+    dy = y[:, None] - y[None, :]
+    d2 = dx * dx + dy * dy
+    np.fill_diagonal(d2, np.inf)
+    inverse = 1 / np.maximum(d2, 1e-4)
+    return np.column_stack([(dx * inverse).sum(axis=1), (dy * inverse).sum(axis=1)])
+
+def _tree_repulsion(pos, leaf_size=LEAF_SIZE):
+    """Izgara piramidiyle yaklaşık itme (Barnes-Hut benzeri)
+
+    En ince ızgarada komşu hücrelerdeki düğümler arasındaki itme tam
+    hesaplanır. Daha uzak düğümlerin etkisi her seviyede, üst hücresinin
+    komşularının alt hücrelerinden kendi komşusu olmayanların (en fazla 27)
+    kütle merkezlerinden hücre bazında hesaplanır ve hücredeki düğümlere
+    eklenir. Böylece her düğüm çifti tam olarak bir seviyede sayılır.
+    """
+    n = len(pos)
+    depth = max(2, math.ceil(math.log(max(n / leaf_size, 1), 4)))
+    side = 1 << depth
+    origin = pos.min(axis=0)
+    span = max(float(np.ptp(pos, axis=0).max()), 1e-9)
+    cells = np.minimum(((pos - origin) / span * side).astype(np.int64), side - 1)
+
+    disp = _near_repulsion(pos, cells, side)
+    x, y = pos[:, 0], pos[:, 1]
+    for level in range(depth, 1, -1):
+        level_side = 1 << level
+        level_cells = cells >> (depth - level)
+        flat = level_cells[:, 0] * level_side + level_cells[:, 1]
+        mass = np.bincount(flat, minlength=level_side * level_side).astype(float)
+        occupied = np.flatnonzero(mass)
+        cx = np.bincount(flat, weights=x, minlength=len(mass))[occupied] / mass[occupied]
+        cy = np.bincount(flat, weights=y, minlength=len(mass))[occupied] / mass[occupied]
+        a, b = occupied // level_side, occupied % level_side
+        centroid_x = np.zeros(len(mass))
+        centroid_y = np.zeros(len(mass))
+        centroid_x[occupied], centroid_y[occupied] = cx, cy
+
+        far = np.zeros((len(occupied), 2))
+        for da in range(-3, 4):
+            # Üst hücrenin komşularının alt hücreleri: çift indeksler için -2..3, tekler için -3..2
+            rows_ok = (a % 2 == 0) & (da >= -2) | (a % 2 == 1) & (da <= 2)
+            for db in range(-3, 4):
+                if abs(da) <= 1 and abs(db) <= 1:
+                    continue
+                ok = rows_ok & ((b % 2 == 0) & (db >= -2) | (b % 2 == 1) & (db <= 2))
+                ta, tb = a + da, b + db
+                ok &= (ta >= 0) & (ta < level_side) & (tb >= 0) & (tb < level_side)
+                target = ta[ok] * level_side + tb[ok]
+                m = mass[target]
+                dx = cx[ok] - centroid_x[target]
+                dy = cy[ok] - centroid_y[target]
+                factor = m / np.maximum(dx * dx + dy * dy, 1e-4)
+                far[ok, 0] += dx * factor
+                far[ok, 1] += dy * factor
+        # Hücreye etkiyen uzak kuvvet hücredeki her düğüme eklenir
+        index = np.searchsorted(occupied, flat)
+        disp += far[index]
+    return disp
+
+def _near_repulsion(pos, cells, side):
+    """Aynı ve komşu ızgara hücrelerindeki düğüm çiftleri arasında tam itme"""
+    n = len(pos)
+    rows = side + 2  # taşmayı önlemek için boş kenar hücreleri
+    flat = (cells[:, 0] + 1) * rows + cells[:, 1] + 1
+    order = np.argsort(flat, kind='stable')
+    sorted_cells = flat[order]
+    disp = np.zeros((n, 2))
+    nodes = np.arange(n)
+    # Her hücre çifti bir kez ziyaret edilir; kuvvet iki düğüme ters yönde eklenir
+    for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        target = flat + dx * rows + dy
+        lo = np.searchsorted(sorted_cells, target, side='left')
+        counts = np.searchsorted(sorted_cells, target, side='right') - lo
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        src = np.repeat(nodes, counts)
+        starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        dst = order[starts + np.arange(total)]
+        if dx == 0 and dy == 0:
+            keep = src < dst
+            src, dst = src[keep], dst[keep]
+        delta = pos[src] - pos[dst]
+        force = delta / np.maximum((delta ** 2).sum(axis=1), 1e-4)[:, None]
+        for axis in range(2):
+            disp[:, axis] += np.bincount(src, weights=force[:, axis], minlength=n)
+            disp[:, axis] -= np.bincount(dst, weights=force[:, axis], minlength=n)
+    return disp
+
+def _pack_components(layouts, margin=1.0):
+    """Bileşen yerleşimlerini (büyükten küçüğe) satırlar halinde yan yana diz"""
+    sizes = [np.ptp(c, axis=0) + margin if len(c) > 1 else np.array([margin, margin]) for c in layouts]
+    row_width = max(max(w for w, _ in sizes), math.sqrt(sum(w * h for w, h in sizes)))
+    placed = []
+    x = y = row_height = 0.0
+    for coords, (w, h) in zip(layouts, sizes):
+        if x > 0 and x + w > row_width:
+            x, y, row_height = 0.0, y - row_height, 0.0
+        # Bileşenin sol üst köşesi (x, y) noktasına gelir
+        offset = np.array([x, y]) - np.array([coords[:, 0].min(), coords[:, 1].max()])
+        placed.append(coords + offset)
+        x += w
+        row_height = max(row_height, h)
+    return placed
+
+def _node_spacing(pos, node_count):
+    """Mevcut yerleşimde düğüm başına düşen ortalama mesafe"""
+    coords = np.array(list(pos.values()))
+    if len(coords) < 2:
+        return 0.1
+    width, height = coords.max(axis=0) - coords.min(axis=0)
+    return math.sqrt(max(width * height, 1e-6) / max(node_count, 1))
+
+def refine_layout(G, pos, changed, iterations=50, seed=42):
+    """Değişen düğümlerin komşuluğunu gevşeterek yerleşimi güncelle
+
+    Değişen düğümler ve komşuları yeniden konumlanır; onlara bağlı diğer
+    düğümler sabit tutulur. Graftan silinen düğümler sonuçtan çıkarılır.
+    Gevşetme _relax ile yapılır; alt graf boyutundan bağımsız olarak scipy
+    gerekmez.
+    """
+    pos = {node: p for node, p in pos.items() if node in G}
+    relax = {node for node in changed if node in G}
+    for node in list(relax):
+        relax.update(G.neighbors(node))
+    if not relax:
+        return pos
+
+    # Yeni düğümleri konumlu komşularının ortasına yerleştir
+    rng = np.random.default_rng(seed)
+    spacing = _node_spacing(pos, G.number_of_nodes())
+    center = np.mean(list(pos.values()), axis=0) if pos else np.zeros(2)
+    for node in relax:
+        if node not in pos:
+            placed = [pos[n] for n in G.neighbors(node) if n in pos]
+            anchor = np.mean(placed, axis=0) if placed else center
+            pos[node] = anchor + rng.uniform(-spacing, spacing, size=2)
+
+    anchors = {n for node in relax for n in G.neighbors(node)} - relax
+    subgraph = G.subgraph(relax | anchors)
+    nodes = list(subgraph)
+    index = {node: i for i, node in enumerate(nodes)}
+    eu, ev, ew = _edge_arrays(subgraph, index)
+    # _relax ideal kenar uzunluğu 1 ile çalışır; koordinatlar düğüm aralığı birimine çevrilir
+    coords = np.array([pos[node] for node in nodes], dtype=float) / spacing
+    fixed = np.array([node in anchors for node in nodes]) if anchors else None
+    coords = _relax(coords, eu, ev, ew, iterations, fixed=fixed) * spacing
+    pos.update((node, p) for node, p in zip(nodes, coords) if node in relax)
+    return pos